@@ -0,0 +1,8 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+if __name__ == '__main__':
+    exit(1)
@@ -0,0 +1,55 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import compileall
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCENARIOS = {
+    "import": "import cs2pattern",
+    "import + warmup": "import cs2pattern; cs2pattern.warmup()",
+    "import + first lookup": "import cs2pattern; cs2pattern.check_rare('AK-47 | Case Hardened (Field-Tested)', 661)",
+    # What importing cost while the catalog was still loaded at import time, for comparison with the lazy import
+    "import + eager load": "import cs2pattern; cs2pattern.check._get_catalog()",
+}
+TIMER = "import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)"
+
+
+def measure(code: str, runs: int = 20) -> float:
+    """
+    Run the code in fresh interpreters and return the median wall time in seconds.
+
+    The package is byte-compiled first, otherwise every run would recompile stale sources when writing bytecode is
+    disabled (PYTHONDONTWRITEBYTECODE) and the import timings would mostly measure the compiler.
+    """
+
+    compileall.compile_dir(ROOT / "cs2pattern", quiet=1)
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            cwd=ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        timings.append(float(output))
+    return statistics.median(timings)
+
+
+def main() -> int:
+    for label, code in SCENARIOS.items():
+        print(f"{label:>22}: {measure(code) * 1e3:7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,46 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import timeit
+
+import cs2pattern
+from benchmarks.suite import build_corpus
+from cs2pattern.check import Catalog, _check_rare_uncached
+
+
+def main() -> int:
+    rows = build_corpus(10_000)["mixed"]
+    catalog = Catalog.default()
+    catalog.warmup()
+
+    def bare():
+        return [_check_rare_uncached(catalog, market_hash, pattern) for market_hash, pattern in rows]
+
+    def public():
+        return [catalog.check_rare(market_hash, pattern) for market_hash, pattern in rows]
+
+    def measure(func) -> float:
+        return min(timeit.repeat(func, number=3, repeat=7)) / (3 * len(rows)) * 1e9
+
+    # The unwrapped lookup is the floor, the disabled surface should sit within noise of it
+    baseline = measure(bare)
+    scenarios = [("no instrumentation", bare, None), ("metrics disabled", public, None)]
+    scenarios += [
+        ("counters", public, lambda: cs2pattern.enable_metrics()),
+        ("counters + histogram", public, lambda: cs2pattern.enable_metrics(histogram=True)),
+        ("hook", public, lambda: (cs2pattern.disable_metrics(), cs2pattern.add_hook(lambda *args: None))),
+    ]
+    for label, func, setup in scenarios:
+        if setup is not None:
+            setup()
+        result = baseline if func is bare else measure(func)
+        print(f"{label:>22}: {result:8.1f} ns/call ({result / baseline - 1:+.1%})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
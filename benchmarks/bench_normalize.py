@@ -0,0 +1,67 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import random
+import re
+import timeit
+from typing import Optional
+
+from cs2pattern.check import _normalize_market_hash
+
+
+CLEAN = [
+    "★ Karambit | Case Hardened (Factory New)",
+    "AK-47 | Case Hardened (Field-Tested)",
+    "StatTrak™ Glock-18 | Moonrise (Minimal Wear)",
+    "Souvenir AWP | Electric Hive (Well-Worn)",
+    "Desert Eagle | Heat Treated (Battle-Scarred)",
+    "★ Sport Gloves | Nocts (Field-Tested)",
+    "Glock-18 | Trace Lock",
+    "AWP | Asiimov (Field-Tested)",
+]
+MESSY = [
+    "\t★ Karambit  |  Case Hardened (Factory New) ",
+    "AK-47 | Case Hardened   (Field-Tested)\n",
+    "  desert eagle | heat treated\u00a0(Field-Tested)",
+    "AWP |  Asiimov (Field-Tested)",
+]
+
+
+def legacy_normalize(market_hash: str) -> Optional[tuple[str, str]]:
+    """
+    The regex based normalizer this module replaced, kept for comparison.
+    """
+
+    market_hash = re.sub(r"\s+", " ", market_hash.replace("★ ", "").lower()).strip()
+    if " | " not in market_hash:
+        return None
+    weapon, skin = market_hash.split(" | ", 1)
+    return weapon, re.sub(r"\s*\(.*?\)$", "", skin).strip()
+
+
+def build_corpus(size: int = 10_000, messy_ratio: float = 0.1, seed: int = 1337) -> list[str]:
+    """
+    Build a deterministic mix of clean Steam market hash names and messy user input.
+    """
+
+    rng = random.Random(seed)
+    return [rng.choice(MESSY if rng.random() < messy_ratio else CLEAN) for _ in range(size)]
+
+
+def main() -> int:
+    corpus = build_corpus()
+    for market_hash in set(corpus):
+        assert _normalize_market_hash(market_hash) == legacy_normalize(market_hash), market_hash
+
+    for label, func in (("regex", legacy_normalize), ("single-pass", _normalize_market_hash)):
+        best = min(timeit.repeat(lambda: [func(market_hash) for market_hash in corpus], number=10, repeat=5))
+        print(f"{label:>12}: {best / (10 * len(corpus)) * 1e9:8.1f} ns/name")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
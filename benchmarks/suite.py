@@ -0,0 +1,271 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Optional
+
+import cs2pattern
+from benchmarks.bench_import import SCENARIOS as IMPORT_SCENARIOS
+from benchmarks.bench_import import measure as measure_import
+from cs2pattern.check import _DISPLAY_NAMES, Catalog
+
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_THRESHOLD = 0.25
+# Subprocess and file system timings are noisier than in-process loops
+NOISY_THRESHOLD = 0.5
+WEARS = ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")
+UNKNOWN_ITEMS = (
+    "AWP | Asiimov (Field-Tested)",
+    "AK-47 | Redline (Minimal Wear)",
+    "M4A4 | Howl (Factory New)",
+    "USP-S | Kill Confirmed (Well-Worn)",
+    "StatTrak™ P250 | Asiimov (Battle-Scarred)",
+    "Sticker | Titan (Holo) | Katowice 2014",
+    "Operation Breakout Weapon Case",
+)
+MALFORMED = (
+    ("", 1),
+    ("AK-47 Case Hardened (Field-Tested)", 661),
+    ("|", 0),
+    ("   ", 5),
+    ("AK-47 | Case Hardened (Field-Tested)", 1001),
+    ("AK-47 | Case Hardened (Field-Tested)", -1),
+)
+
+
+def _market_hash(rng: random.Random, weapon: str, skin: str) -> str:
+    name = f"{_DISPLAY_NAMES.get(weapon) or weapon.title()} | {_DISPLAY_NAMES.get(skin) or skin.title()}"
+    if "knife" in weapon or "gloves" in weapon or weapon in ("karambit", "bayonet", "m9 bayonet", "shadow daggers"):
+        name = "★ " + name
+    return f"{name} ({rng.choice(WEARS)})"
+
+
+def build_corpus(size: int = 10_000, seed: int = 1337) -> dict[str, list[tuple[str, int]]]:
+    """
+    Build a deterministic corpus of (market_hash, pattern) rows per lookup outcome from the bundled catalog.
+
+    :param size: Number of rows per outcome.
+    :type size: int
+    :param seed: Seed of the random generator.
+    :type seed: int
+
+    :return: Rows keyed by 'hit', 'miss', 'unknown', 'malformed' and a realistic 'mixed' stream.
+    :rtype: dict[str, list[tuple[str, int]]]
+    """
+
+    rng = random.Random(seed)
+    items: dict[tuple[str, str], set[int]] = {}
+    for skin, weapons in cs2pattern.get_pattern_dict().items():
+        for weapon, groups in weapons.items():
+            rare = items.setdefault((weapon, skin), set())
+            for group in groups:
+                rare.update(group["pattern"])
+    keys = sorted(items)
+
+    hits, misses = [], []
+    while len(hits) < size or len(misses) < size:
+        weapon, skin = rng.choice(keys)
+        pattern = rng.randint(0, 1000)
+        rows = hits if pattern in items[weapon, skin] else misses
+        if len(rows) < size:
+            rows.append((_market_hash(rng, weapon, skin), pattern))
+        if len(hits) < size and rng.random() < 0.5:
+            hits.append((_market_hash(rng, weapon, skin), rng.choice(sorted(items[weapon, skin]))))
+
+    unknown = [(rng.choice(UNKNOWN_ITEMS), rng.randint(0, 1000)) for _ in range(size)]
+    malformed = [rng.choice(MALFORMED) for _ in range(size)]
+
+    # Marketplace traffic: almost everything is unknown, a few catalog items and the odd broken row
+    mixed = []
+    for _ in range(size):
+        roll = rng.random()
+        source = unknown if roll < 0.9 else misses if roll < 0.97 else hits if roll < 0.99 else malformed
+        mixed.append(rng.choice(source))
+
+    return {"hit": hits, "miss": misses, "unknown": unknown, "malformed": malformed, "mixed": mixed}
+
+
+def _best(func: Callable[[], object], number: int, repeat: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def _per_row(func: Callable[[], object], rows: int, number: int, repeat: int) -> float:
+    return _best(func, number, repeat) / rows
+
+
+def run(quick: bool = False, only: Optional[list[str]] = None) -> dict[str, dict]:
+    """
+    Run every benchmark and return its result in nanoseconds per operation.
+
+    :param quick: Use fewer repetitions, for smoke runs.
+    :type quick: bool
+    :param only: Only run benchmarks whose name starts with one of these prefixes.
+    :type only: Optional[list[str]]
+
+    :return: Results keyed by benchmark name.
+    :rtype: dict[str, dict]
+    """
+
+    repeat = 3 if quick else 7
+    size = 2_000 if quick else 10_000
+    corpus = build_corpus(size)
+    cs2pattern.disable_cache()
+    cs2pattern.warmup()
+
+    cases: dict[str, Callable[[], float]] = {}
+    for label, code in IMPORT_SCENARIOS.items():
+        cases[f"import.{label.replace(' + ', '_').replace(' ', '_')}"] = (
+            lambda code=code: measure_import(code, runs=5 if quick else 20)
+        )
+
+    pattern_bytes = cs2pattern.check.PATTERN_FILE.read_bytes()
+    icon_bytes = cs2pattern.check.ICON_FILE.read_bytes()
+    cases["load.json"] = lambda: _best(lambda: Catalog(json.loads(pattern_bytes), json.loads(icon_bytes)), 5, repeat)
+    cases["load.warmup"] = lambda: _best(
+        lambda: Catalog(json.loads(pattern_bytes), json.loads(icon_bytes)).warmup(), 5, repeat,
+    )
+
+    check_rare = cs2pattern.check_rare
+    for outcome, rows in corpus.items():
+        cases[f"check_rare.{outcome}"] = (
+            lambda rows=rows: _per_row(lambda: [check_rare(*row) for row in rows], len(rows), 1, repeat)
+        )
+    mixed = corpus["mixed"]
+    cases["check_rare_tuple.mixed"] = lambda: _per_row(
+        lambda: [cs2pattern.check_rare_tuple(*row) for row in mixed], len(mixed), 1, repeat,
+    )
+    cases["could_be_rare.mixed"] = lambda: _per_row(
+        lambda: [cs2pattern.could_be_rare(*row) for row in mixed], len(mixed), 1, repeat,
+    )
+    cases["check_rare_many.mixed"] = lambda: _per_row(lambda: cs2pattern.check_rare_many(mixed), len(mixed), 1, repeat)
+
+    cases["helper.scalar"] = lambda: _best(cs2pattern.abyss, 10_000, repeat)
+    cases["helper.weapon"] = lambda: _best(lambda: cs2pattern.fade("AWP"), 10_000, repeat)
+    cases["helper.all"] = lambda: _best(cs2pattern.fade_all, 10_000, repeat)
+
+    results = {}
+    for name, case in cases.items():
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        results[name] = {"ns_per_op": round(case() * 1e9, 1)}
+        if name.startswith("check_rare_many."):
+            results[name]["rows_per_second"] = round(1e9 / results[name]["ns_per_op"])
+    return results
+
+
+def threshold_for(name: str, overrides: dict[str, float], default: float) -> float:
+    """
+    Return the allowed relative slowdown for a benchmark.
+
+    The longest matching prefix in `overrides` wins, import and load benchmarks default to a looser threshold.
+    """
+
+    matches = [prefix for prefix in overrides if name.startswith(prefix)]
+    if matches:
+        return overrides[max(matches, key=len)]
+    if name.startswith(("import.", "load.")):
+        return max(default, NOISY_THRESHOLD)
+    return default
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], default: float = DEFAULT_THRESHOLD,
+            overrides: Optional[dict[str, float]] = None) -> list[str]:
+    """
+    Compare results against a baseline and describe every benchmark slower than its threshold allows.
+
+    :param results: Current results.
+    :type results: dict[str, dict]
+    :param baseline: Baseline results.
+    :type baseline: dict[str, dict]
+    :param default: Allowed relative slowdown, 0.25 means 25% slower.
+    :type default: float
+    :param overrides: Thresholds per benchmark name prefix.
+    :type overrides: Optional[dict[str, float]]
+
+    :return: One message per regression.
+    :rtype: list[str]
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["ns_per_op"], result["ns_per_op"]
+        threshold = threshold_for(name, overrides or {}, default)
+        if before and after > before * (1 + threshold):
+            regressions.append(f"{name}: {before:,.1f} -> {after:,.1f} ns/op "
+                               f"(+{after / before - 1:.0%}, allowed +{threshold:.0%})")
+    return regressions
+
+
+def _parse_threshold(value: str) -> tuple[Optional[str], float]:
+    prefix, _, threshold = value.rpartition("=")
+    try:
+        return prefix or None, float(threshold)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid threshold '{value}', expected 0.25 or name=0.25") from None
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="cs2pattern benchmark suite.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="Baseline to compare against.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=_parse_threshold,
+        action="append",
+        default=[],
+        help=f"Allowed slowdown, globally (0.25) or per name prefix (check_rare.hit=0.1), "
+             f"defaults to {DEFAULT_THRESHOLD}.",
+    )
+    parser.add_argument("--only", action="append", help="Only run benchmarks starting with this prefix.")
+    parser.add_argument("--quick", action="store_true", help="Fewer repetitions, for smoke runs.")
+    args = parser.parse_args(argv)
+
+    default = DEFAULT_THRESHOLD
+    overrides = {}
+    for prefix, threshold in args.threshold:
+        if prefix is None:
+            default = threshold
+        else:
+            overrides[prefix] = threshold
+
+    results = run(quick=args.quick, only=args.only)
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cs2pattern": cs2pattern.__version__,
+        "results": results,
+    }
+    for name, result in results.items():
+        print(f"{name:>26}: {result['ns_per_op']:>14,.1f} ns/op", file=sys.stderr)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, run with --update-baseline to create one.", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text())["results"], default, overrides)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,40 +1,115 @@
-__author__ = "Lukas Mahler"
-__version__ = "0.7.0"
-__date__ = "08.02.2026"
-__email__ = "m@hler.eu"
-__status__ = "Development"
-
-from cs2pattern.check import PatternInfo, check_rare, get_pattern_dict
-from cs2pattern.modular import *
-
-__all__ = [
-    'PatternInfo',
-    'check_rare',
-    'get_pattern_dict',
-    'abyss',
-    'berries',
-    'blaze',
-    'fade',
-    'fire_and_ice',
-    'gem_black',
-    'gem_blue',
-    'gem_diamond',
-    'gem_gold',
-    'gem_green',
-    'gem_orange',
-    'gem_pink',
-    'gem_purple',
-    'gem_white',
-    'grinder',
-    'hive_blue',
-    'hive_orange',
-    'moonrise',
-    'nocts',
-    'paw',
-    'phoenix',
-    'pussy',
-]
-
-
-if __name__ == '__main__':
-    exit(1)
+__author__ = "Lukas Mahler"
+__version__ = "0.7.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+from cs2pattern.check import (
+    Catalog,
+    HistogramSnapshot,
+    MarketItem,
+    MetricsSnapshot,
+    PatternBatch,
+    PatternGroup,
+    PatternInfo,
+    add_hook,
+    cache_clear,
+    cache_info,
+    check_rare,
+    check_rare_many,
+    check_rare_tuple,
+    could_be_rare,
+    disable_cache,
+    disable_metrics,
+    enable_cache,
+    enable_metrics,
+    find_by_group,
+    find_by_pattern,
+    find_by_pattern_range,
+    find_by_skin,
+    find_by_weapon,
+    get_pattern_dict,
+    metrics_snapshot,
+    parse_market_hash,
+    reload_catalog,
+    remove_hook,
+    reset_metrics,
+    set_engine,
+    warmup,
+)
+from cs2pattern.modular import *
+
+
+def __getattr__(name: str):
+    # The watcher pulls in threading, import it on first use to keep importing the package cheap
+    if name == 'CatalogWatcher':
+        from cs2pattern.watcher import CatalogWatcher
+        return CatalogWatcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    'Catalog',
+    'CatalogWatcher',
+    'HistogramSnapshot',
+    'MarketItem',
+    'MetricsSnapshot',
+    'PatternBatch',
+    'PatternGroup',
+    'PatternInfo',
+    'add_hook',
+    'cache_clear',
+    'cache_info',
+    'check_rare',
+    'check_rare_many',
+    'check_rare_tuple',
+    'could_be_rare',
+    'disable_cache',
+    'disable_metrics',
+    'enable_cache',
+    'enable_metrics',
+    'find_by_group',
+    'find_by_pattern',
+    'find_by_pattern_range',
+    'find_by_skin',
+    'find_by_weapon',
+    'get_pattern_dict',
+    'metrics_snapshot',
+    'parse_market_hash',
+    'reload_catalog',
+    'remove_hook',
+    'reset_metrics',
+    'set_engine',
+    'warmup',
+    'abyss',
+    'berries',
+    'blaze',
+    'fade',
+    'fade_all',
+    'fire_and_ice',
+    'fire_and_ice_all',
+    'gem_black',
+    'gem_black_all',
+    'gem_blue',
+    'gem_blue_all',
+    'gem_diamond',
+    'gem_gold',
+    'gem_gold_all',
+    'gem_green',
+    'gem_orange',
+    'gem_pink',
+    'gem_purple',
+    'gem_purple_all',
+    'gem_white',
+    'gem_white_all',
+    'hive_blue',
+    'hive_orange',
+    'moonrise',
+    'paw',
+    'phoenix',
+    'pussy',
+]
+
+
+if __name__ == '__main__':
+    exit(1)
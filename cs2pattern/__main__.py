@@ -0,0 +1,126 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import argparse
+import os
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+from cs2pattern.scan import DEFAULT_BATCH_SIZE, DEFAULT_CHUNK_SIZE, FORMATS, check_stream, scan_file
+
+
+def _run_scan(args: argparse.Namespace) -> int:
+    with (nullcontext(sys.stdout.buffer) if args.output is None else open(args.output, "wb")) as output:
+        stats = scan_file(
+            args.input,
+            output,
+            fmt=args.format,
+            workers=args.workers,
+            chunk_size=args.chunk_size * 1024 * 1024,
+            ordered=not args.unordered,
+            hash_column=args.hash_column,
+            pattern_column=args.pattern_column,
+        )
+
+    print(
+        f"Scanned {stats.rows} rows in {stats.seconds:.2f}s ({stats.rows_per_second:,.0f} rows/s).",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def _run_check(args: argparse.Namespace) -> int:
+    check_stream(
+        sys.stdin.buffer,
+        sys.stdout.buffer,
+        fmt=args.format,
+        header=not args.no_header,
+        hash_column=args.hash_column,
+        pattern_column=args.pattern_column,
+        only_rare=args.only_rare,
+        batch_size=args.batch_size,
+    )
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m cs2pattern", description="cs2pattern command line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan = commands.add_parser(
+        "scan",
+        help="Annotate a large CSV, TSV or JSONL file with rarity data using multiple processes.",
+        description="Annotate a large CSV, TSV or JSONL file with rarity data using multiple processes. "
+                    "CSV and TSV rows get the columns rare, name, rank and total appended, "
+                    "JSONL objects the same keys.",
+    )
+    scan.add_argument("input", type=Path, help="Path of the CSV, TSV or JSONL input file.")
+    scan.add_argument("-o", "--output", type=Path, help="Path of the output file (defaults to stdout).")
+    scan.add_argument("--format", choices=FORMATS, help="Input format (detected from the extension if omitted).")
+    scan.add_argument("-w", "--workers", type=int, help="Number of worker processes (defaults to the CPU count).")
+    scan.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE // (1024 * 1024),
+        help="Size of the byte ranges handed to workers, in MiB.",
+    )
+    scan.add_argument("--unordered", action="store_true", help="Write ranges as soon as they are done.")
+    scan.add_argument("--hash-column", default="market_hash", help="Column or key holding the market hash.")
+    scan.add_argument("--pattern-column", default="pattern", help="Column or key holding the pattern.")
+    scan.set_defaults(handler=_run_scan)
+
+    check = commands.add_parser(
+        "check",
+        help="Annotate CSV, TSV or JSONL records streamed from stdin to stdout.",
+        description="Annotate CSV, TSV or JSONL records streamed from stdin to stdout in constant memory. "
+                    "Records are checked in batches, so the filter can sit in a shell pipeline.",
+    )
+    check.add_argument("--format", choices=FORMATS, default="csv", help="Input format (defaults to csv).")
+    check.add_argument("--no-header", action="store_true", help="CSV or TSV input has no header line.")
+    check.add_argument(
+        "--hash-column",
+        help="Column, 0-based position (with --no-header) or key holding the market hash.",
+    )
+    check.add_argument(
+        "--pattern-column",
+        help="Column, 0-based position (with --no-header) or key holding the pattern.",
+    )
+    check.add_argument("--only-rare", action="store_true", help="Only write records of rare items.")
+    check.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of records checked (and flushed) at once, use 1 for interactive pipelines.",
+    )
+    check.set_defaults(handler=_run_check)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "workers", None) is not None and args.workers < 1:
+        parser.error("--workers must be a positive integer.")
+    if getattr(args, "chunk_size", 1) < 1:
+        parser.error("--chunk-size must be a positive integer.")
+    if getattr(args, "batch_size", 1) < 1:
+        parser.error("--batch-size must be a positive integer.")
+
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`), which is a normal end. Python flushes stdout once more on exit,
+        # point it at devnull so that flush does not fail as well.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as exc:
+        # Bad input rather than bad usage, so no usage banner
+        print(f"{parser.prog} {args.command}: error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,262 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import asyncio
+from concurrent.futures import Executor
+from typing import AsyncIterable, AsyncIterator, Optional
+
+from cs2pattern.check import Catalog, PatternInfo
+
+
+DEFAULT_BATCH_SIZE = 512
+DEFAULT_OFFLOAD_THRESHOLD = 4096
+
+_DONE = object()
+
+
+def _check_rows(catalog: Optional[Catalog], rows: list[tuple[str, int]]) -> list[PatternInfo]:
+    # Resolved per batch so that catalog reloads are picked up by long-lived streams and batchers
+    return list((Catalog.default() if catalog is None else catalog).check_rare_many(rows))
+
+
+def _check_each(catalog: Optional[Catalog], rows: list[tuple[str, int]]) -> list:
+    # Fallback for failed batches, so that a bad row only fails its own caller
+    results = []
+    for row in rows:
+        try:
+            results.append(_check_rows(catalog, [row])[0])
+        except Exception as exc:
+            results.append(exc)
+    return results
+
+
+async def _check_batch(rows: list[tuple[str, int]], catalog: Optional[Catalog], executor: Optional[Executor],
+                       offload_threshold: int) -> list[PatternInfo]:
+    """
+    Check a batch of rows, offloading it to an executor if it is large enough to stall the event loop.
+
+    :param rows: The (market_hash, pattern) rows.
+    :type rows: list[tuple[str, int]]
+    :param catalog: Catalog to look up, defaults to the default catalog.
+    :type catalog: Optional[Catalog]
+    :param executor: Executor for large batches, defaults to the loop's default executor.
+    :type executor: Optional[Executor]
+    :param offload_threshold: Batches of at least this many rows run in the executor.
+    :type offload_threshold: int
+
+    :return: One result per row.
+    :rtype: list[PatternInfo]
+    """
+
+    if len(rows) < offload_threshold:
+        return _check_rows(catalog, rows)
+    return await asyncio.get_running_loop().run_in_executor(executor, _check_rows, catalog, rows)
+
+
+async def check_rare_stream(items: AsyncIterable[tuple[str, int]], batch_size: int = DEFAULT_BATCH_SIZE,
+                            max_buffer: Optional[int] = None, catalog: Optional[Catalog] = None,
+                            executor: Optional[Executor] = None,
+                            offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD) -> AsyncIterator[PatternInfo]:
+    """
+    Check an async stream of (market_hash, pattern) rows, yielding one `PatternInfo` per row in input order.
+
+    Rows are read ahead into a bounded buffer and checked in batches of whatever has arrived, up to `batch_size`,
+    so slow feeds are not delayed waiting for a full batch. Once the buffer is full, reading from `items` pauses
+    until the consumer catches up.
+
+    :param items: Async iterable of (market_hash, pattern) rows.
+    :type items: AsyncIterable[tuple[str, int]]
+    :param batch_size: Maximum number of rows checked at once.
+    :type batch_size: int
+    :param max_buffer: Maximum number of rows read ahead, defaults to twice the batch size.
+    :type max_buffer: Optional[int]
+    :param catalog: Catalog to look up, defaults to the default catalog.
+    :type catalog: Optional[Catalog]
+    :param executor: Executor for large batches, defaults to the loop's default executor.
+    :type executor: Optional[Executor]
+    :param offload_threshold: Batches of at least this many rows run in the executor.
+    :type offload_threshold: int
+
+    :return: Async iterator of results.
+    :rtype: AsyncIterator[PatternInfo]
+
+    :raises ValueError: If batch_size or max_buffer is not a positive integer.
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+    if max_buffer is None:
+        max_buffer = 2 * batch_size
+    if max_buffer < 1:
+        raise ValueError("max_buffer must be a positive integer.")
+
+    queue: asyncio.Queue = asyncio.Queue(max_buffer)
+    failures: list[BaseException] = []
+    closing = False
+
+    async def produce() -> None:
+        try:
+            async for row in items:
+                await queue.put(row)
+        except BaseException as exc:
+            if closing:
+                # Cancelled by the consumer below, nobody waits for the end marker anymore
+                raise
+            # Re-raised by the consumer once every row read before the failure is yielded. This includes
+            # BaseExceptions such as a CancelledError raised by the feed, the consumer would wait forever otherwise.
+            failures.append(exc)
+        await queue.put(_DONE)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        done = False
+        while not done:
+            rows = []
+            row = await queue.get()
+            while row is not _DONE:
+                rows.append(row)
+                if len(rows) >= batch_size or queue.empty():
+                    break
+                row = queue.get_nowait()
+            done = row is _DONE
+
+            if rows:
+                for info in await _check_batch(rows, catalog, executor, offload_threshold):
+                    yield info
+
+        if failures:
+            raise failures[0]
+    finally:
+        closing = True
+        producer.cancel()
+
+
+class PatternBatcher:
+    """
+    Coalesce concurrent `await batcher.check(...)` calls from many coroutines into batched lookups.
+
+    Calls arriving within the same event loop iteration, or within `max_delay` seconds, are checked together
+    with a single `check_rare_many`. Batches reaching `max_batch_size` are flushed right away, and batches of at
+    least `offload_threshold` rows run in an executor so the event loop is not blocked.
+
+    Use it as an async context manager, or call `close` to flush pending calls when done.
+    """
+
+    def __init__(self, max_batch_size: int = DEFAULT_BATCH_SIZE, max_delay: float = 0.0,
+                 catalog: Optional[Catalog] = None, executor: Optional[Executor] = None,
+                 offload_threshold: int = DEFAULT_OFFLOAD_THRESHOLD):
+        """
+        :param max_batch_size: Maximum number of calls checked at once.
+        :type max_batch_size: int
+        :param max_delay: Seconds to wait for further calls before flushing a batch.
+        :type max_delay: float
+        :param catalog: Catalog to look up, defaults to the default catalog.
+        :type catalog: Optional[Catalog]
+        :param executor: Executor for large batches, defaults to the loop's default executor.
+        :type executor: Optional[Executor]
+        :param offload_threshold: Batches of at least this many rows run in the executor.
+        :type offload_threshold: int
+
+        :raises ValueError: If max_batch_size is not a positive integer or max_delay is negative.
+        """
+
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer.")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative.")
+
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.catalog = catalog
+        self.executor = executor
+        self.offload_threshold = offload_threshold
+        self._rows: list[tuple[str, int]] = []
+        self._futures: list[asyncio.Future] = []
+        self._timer: Optional[asyncio.Handle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def check(self, market_hash: str, pattern: int) -> PatternInfo:
+        """
+        Determine if the given item is rare, batched together with concurrent calls.
+
+        :param market_hash: The market hash of the item.
+        :type market_hash: str
+        :param pattern: The pattern to check for rarity.
+        :type pattern: int
+
+        :return: Structured `PatternInfo`, equal to what `check_rare` returns.
+        :rtype: PatternInfo
+        """
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._rows.append((market_hash, pattern))
+        self._futures.append(future)
+
+        if len(self._rows) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            if self.max_delay:
+                self._timer = loop.call_later(self.max_delay, self._flush)
+            else:
+                self._timer = loop.call_soon(self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._rows:
+            return
+
+        rows, futures = self._rows, self._futures
+        self._rows, self._futures = [], []
+        task = asyncio.ensure_future(self._resolve(rows, futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, rows: list[tuple[str, int]], futures: list[asyncio.Future]) -> None:
+        try:
+            results = await _check_batch(rows, self.catalog, self.executor, self.offload_threshold)
+        except Exception:
+            # Rows of unrelated callers share the batch, retry them one by one to pin the failure on its row
+            try:
+                if len(rows) < self.offload_threshold:
+                    results = _check_each(self.catalog, rows)
+                else:
+                    loop = asyncio.get_running_loop()
+                    results = await loop.run_in_executor(self.executor, _check_each, self.catalog, rows)
+            except Exception as exc:
+                results = [exc] * len(rows)
+
+        for future, result in zip(futures, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """
+        Flush pending calls and wait until every batch is resolved.
+        """
+
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def __aenter__(self) -> 'PatternBatcher':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+if __name__ == '__main__':
+    exit(1)
@@ -0,0 +1,156 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as exc:
+    raise ImportError("cs2pattern.arrow requires PyArrow, install it with 'pip install pyarrow'.") from exc
+
+import numpy as np
+
+from cs2pattern.scan import ScanStats
+from cs2pattern.vectorized import _annotate, _as_seeds, _encode_dictionary, _get_tables, _Tables
+
+
+ANNOTATION_COLUMNS = ('group', 'rank', 'total')
+DEFAULT_BATCH_SIZE = 65_536
+ANNOTATION_FIELDS = (
+    pa.field('group', pa.dictionary(pa.int32(), pa.string())),
+    pa.field('rank', pa.int16()),
+    pa.field('total', pa.int16()),
+)
+
+
+def _annotate_batch(tables: _Tables, batch: pa.RecordBatch, hash_column: str, pattern_column: str,
+                    cache: dict) -> pa.RecordBatch:
+    for column in ANNOTATION_COLUMNS:
+        if column in batch.schema.names:
+            raise ValueError(f"Record batch already has a column '{column}'.")
+
+    market_hashes = batch.column(hash_column)
+    if not pa.types.is_dictionary(market_hashes.type):
+        market_hashes = market_hashes.dictionary_encode()
+    indices = pc.fill_null(market_hashes.indices, -1).to_numpy(zero_copy_only=False)
+    codes = _encode_dictionary(tables, market_hashes.dictionary.to_pylist(), indices, cache)
+
+    seeds = pc.fill_null(batch.column(pattern_column), -1).to_numpy(zero_copy_only=False)
+    groups, ranks, totals = _annotate(tables, codes, _as_seeds(seeds))
+
+    columns = [
+        pa.DictionaryArray.from_arrays(
+            pa.array(groups.astype(np.int32), mask=groups < 0), pa.array(tables.groups, pa.string()),
+        ),
+        pa.array(ranks.astype(np.int16), mask=ranks == 0),
+        pa.array(totals.astype(np.int16), mask=totals == 0),
+    ]
+    return pa.RecordBatch.from_arrays(
+        [*batch.columns, *columns], schema=pa.schema([*batch.schema, *ANNOTATION_FIELDS]),
+    )
+
+
+def annotate_batch(batch: pa.RecordBatch, hash_column: str = 'market_hash',
+                   pattern_column: str = 'pattern') -> pa.RecordBatch:
+    """
+    Append the rare pattern `group`, `rank` and `total` columns to a record batch.
+
+    The market hash column is dictionary encoded first (unless it already is), so every distinct item name is
+    normalized only once, then all seeds are looked up with a single vectorized gather. `group` is a dictionary
+    encoded string column, `rank` and `total` are int16. All three are null where the item is not rare, `rank` and
+    `total` also for unordered groups.
+
+    :param batch: The record batch.
+    :type batch: pa.RecordBatch
+    :param hash_column: Column holding the market hash.
+    :type hash_column: str
+    :param pattern_column: Column holding the pattern, missing and non-integral seeds are not rare.
+    :type pattern_column: str
+
+    :return: The batch with the annotation columns appended.
+    :rtype: pa.RecordBatch
+
+    :raises KeyError: If a column is missing.
+    :raises ValueError: If the batch already has one of the annotation columns.
+    """
+
+    return _annotate_batch(_get_tables(), batch, hash_column, pattern_column, {})
+
+
+def iter_annotated(batches: Iterable[pa.RecordBatch], hash_column: str = 'market_hash',
+                   pattern_column: str = 'pattern') -> Iterator[pa.RecordBatch]:
+    """
+    Annotate a stream of record batches, see `annotate_batch`.
+
+    Only one batch is held at a time. Item names resolved in earlier batches are not normalized again, and the
+    whole stream is annotated against the catalog that was current when it started.
+
+    :param batches: Iterable of record batches sharing one schema.
+    :type batches: Iterable[pa.RecordBatch]
+    :param hash_column: Column holding the market hash.
+    :type hash_column: str
+    :param pattern_column: Column holding the pattern.
+    :type pattern_column: str
+
+    :return: Iterator of annotated record batches.
+    :rtype: Iterator[pa.RecordBatch]
+    """
+
+    tables = _get_tables()
+    cache: dict = {}
+    for batch in batches:
+        yield _annotate_batch(tables, batch, hash_column, pattern_column, cache)
+
+
+def annotate_parquet(source: Union[str, Path], destination: Union[str, Path], hash_column: str = 'market_hash',
+                     pattern_column: str = 'pattern', batch_size: int = DEFAULT_BATCH_SIZE,
+                     compression: Optional[str] = 'snappy') -> ScanStats:
+    """
+    Annotate a Parquet file batch by batch and write the result to another Parquet file, see `annotate_batch`.
+
+    Memory use is bounded by the batch size regardless of the file size, every batch is written as it is done.
+
+    :param source: Path of the input Parquet file.
+    :type source: Union[str, Path]
+    :param destination: Path of the output Parquet file.
+    :type destination: Union[str, Path]
+    :param hash_column: Column holding the market hash.
+    :type hash_column: str
+    :param pattern_column: Column holding the pattern.
+    :type pattern_column: str
+    :param batch_size: Number of rows read and annotated at once.
+    :type batch_size: int
+    :param compression: Parquet compression codec of the output.
+    :type compression: Optional[str]
+
+    :return: Number of rows and elapsed seconds.
+    :rtype: ScanStats
+
+    :raises ValueError: If the batch size is not positive or the file already has an annotation column.
+    """
+
+    started = time.perf_counter()
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    parquet = pq.ParquetFile(source)
+    schema = pa.schema([*parquet.schema_arrow, *ANNOTATION_FIELDS])
+    rows = 0
+    with pq.ParquetWriter(destination, schema, compression=compression) as writer:
+        batches = parquet.iter_batches(batch_size=batch_size)
+        for batch in iter_annotated(batches, hash_column=hash_column, pattern_column=pattern_column):
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return ScanStats(rows, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    exit(1)
@@ -1,69 +1,1074 @@
 __author__ = "Lukas Mahler"
 __version__ = "0.0.0"
-__date__ = "02.11.2025"
+__date__ = "17.10.2026"
 __email__ = "m@hler.eu"
 __status__ = "Development"
 
 
-import json
-import re
+import sys
+from _thread import allocate_lock
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from time import perf_counter_ns
+from types import MappingProxyType
+from typing import Callable, Iterable, Mapping, NamedTuple, Optional, Union
 
 
 DIR = Path(__file__).resolve().parent
-PATTERN_MAP = json.loads((DIR / "pattern.json").read_text(encoding="utf-8"))
-ICON_MAP   = json.loads((DIR / "icons.json").read_text(encoding="utf-8"))
+PATTERN_FILE = DIR / "pattern.json"
+ICON_FILE = DIR / "icons.json"
+SEED_SLOTS = 1001
+WEARS = ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")
+PARSE_CACHE_SIZE = 8192
 
+_WEAR_NAMES = {wear.lower(): wear for wear in WEARS}
+_QUALITY_PREFIXES = ("stattrak™ ", "souvenir ")
+# Steam spelling of catalog names that title casing gets wrong; the name table derives every other name from the
+# catalog itself. tools/add_pattern.py adds entries here when a new skin or weapon is given in a different casing.
+_DISPLAY_NAMES = {
+    'ak-47': "AK-47",
+    'awp': "AWP",
+    'five-seven': "Five-SeveN",
+    'galil ar': "Galil AR",
+    'm4a1-s': "M4A1-S",
+    'mac-10': "MAC-10",
+    'mp7': "MP7",
+    'paw': "PAW",
+    'pink ddpat': "Pink DDPAT",
+    'ssg 08': "SSG 08",
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PatternInfo:
     """
     Normalized lookup result for a pattern query.
 
-    Exposes the normalized identifiers (`weapon`, `skin`, `pattern`),
-    rarity status, ordering metadata (when applicable), and a representative icon for the matched group.
+    Exposes the normalized identifiers (`weapon`, `skin`, `pattern`),
+    rarity status, ordering metadata (when applicable), and a representative icon for the matched group.
+    Results for rare hits are built once per catalog entry and shared between calls, treat them as immutable.
+    """
+
+    weapon: Optional[str] = None
+    skin: Optional[str] = None
+    pattern: Optional[int] = None
+    rare: bool = False
+    name: Optional[str] = None
+    ordered: bool = False
+    order: Optional[tuple[int, int]] = None
+    icon: Optional[str] = None
+
+
+class MarketItem(NamedTuple):
+    """
+    Every attribute of a market hash, as returned by `parse_market_hash`.
+
+    `weapon` and `skin` are normalized like `PatternInfo.weapon` and `PatternInfo.skin`, without the
+    StatTrak™ or Souvenir prefix. Pass it to `check_rare` instead of the market hash to skip parsing it again.
+    """
+
+    weapon: str
+    skin: str
+    wear: Optional[str] = None
+    stattrak: bool = False
+    souvenir: bool = False
+    star: bool = False
+
+
+class PatternGroup(NamedTuple):
+    """
+    A single rare pattern group definition of one (skin, weapon) item.
+
+    Returned by the catalog queries, which build these once per catalog and share them between calls.
+    """
+
+    skin: str
+    weapon: str
+    name: Optional[str]
+    patterns: tuple[int, ...]
+    ordered: bool = False
+    icon: Optional[str] = None
+
+
+def _freeze(value):
+    """
+    Convert parsed JSON data into an immutable structure.
+
+    Dicts become read-only `MappingProxyType` views and lists become tuples, recursively. Values that are
+    already frozen are returned as is, so freezing shared data never copies it again.
+
+    :param value: Parsed JSON value.
+
+    :return: The immutable equivalent.
+    """
+
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class _GroupRecord(NamedTuple):
+    """
+    Precomputed match data for a single (skin, weapon, pattern) combination.
+
+    Besides the raw group data it carries the shared `PatternInfo` and plain tuple results for the hit,
+    so rare lookups never rebuild them.
+    """
+
+    name: Optional[str]
+    ordered: bool
+    rank: Optional[int]
+    total: Optional[int]
+    icon: Optional[str]
+    info: PatternInfo
+    values: tuple
+
+
+_EMPTY_INFO = PatternInfo()
+_EMPTY_VALUES = (None, None, None, False, None, False, None, None)
+
+
+def _build_pattern_index(pattern_map: dict, icon_map: dict) -> dict[tuple[str, str, int], _GroupRecord]:
+    """
+    Flatten the pattern map into a direct (skin, weapon, pattern) lookup table.
+
+    Groups are visited in catalog order and the first group containing a pattern wins,
+    mirroring the linear scan this index replaces.
+
+    :param pattern_map: Mapping of skin -> weapon -> list of group definitions.
+    :type pattern_map: dict
+    :param icon_map: Mapping of group name -> icon.
+    :type icon_map: dict
+
+    :return: Mapping of (skin, weapon, pattern) to the matching group record.
+    :rtype: dict[tuple[str, str, int], _GroupRecord]
+    """
+
+    index: dict[tuple[str, str, int], _GroupRecord] = {}
+
+    for skin, weapons in pattern_map.items():
+        for weapon, groups in weapons.items():
+            for group in groups:
+                name = group.get('name')
+                patterns = list(group.get('pattern', []))
+                ordered = bool(group.get('ordered', False))
+                total = len(patterns) if ordered else None
+                icon = icon_map.get(name)
+                for position, pattern in enumerate(patterns):
+                    key = (skin, weapon, pattern)
+                    if key in index:
+                        continue
+                    order = (position + 1, total) if ordered else None
+                    index[key] = _make_record((weapon, skin, pattern, True, name, ordered, order, icon))
+
+    return index
+
+
+def _make_record(values: tuple) -> _GroupRecord:
+    """
+    Create the group record for a rare hit from its `PatternInfo` field values.
+
+    :param values: The (weapon, skin, pattern, rare, name, ordered, order, icon) values of the hit.
+    :type values: tuple
+
+    :return: The group record sharing `values` and a matching `PatternInfo`.
+    :rtype: _GroupRecord
+    """
+
+    _, _, _, _, name, ordered, order, icon = values
+    rank, total = order if order else (None, None)
+    return _GroupRecord(name, ordered, rank, total, icon, PatternInfo(*values), values)
+
+
+_DenseTable = dict[tuple[str, str], tuple[array, tuple[_GroupRecord, ...]]]
+
+
+def _build_dense_table(index: dict[tuple[str, str, int], _GroupRecord]) -> _DenseTable:
+    """
+    Compile the pattern index into one fixed-size seed slot array per (skin, weapon) item.
+
+    Each slot holds 0 for "not rare" or a 1-based code into the item's record tuple,
+    so a lookup is a single dict hit followed by a single array index.
+
+    :param index: The (skin, weapon, pattern) index built by `_build_pattern_index`.
+    :type index: dict[tuple[str, str, int], _GroupRecord]
+
+    :return: Mapping of (skin, weapon) to its slot array and the records the slots refer to.
+    :rtype: _DenseTable
+    """
+
+    slots_by_item: dict[tuple[str, str], array] = {}
+    codes_by_item: dict[tuple[str, str], dict[_GroupRecord, int]] = {}
+
+    for (skin, weapon, pattern), record in index.items():
+        if not isinstance(pattern, int) or not (0 <= pattern < SEED_SLOTS):
+            continue
+        item = (skin, weapon)
+        slots = slots_by_item.get(item)
+        if slots is None:
+            slots = slots_by_item[item] = array('H', bytes(2 * SEED_SLOTS))
+            codes_by_item[item] = {}
+        codes = codes_by_item[item]
+        slots[pattern] = codes.setdefault(record, len(codes) + 1)
+
+    return {item: (slots, tuple(codes_by_item[item])) for item, slots in slots_by_item.items()}
+
+
+_GroupIndex = dict[str, dict[str, dict[str, tuple[tuple[int, ...], bool]]]]
+
+
+def _build_group_index(pattern_map: dict) -> _GroupIndex:
+    """
+    Index the pattern map by group name, then weapon, then skin.
+
+    Pattern lists are stored as tuples so they can be handed out without copying.
+    If a skin/weapon entry lists the same group twice, the first definition wins.
+
+    :param pattern_map: Mapping of skin -> weapon -> list of group definitions.
+    :type pattern_map: dict
+
+    :return: Mapping of group name -> weapon -> skin -> (patterns, ordered).
+    :rtype: _GroupIndex
+    """
+
+    groups: _GroupIndex = {}
+
+    for skin, weapons in pattern_map.items():
+        for weapon, weapon_groups in weapons.items():
+            for group in weapon_groups:
+                entry = (tuple(group.get('pattern', [])), bool(group.get('ordered', False)))
+                groups.setdefault(group.get('name'), {}).setdefault(weapon, {}).setdefault(skin, entry)
+
+    return groups
+
+
+class _QueryIndex(NamedTuple):
+    """
+    Every group definition of the catalog, indexed by group name, weapon and skin.
+    """
+
+    by_group: dict[str, tuple[PatternGroup, ...]]
+    by_weapon: dict[str, tuple[PatternGroup, ...]]
+    by_skin: dict[str, tuple[PatternGroup, ...]]
+
+
+def _build_query_index(pattern_map: dict, icon_map: dict) -> _QueryIndex:
+    """
+    Flatten the pattern map into `PatternGroup` entries and index them by group name, weapon and skin.
+
+    Every definition is kept, entries keep catalog order within each key.
+
+    :param pattern_map: Mapping of skin -> weapon -> list of group definitions.
+    :type pattern_map: dict
+    :param icon_map: Mapping of group name -> icon.
+    :type icon_map: dict
+
+    :return: The query index.
+    :rtype: _QueryIndex
+    """
+
+    by_group: dict[str, list[PatternGroup]] = {}
+    by_weapon: dict[str, list[PatternGroup]] = {}
+    by_skin: dict[str, list[PatternGroup]] = {}
+
+    for skin, weapons in pattern_map.items():
+        for weapon, weapon_groups in weapons.items():
+            for group in weapon_groups:
+                name = group.get('name')
+                entry = PatternGroup(
+                    skin=skin,
+                    weapon=weapon,
+                    name=name,
+                    patterns=tuple(group.get('pattern', [])),
+                    ordered=bool(group.get('ordered', False)),
+                    icon=icon_map.get(name),
+                )
+                by_group.setdefault(name, []).append(entry)
+                by_weapon.setdefault(weapon, []).append(entry)
+                by_skin.setdefault(skin, []).append(entry)
+
+    return _QueryIndex(*({key: tuple(entries) for key, entries in table.items()}
+                         for table in (by_group, by_weapon, by_skin)))
+
+
+class _SeedIndex(NamedTuple):
+    """
+    Rare hits of every catalog entry, grouped by seed.
+
+    `hits` holds all results sorted by seed, `offsets[i]:offsets[i + 1]` is the slice of `hits` belonging to
+    `seeds[i]`, so both a single seed and a seed range resolve to one slice of a prebuilt tuple.
+    """
+
+    seeds: tuple[int, ...]
+    offsets: tuple[int, ...]
+    hits: tuple[PatternInfo, ...]
+    positions: dict[int, int]
+
+
+def _build_seed_index(index: dict[tuple[str, str, int], _GroupRecord]) -> _SeedIndex:
+    """
+    Invert the pattern index into a seed keyed index.
+
+    Hits for the same seed keep catalog order.
+
+    :param index: The (skin, weapon, pattern) index built by `_build_pattern_index`.
+    :type index: dict[tuple[str, str, int], _GroupRecord]
+
+    :return: The seed index.
+    :rtype: _SeedIndex
+    """
+
+    by_seed: dict[int, list[PatternInfo]] = {}
+    for (_, _, pattern), record in index.items():
+        if isinstance(pattern, int) and not isinstance(pattern, bool):
+            by_seed.setdefault(pattern, []).append(record.info)
+
+    seeds = tuple(sorted(by_seed))
+    offsets = [0]
+    hits: list[PatternInfo] = []
+    for seed in seeds:
+        hits.extend(by_seed[seed])
+        offsets.append(len(hits))
+
+    return _SeedIndex(seeds, tuple(offsets), tuple(hits), {seed: position for position, seed in enumerate(seeds)})
+
+
+class _RejectFilter(NamedTuple):
+    """
+    Necessary conditions for a rare hit that can be tested on a raw market hash, before normalizing it.
+
+    `seeds[pattern]` is set if the seed is rare for any item. `items` holds every catalog (weapon, skin) pair with
+    all whitespace removed, so irregular spacing in the raw market hash needs no collapsing to be compared.
+    """
+
+    seeds: bytes
+    items: frozenset[tuple[str, str]]
+
+
+def _build_reject_filter(index: dict[tuple[str, str, int], _GroupRecord]) -> _RejectFilter:
+    """
+    Build the fast-reject filter of a catalog.
+
+    :param index: The (skin, weapon, pattern) index built by `_build_pattern_index`.
+    :type index: dict[tuple[str, str, int], _GroupRecord]
+
+    :return: The fast-reject filter.
+    :rtype: _RejectFilter
+    """
+
+    seeds = bytearray(SEED_SLOTS)
+    items = set()
+    for skin, weapon, pattern in index:
+        if isinstance(pattern, int) and 0 <= pattern < SEED_SLOTS:
+            seeds[pattern] = 1
+        items.add(("".join(weapon.split()), "".join(skin.split())))
+    return _RejectFilter(bytes(seeds), frozenset(items))
+
+
+def _build_name_table(index: dict[tuple[str, str, int], _GroupRecord]) -> dict[str, tuple[str, str]]:
+    """
+    Expand every catalog item into all of its exact Steam market hash names.
+
+    Covers every wear (and no wear) with and without the StatTrak™, Souvenir and ★ prefixes. Each name maps to the
+    (weapon, skin) pair the normalizer produces for it, so a hit skips normalization entirely.
+
+    :param index: The (skin, weapon, pattern) index built by `_build_pattern_index`.
+    :type index: dict[tuple[str, str, int], _GroupRecord]
+
+    :return: Mapping of market hash name to normalized (weapon, skin).
+    :rtype: dict[str, tuple[str, str]]
+    """
+
+    suffixes = ("", *(f" ({wear})" for wear in WEARS))
+    table = {}
+    for skin, weapon in {(skin, weapon) for skin, weapon, _ in index}:
+        item = (weapon, skin)
+        name = f"{_DISPLAY_NAMES.get(weapon) or weapon.title()} | {_DISPLAY_NAMES.get(skin) or skin.title()}"
+        for star in ("", "★ "):
+            for quality in ("", "StatTrak™ ", "Souvenir "):
+                for suffix in suffixes:
+                    table[star + quality + name + suffix] = item
+    return table
+
+
+class Catalog:
+    """
+    A pattern catalog: the parsed data together with every lookup table derived from it.
+
+    The module level functions work on a default instance loaded from the bundled sources, further instances
+    (e.g. a staging catalog) can be loaded with `Catalog.load` and queried through the same methods. The modular
+    helpers are available as methods as well, e.g. `catalog.gem_blue('karambit')`.
+
+    The passed data is frozen into read-only mappings and tuples once, already frozen parts are shared instead of
+    copied. The pattern index is built right away, every other table on first use.
+
+    Catalogs are safe to query from any number of threads without locking, see `_freeze` and `derived`.
+    """
+
+    __slots__ = (
+        'pattern_map', 'icon_map', 'index', '_dense', '_groups', '_seeds', '_queries', '_reject', '_names',
+        '_derived',
+    )
+
+    def __init__(self, pattern_map: Mapping, icon_map: Mapping):
+        self.pattern_map: Mapping = _freeze(pattern_map)
+        self.icon_map: Mapping = _freeze(icon_map)
+        self.index = _build_pattern_index(self.pattern_map, self.icon_map)
+        self._dense: Optional[_DenseTable] = None
+        self._groups: Optional[_GroupIndex] = None
+        self._seeds: Optional[_SeedIndex] = None
+        self._queries: Optional[_QueryIndex] = None
+        self._reject: Optional[_RejectFilter] = None
+        self._names: Optional[dict[str, tuple[str, str]]] = None
+        self._derived: dict = {}
+
+    @property
+    def dense(self) -> _DenseTable:
+        if self._dense is None:
+            self._dense = _build_dense_table(self.index)
+        return self._dense
+
+    @property
+    def groups(self) -> _GroupIndex:
+        if self._groups is None:
+            self._groups = _build_group_index(self.pattern_map)
+        return self._groups
+
+    @property
+    def seeds(self) -> _SeedIndex:
+        if self._seeds is None:
+            self._seeds = _build_seed_index(self.index)
+        return self._seeds
+
+    @property
+    def queries(self) -> _QueryIndex:
+        if self._queries is None:
+            self._queries = _build_query_index(self.pattern_map, self.icon_map)
+        return self._queries
+
+    @property
+    def reject(self) -> _RejectFilter:
+        if self._reject is None:
+            self._reject = _build_reject_filter(self.index)
+        return self._reject
+
+    @property
+    def names(self) -> dict[str, tuple[str, str]]:
+        if self._names is None:
+            self._names = _build_name_table(self.index)
+        return self._names
+
+    def derived(self, key, factory: Callable[['Catalog'], object]):
+        """
+        Return a structure derived from this catalog, building it with `factory(catalog)` on first use.
+
+        Lets other modules attach their own lookup tables so they are rebuilt whenever the catalog is.
+        Concurrent first calls may each build the structure, but all of them return the one stored first.
+
+        :param key: Hashable key identifying the structure.
+        :param factory: Callable building the structure from the catalog.
+        :type factory: Callable[[Catalog], object]
+
+        :return: The cached structure.
+        """
+
+        try:
+            return self._derived[key]
+        except KeyError:
+            return self._derived.setdefault(key, factory(self))
+
+    def warmup(self) -> None:
+        """
+        Build every lookup table of this catalog eagerly.
+        """
+
+        self.dense
+        self.groups
+        self.seeds
+        self.queries
+        self.reject
+        self.names
+
+    @classmethod
+    def load(cls, pattern_file: Optional[Path] = None, icon_file: Optional[Path] = None) -> 'Catalog':
+        """
+        Load a catalog from its sources, independent of the default catalog.
+
+        :param pattern_file: Path of the `pattern.json` to load, defaults to the bundled one.
+        :type pattern_file: Optional[Path]
+        :param icon_file: Path of the `icons.json` to load, defaults to the bundled one.
+        :type icon_file: Optional[Path]
+
+        :return: The loaded catalog.
+        :rtype: Catalog
+        """
+
+        return _read_catalog(
+            PATTERN_FILE if pattern_file is None else Path(pattern_file),
+            ICON_FILE if icon_file is None else Path(icon_file),
+        )
+
+    @classmethod
+    def default(cls) -> 'Catalog':
+        """
+        Return the default catalog used by the module level functions, loading it on first use.
+
+        :return: The default catalog.
+        :rtype: Catalog
+        """
+
+        return _CATALOG or _load_catalog()
+
+    def check_rare(self, market_hash: Union[str, MarketItem], pattern: int) -> PatternInfo:
+        """
+        Determine if the given item is rare in this catalog, see `check_rare`.
+
+        :param market_hash: The market hash of the item, or its `MarketItem` from `parse_market_hash`.
+        :type market_hash: Union[str, MarketItem]
+        :param pattern: The pattern to check for rarity.
+        :type pattern: int
+
+        :return: Structured `PatternInfo` with normalized data, rarity details, ordering metadata, and icon.
+        :rtype: PatternInfo
+        """
+
+        cache = _CACHE
+        if _OBSERVER is not None:
+            return _OBSERVER.check_rare(self, cache, market_hash, pattern)
+        if cache is not None:
+            return cache.check_rare(self, market_hash, pattern)
+        return _check_rare_uncached(self, market_hash, pattern)
+
+    def could_be_rare(self, market_hash: Union[str, MarketItem], pattern: int) -> bool:
+        """
+        Cheaply test whether the given item might be rare in this catalog, see `could_be_rare`.
+
+        :param market_hash: The market hash of the item, or its `MarketItem` from `parse_market_hash`.
+        :type market_hash: Union[str, MarketItem]
+        :param pattern: The pattern to check for rarity.
+        :type pattern: int
+
+        :return: False if the item is definitely not rare, True if it may be.
+        :rtype: bool
+        """
+
+        reject = self._reject or self.reject
+        if not (0 <= pattern <= 1000):
+            return False
+        try:
+            if not reject.seeds[pattern]:
+                return False
+        except TypeError:
+            # Non-int seeds (e.g. 148.0) cannot index the bitmap, only the item is filtered for them
+            pass
+
+        if type(market_hash) is MarketItem:
+            return ("".join(market_hash.weapon.split()), "".join(market_hash.skin.split())) in reject.items
+        if market_hash in (self._names or self.names):
+            return True
+
+        # Catalog weapons never contain "|" or "★ ", so the item can only be in the catalog if the first "|" is the
+        # separator the normalizer splits on. The skin may still contain "|" inside a wear suffix, which is dropped
+        # below like the normalizer does. Compacting whitespace can only add matches, never lose one.
+        weapon, separator, skin = market_hash.replace("★ ", "").partition("|")
+        if not separator:
+            return False
+        skin = skin.strip()
+        if skin.endswith(")"):
+            wear_start = skin.find("(")
+            if wear_start != -1:
+                skin = skin[:wear_start]
+
+        weapon = "".join(weapon.lower().split())
+        if weapon.startswith("stattrak™"):
+            weapon = weapon[9:]
+        elif weapon.startswith("souvenir"):
+            weapon = weapon[8:]
+        return (weapon, "".join(skin.lower().split())) in reject.items
+
+    def check_rare_tuple(self, market_hash: Union[str, MarketItem], pattern: int) -> tuple:
+        """
+        Lightweight variant of `Catalog.check_rare` returning a plain tuple, see `check_rare_tuple`.
+
+        :param market_hash: The market hash of the item, or its `MarketItem` from `parse_market_hash`.
+        :type market_hash: Union[str, MarketItem]
+        :param pattern: The pattern to check for rarity.
+        :type pattern: int
+
+        :return: Tuple of the `PatternInfo` field values.
+        :rtype: tuple
+        """
+
+        normalized = _normalize_input(market_hash, pattern, self._names or self.names)
+        if not normalized:
+            return _EMPTY_VALUES
+
+        weapon, skin, normalized_pattern = normalized
+        record = _lookup(self, skin, weapon, normalized_pattern)
+        if record is None:
+            return weapon, skin, normalized_pattern, False, None, False, None, None
+        return record.values
+
+    def check_rare_many(self, items: Iterable[tuple[str, int]]) -> 'PatternBatch':
+        """
+        Determine rarity for many (market hash, pattern) rows at once, see `check_rare_many`.
+
+        :param items: Iterable of (market_hash, pattern) rows.
+        :type items: Iterable[tuple[str, int]]
+
+        :return: Columnar batch result, index it to obtain `PatternInfo` objects.
+        :rtype: PatternBatch
+        """
+
+        normalized_names: dict[str, Optional[tuple[str, str]]] = {}
+        names = self.names
+        lookup = _lookup
+        weapons: list[Optional[str]] = []
+        skins: list[Optional[str]] = []
+        patterns: list[Optional[int]] = []
+        records: list[Optional[_GroupRecord]] = []
+
+        for market_hash, pattern in items:
+            try:
+                item = normalized_names[market_hash]
+            except KeyError:
+                item = normalized_names[market_hash] = _normalize_item(market_hash, names)
+
+            if item is None or not (0 <= pattern <= 1000):
+                weapons.append(None)
+                skins.append(None)
+                patterns.append(None)
+                records.append(None)
+                continue
+
+            weapon, skin = item
+            weapons.append(weapon)
+            skins.append(skin)
+            patterns.append(pattern)
+            records.append(lookup(self, skin, weapon, pattern))
+
+        return PatternBatch(weapons, skins, patterns, records)
+
+    def find_by_pattern(self, pattern: int) -> tuple[PatternInfo, ...]:
+        """
+        Find every entry of this catalog for which the given seed is rare, see `find_by_pattern`.
+
+        :param pattern: The pattern (seed) to look up.
+        :type pattern: int
+
+        :return: The rare results for this seed in catalog order.
+        :rtype: tuple[PatternInfo, ...]
+        """
+
+        seeds = self.seeds
+        position = seeds.positions.get(pattern)
+        if position is None:
+            return ()
+        return seeds.hits[seeds.offsets[position]:seeds.offsets[position + 1]]
+
+    def find_by_pattern_range(self, lo: int, hi: int) -> tuple[PatternInfo, ...]:
+        """
+        Find every entry of this catalog that is rare for a seed between `lo` and `hi`, both inclusive.
+
+        :param lo: Lowest seed of the range.
+        :type lo: int
+        :param hi: Highest seed of the range.
+        :type hi: int
+
+        :return: The rare results ordered by seed, then catalog order.
+        :rtype: tuple[PatternInfo, ...]
+        """
+
+        seeds = self.seeds
+        start = bisect_left(seeds.seeds, lo)
+        end = bisect_right(seeds.seeds, hi)
+        if start >= end:
+            return ()
+        return seeds.hits[seeds.offsets[start]:seeds.offsets[end]]
+
+    def find_by_group(self, name: str) -> tuple[PatternGroup, ...]:
+        """
+        Find every item definition of a pattern group in this catalog, see `find_by_group`.
+
+        :param name: The group name, e.g. 'gem_blue'.
+        :type name: str
+
+        :return: The group definitions in catalog order.
+        :rtype: tuple[PatternGroup, ...]
+        """
+
+        return self.queries.by_group.get(name, ())
+
+    def find_by_weapon(self, weapon: str) -> tuple[PatternGroup, ...]:
+        """
+        Find every pattern group defined for a weapon in this catalog, see `find_by_weapon`.
+
+        :param weapon: The weapon name, e.g. 'karambit'.
+        :type weapon: str
+
+        :return: The group definitions in catalog order.
+        :rtype: tuple[PatternGroup, ...]
+        """
+
+        return self.queries.by_weapon.get(weapon.lower(), ())
+
+    def find_by_skin(self, skin: str) -> tuple[PatternGroup, ...]:
+        """
+        Find every pattern group defined for a skin in this catalog, see `find_by_skin`.
+
+        :param skin: The skin name, e.g. 'case hardened'.
+        :type skin: str
+
+        :return: The group definitions in catalog order.
+        :rtype: tuple[PatternGroup, ...]
+        """
+
+        return self.queries.by_skin.get(skin.lower(), ())
+
+    def get_pattern_dict(self) -> Mapping:
+        """
+        Retrieve the read-only pattern map of this catalog.
+
+        :return: Mapping of skin -> weapon -> tuple of group definitions.
+        :rtype: Mapping
+        """
+
+        return self.pattern_map
+
+    def __getattr__(self, name: str):
+        # Expose the modular helpers as methods bound to this catalog
+        if not name.startswith('_'):
+            from cs2pattern import modular
+
+            helper = vars(modular).get(name)
+            if callable(helper) and getattr(helper, '__module__', None) == modular.__name__:
+                return partial(helper, catalog=self)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+
+_CATALOG: Optional[Catalog] = None
+_CATALOG_LOCK = allocate_lock()
+
+
+def _read_catalog(pattern_file: Path = PATTERN_FILE, icon_file: Path = ICON_FILE) -> Catalog:
+    """
+    Parse a catalog from its `pattern.json` and `icons.json` sources.
+
+    :param pattern_file: Path of the `pattern.json` source.
+    :type pattern_file: Path
+    :param icon_file: Path of the `icons.json` source.
+    :type icon_file: Path
+
+    :return: The loaded catalog.
+    :rtype: Catalog
+    """
+
+    # Imported here so that importing the package stays cheap for processes that never look anything up
+    import json
+
+    return Catalog(json.loads(pattern_file.read_bytes()), json.loads(icon_file.read_bytes()))
+
+
+def _load_catalog() -> Catalog:
+    global _CATALOG
+    with _CATALOG_LOCK:
+        if _CATALOG is None:
+            _CATALOG = _read_catalog()
+        return _CATALOG
+
+
+def _get_catalog() -> Catalog:
+    """
+    Return the default catalog, loading it on first use.
+
+    :return: The loaded catalog.
+    :rtype: Catalog
+    """
+
+    return _CATALOG or _load_catalog()
+
+
+def reload_catalog(pattern_file: Optional[Path] = None, icon_file: Optional[Path] = None) -> None:
+    """
+    Load the catalog again and atomically replace the one used by every lookup.
+
+    The new catalog and its lookup tables are built completely before the swap. Every lookup resolves the catalog
+    once and works on that snapshot only, so in-flight lookups finish on the old catalog while new ones see the new.
+    If loading fails, the exception is raised and the current catalog stays in place.
+
+    :param pattern_file: Path of the `pattern.json` to load, defaults to the bundled one.
+    :type pattern_file: Optional[Path]
+    :param icon_file: Path of the `icons.json` to load, defaults to the bundled one.
+    :type icon_file: Optional[Path]
+    """
+
+    global _CATALOG
+
+    catalog = Catalog.load(pattern_file, icon_file)
+    catalog.warmup()
+
+    with _CATALOG_LOCK:
+        _CATALOG = catalog
+
+
+def __getattr__(name: str):
+    # PATTERN_MAP, ICON_MAP and PATTERN_INDEX used to be eagerly loaded module globals
+    if name == 'PATTERN_MAP':
+        return _get_catalog().pattern_map
+    if name == 'ICON_MAP':
+        return _get_catalog().icon_map
+    if name == 'PATTERN_INDEX':
+        return _get_catalog().index
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def warmup() -> None:
+    """
+    Load the catalog and build every lookup table eagerly.
+
+    Long-running services can call this at startup so the first lookup does not pay for loading.
+    """
+
+    _get_catalog().warmup()
+
+
+def _lookup_index(catalog: Catalog, skin: str, weapon: str, pattern: int) -> Optional[_GroupRecord]:
+    return catalog.index.get((skin, weapon, pattern))
+
+
+def _lookup_dense(catalog: Catalog, skin: str, weapon: str, pattern: int) -> Optional[_GroupRecord]:
+    entry = catalog.dense.get((skin, weapon))
+    if entry is None:
+        return None
+
+    slots, records = entry
+    try:
+        code = slots[pattern]
+    except TypeError:
+        # Non-int seeds (e.g. 148.0) cannot index the array, let the hash index resolve them
+        return catalog.index.get((skin, weapon, pattern))
+    return records[code - 1] if code else None
+
+
+ENGINES: dict[str, Callable[[Catalog, str, str, int], Optional[_GroupRecord]]] = {
+    'index': _lookup_index,
+    'dense': _lookup_dense,
+}
+_lookup = _lookup_index
+
+
+def set_engine(name: str) -> None:
+    """
+    Select the lookup engine used by `check_rare`.
+
+    'index' (default) resolves seeds through a flat (skin, weapon, pattern) hash table,
+    'dense' through a compact 1001-slot array per item.
+
+    :param name: Engine name, one of `ENGINES`.
+    :type name: str
+
+    :raises ValueError: If the engine name is unknown.
+    """
+
+    global _lookup
+
+    if name not in ENGINES:
+        raise ValueError(f"Unknown engine '{name}', expected one of: {', '.join(ENGINES)}")
+
+    _lookup = ENGINES[name]
+
+
+def _deep_sizeof(obj, seen: Optional[set[int]] = None) -> int:
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (dict, MappingProxyType)):
+        size += sum(_deep_sizeof(key, seen) + _deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__slots__'):
+        size += sum(_deep_sizeof(getattr(obj, slot), seen) for slot in obj.__slots__)
+    return size
+
+
+def memory_report() -> dict[str, int]:
+    """
+    Report the approximate deep memory footprint of the catalog and each engine's lookup table.
+
+    :return: Mapping of structure name ('pattern_map', 'index', 'dense') to its size in bytes.
+    :rtype: dict[str, int]
+    """
+
+    catalog = _get_catalog()
+    return {
+        'pattern_map': _deep_sizeof(catalog.pattern_map),
+        'index': _deep_sizeof(catalog.index),
+        'dense': _deep_sizeof(catalog.dense),
+    }
+
+
+def _normalize_market_hash(market_hash: str) -> Optional[tuple[str, str]]:
+    """
+    Normalize a CS2 market hash into its weapon and skin identifiers.
+
+    :param market_hash: The market hash of the item.
+    :type market_hash: str
+
+    :return: A tuple of the normalized weapon and skin, or None if we failed to normalize.
+    :rtype: Optional[tuple[str, str]]
+    """
+
+    # Normalize market_hash, clean Steam names only ever contain single ASCII spaces so we can skip collapsing
+    if market_hash.isprintable() and "  " not in market_hash and market_hash[:1] != " " and market_hash[-1:] != " ":
+        market_hash = market_hash.replace("★ ", "").lower()
+    else:
+        market_hash = " ".join(market_hash.replace("★ ", "").lower().split())
+
+    # Extract weapon and skin
+    weapon, separator, skin = market_hash.partition(" | ")
+    if not separator:
+        return None
+
+    # Drop a trailing wear suffix like "(Field-Tested)"
+    if skin.endswith(")"):
+        wear_start = skin.find("(")
+        if wear_start != -1:
+            skin = skin[:wear_start]
+
+    return weapon, skin.strip()
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_market_hash(market_hash: str) -> Optional[MarketItem]:
+    """
+    Parse a CS2 market hash into all of its attributes in a single pass.
+
+    Accepts the same input as `check_rare`, including irregular whitespace and casing. Results are cached per
+    string, so parsing the same listing name again is a dictionary lookup.
+
+    :param market_hash: The market hash of the item, e.g. "★ StatTrak™ Karambit | Fade (Factory New)".
+    :type market_hash: str
+
+    :return: The parsed item, or None if the market hash has no "weapon | skin" form.
+    :rtype: Optional[MarketItem]
+    """
+
+    # Same cleanup as `_normalize_market_hash`, keeping track of what it strips
+    star = "★ " in market_hash
+    if market_hash.isprintable() and "  " not in market_hash and market_hash[:1] != " " and market_hash[-1:] != " ":
+        market_hash = market_hash.replace("★ ", "").lower()
+    else:
+        market_hash = " ".join(market_hash.replace("★ ", "").lower().split())
+
+    weapon, separator, skin = market_hash.partition(" | ")
+    if not separator:
+        return None
+
+    wear = None
+    if skin.endswith(")"):
+        wear_start = skin.find("(")
+        if wear_start != -1:
+            wear = skin[wear_start + 1:-1].strip()
+            wear = _WEAR_NAMES.get(wear, wear) or None
+            skin = skin[:wear_start]
+
+    stattrak = weapon.startswith("stattrak™ ")
+    if stattrak:
+        weapon = weapon[10:]
+    souvenir = weapon.startswith("souvenir ")
+    if souvenir:
+        weapon = weapon[9:]
+
+    return MarketItem(weapon, skin.strip(), wear, stattrak, souvenir, star)
+
+
+def _normalize_name(market_hash: str) -> Optional[tuple[str, str]]:
+    """
+    Normalize a market hash into the weapon and skin of its base item, without StatTrak™ or Souvenir prefix.
+
+    :param market_hash: The market hash of the item.
+    :type market_hash: str
+
+    :return: A tuple of the normalized weapon and skin, or None if we failed to normalize.
+    :rtype: Optional[tuple[str, str]]
+    """
+
+    item = _normalize_market_hash(market_hash)
+    if item is not None and item[0].startswith(_QUALITY_PREFIXES):
+        return item[0].partition(" ")[2], item[1]
+    return item
+
+
+_NO_NAMES: Mapping[str, tuple[str, str]] = MappingProxyType({})
+
+
+def _normalize_item(market_hash: Union[str, MarketItem],
+                    names: Mapping[str, tuple[str, str]] = _NO_NAMES) -> Optional[tuple[str, str]]:
+    """
+    Resolve a market hash or `MarketItem` to its normalized weapon and skin.
+
+    Exact Steam names resolve with a single lookup in a catalog's `names` table, irregular input falls back
+    to the normalizer.
+
+    :param market_hash: The market hash of the item, or its already parsed `MarketItem`.
+    :type market_hash: Union[str, MarketItem]
+    :param names: Exact name table of the catalog, see `Catalog.names`.
+    :type names: Mapping[str, tuple[str, str]]
+
+    :return: A tuple of the normalized weapon and skin, or None if we failed to normalize.
+    :rtype: Optional[tuple[str, str]]
     """
 
-    weapon: Optional[str] = None
-    skin: Optional[str] = None
-    pattern: Optional[int] = None
-    rare: bool = False
-    name: Optional[str] = None
-    ordered: bool = False
-    order: Optional[tuple[int, int]] = None
-    icon: Optional[str] = None
+    if type(market_hash) is MarketItem:
+        return market_hash.weapon, market_hash.skin
+    return names.get(market_hash) or _normalize_name(market_hash)
 
 
-def _normalize_input(market_hash: str, pattern: int) -> Optional[tuple[str, str, int]]:
+def _normalize_input(market_hash: Union[str, MarketItem], pattern: int,
+                     names: Mapping[str, tuple[str, str]] = _NO_NAMES) -> Optional[tuple[str, str, int]]:
     """
     Normalize and validate CS2 item input.
 
-    :param market_hash: The market hash of the item.
-    :type market_hash: str
+    :param market_hash: The market hash of the item, or its already parsed `MarketItem`.
+    :type market_hash: Union[str, MarketItem]
 
     :param pattern: The pattern, which should be numeric and between 0-1000 (inclusive).
     :type pattern: int
 
+    :param names: Exact name table of the catalog, see `Catalog.names`.
+    :type names: Mapping[str, tuple[str, str]]
+
     :return: A tuple of the normalized weapon, skin and pattern, or None if we failed to normalize.
     :rtype: Optional[tuple[str, str, int]]
     """
 
-    # Normalize market_hash
-    market_hash = re.sub(r"\s+", " ", market_hash.replace("★ ", "").lower()).strip()
-
-    # Extract weapon and skin
-    if " | " not in market_hash:
-        return None
-
-    weapon, skin = market_hash.split(" | ", 1)
-    skin = re.sub(r"\s*\(.*?\)$", "", skin).strip()
+    if type(market_hash) is MarketItem:
+        item = market_hash.weapon, market_hash.skin
+    else:
+        item = names.get(market_hash)
+        if item is None:
+            item = _normalize_market_hash(market_hash)
+            if item is None:
+                return None
+            if item[0].startswith(_QUALITY_PREFIXES):
+                item = item[0].partition(" ")[2], item[1]
 
     # Validate pattern
     if not (0 <= pattern <= 1000):
         return None
 
+    weapon, skin = item
     return weapon, skin, pattern
 
 
@@ -79,34 +1084,19 @@ def _match_group(normalized_data: tuple[str, str, int]) -> Optional[tuple[str, b
     """
 
     weapon, skin, pattern = normalized_data
-
-    # Check if skin and weapon exist in the pattern data
-    if skin not in PATTERN_MAP or weapon not in PATTERN_MAP[skin]:
+    record = _lookup(_get_catalog(), skin, weapon, pattern)
+    if record is None:
         return None
 
-    groups = PATTERN_MAP[skin][weapon]
-
-    for group in groups:
-        patterns = list(group.get('pattern', []))
-        if pattern in patterns:
-            ordered = bool(group.get('ordered', False))
-            if ordered:
-                rank = patterns.index(pattern) + 1
-                total = len(patterns)
-            else:
-                rank = None
-                total = None
-            return group.get('name'), ordered, rank, total
-
-    return None
+    return record.name, record.ordered, record.rank, record.total
 
 
-def check_rare(market_hash: str, pattern: int) -> PatternInfo:
+def check_rare(market_hash: Union[str, MarketItem], pattern: int) -> PatternInfo:
     """
     Determine if the given item is rare based on market hash and pattern.
 
-    :param market_hash: The market hash of the item.
-    :type market_hash: str
+    :param market_hash: The market hash of the item, or its `MarketItem` from `parse_market_hash`.
+    :type market_hash: Union[str, MarketItem]
     :param pattern: The pattern to check for rarity.
     :type pattern: int
 
@@ -114,43 +1104,667 @@ def check_rare(market_hash: str, pattern: int) -> PatternInfo:
     :rtype: PatternInfo
     """
 
-    normalized = _normalize_input(market_hash, pattern)
+    return (_CATALOG or _load_catalog()).check_rare(market_hash, pattern)
+
+
+def _catalog_items(catalog: 'Catalog') -> frozenset[tuple[str, str]]:
+    return frozenset((skin, weapon) for skin, weapon, _ in catalog.index)
+
+
+def _check_rare_uncached(catalog: Catalog, market_hash: Union[str, MarketItem], pattern: int) -> PatternInfo:
+    normalized = _normalize_input(market_hash, pattern, catalog._names or catalog.names)
     if not normalized:
-        return PatternInfo()
+        return _EMPTY_INFO
 
     weapon, skin, normalized_pattern = normalized
-    special = _match_group(normalized)
+    return _build_info(weapon, skin, normalized_pattern, _lookup(catalog, skin, weapon, normalized_pattern))
+
+
+def could_be_rare(market_hash: Union[str, MarketItem], pattern: int) -> bool:
+    """
+    Cheaply test whether the given item might be rare, without normalizing the market hash.
+
+    Checks whether the seed is rare for any item at all, then whether the raw market hash names a catalog item.
+    A False result is exact, `check_rare` would report the item as not rare. A True result only means the item
+    has to be checked with `check_rare`. Use it to drop the bulk of listings before doing any real work.
 
-    if not special:
+    :param market_hash: The market hash of the item, or its `MarketItem` from `parse_market_hash`.
+    :type market_hash: Union[str, MarketItem]
+    :param pattern: The pattern to check for rarity.
+    :type pattern: int
+
+    :return: False if the item is definitely not rare, True if it may be.
+    :rtype: bool
+    """
+
+    return (_CATALOG or _load_catalog()).could_be_rare(market_hash, pattern)
+
+
+def check_rare_tuple(market_hash: Union[str, MarketItem], pattern: int) -> tuple:
+    """
+    Lightweight variant of `check_rare` for hot loops that do not need the dataclass.
+
+    The result holds the `PatternInfo` fields in declaration order
+    (weapon, skin, pattern, rare, name, ordered, order, icon), so `PatternInfo(*result)` equals `check_rare(...)`.
+    Tuples for rare hits are shared between calls.
+
+    :param market_hash: The market hash of the item, or its `MarketItem` from `parse_market_hash`.
+    :type market_hash: Union[str, MarketItem]
+    :param pattern: The pattern to check for rarity.
+    :type pattern: int
+
+    :return: Tuple of the `PatternInfo` field values.
+    :rtype: tuple
+    """
+
+    return (_CATALOG or _load_catalog()).check_rare_tuple(market_hash, pattern)
+
+
+def _build_info(weapon: Optional[str], skin: Optional[str], pattern: Optional[int],
+                record: Optional[_GroupRecord]) -> PatternInfo:
+    """
+    Assemble the public `PatternInfo` for a normalized item and its matched group record.
+
+    :param weapon: Normalized weapon, or None if normalization failed.
+    :type weapon: Optional[str]
+    :param skin: Normalized skin, or None if normalization failed.
+    :type skin: Optional[str]
+    :param pattern: Validated pattern, or None if normalization failed.
+    :type pattern: Optional[int]
+    :param record: The matched group record, or None if the pattern is not rare.
+    :type record: Optional[_GroupRecord]
+
+    :return: The structured lookup result.
+    :rtype: PatternInfo
+    """
+
+    if record is None:
+        if weapon is None:
+            return _EMPTY_INFO
         return PatternInfo(
             weapon=weapon,
             skin=skin,
-            pattern=normalized_pattern,
+            pattern=pattern,
         )
 
-    group_name, ordered, rank, total = special
-    order_info = (rank, total) if ordered and rank is not None and total is not None else None
-    return PatternInfo(
-        weapon=weapon,
-        skin=skin,
-        pattern=normalized_pattern,
-        rare=True,
-        name=group_name,
-        ordered=ordered,
-        order=order_info,
-        icon=ICON_MAP.get(group_name),
-    )
+    return record.info
+
+
+class PatternBatch(Sequence):
+    """
+    Columnar result of `check_rare_many`.
+
+    The parallel `weapon`, `skin`, `pattern`, `rare`, `name`, `rank` and `total` lists share one position per input row.
+    Indexing or iterating the batch builds the matching `PatternInfo` objects on demand.
+    """
+
+    def __init__(self, weapon: list[Optional[str]], skin: list[Optional[str]], pattern: list[Optional[int]],
+                 records: list[Optional[_GroupRecord]]):
+        self.weapon = weapon
+        self.skin = skin
+        self.pattern = pattern
+        self.rare = [record is not None for record in records]
+        self.name = [record.name if record else None for record in records]
+        self.rank = [record.rank if record else None for record in records]
+        self.total = [record.total if record else None for record in records]
+        self._records = records
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return _build_info(self.weapon[index], self.skin[index], self.pattern[index], self._records[index])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, rare={sum(self.rare)})"
+
+
+def check_rare_many(items: Iterable[tuple[str, int]]) -> PatternBatch:
+    """
+    Determine rarity for many (market hash, pattern) rows at once.
+
+    Each distinct market hash is normalized only once per batch, which makes this considerably
+    cheaper than calling `check_rare` per row when listings share item names. Rows may also carry
+    a `MarketItem` from `parse_market_hash` instead of the market hash.
+
+    :param items: Iterable of (market_hash, pattern) rows.
+    :type items: Iterable[tuple[str, int]]
+
+    :return: Columnar batch result, index it to obtain `PatternInfo` objects.
+    :rtype: PatternBatch
+    """
+
+    return _get_catalog().check_rare_many(items)
+
+
+_MISS = object()
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics for a single cache tier.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    hit_rate: float
+
+
+class _LRUCache:
+    """
+    Bounded mapping that evicts the least recently used entry and counts hits and misses.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key):
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return _MISS
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        lookups = self.hits + self.misses
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data), self.hits / lookups if lookups else 0.0)
+
+
+class _PatternCache:
+    """
+    Two-tier cache in front of `check_rare`.
+
+    The 'names' tier memoizes market hash normalization, including whether the item exists in the catalog at all,
+    so items without any rare groups never occupy the 'results' tier. The 'results' tier memoizes full `PatternInfo`
+    results by (market_hash, pattern). Both tiers are flushed when the catalog is replaced, lookups still running
+    on a replaced catalog bypass the cache so they can never store results of the old catalog.
+    """
+
+    def __init__(self, maxsize: int):
+        self.names = _LRUCache(maxsize)
+        self.results = _LRUCache(maxsize)
+        self._lock = allocate_lock()
+        self._catalog: Optional[Catalog] = None
+        self._items: frozenset[tuple[str, str]] = frozenset()
+
+    def _sync_catalog(self, catalog: Catalog) -> bool:
+        if self._catalog is not catalog:
+            if catalog is not _CATALOG:
+                return False
+            self.names.clear()
+            self.results.clear()
+            self._catalog = catalog
+            self._items = catalog.derived('check.items', _catalog_items)
+        return True
+
+    def _put(self, catalog: Catalog, tier: _LRUCache, key, value) -> None:
+        with self._lock:
+            if self._catalog is catalog:
+                tier.put(key, value)
+
+    def check_rare(self, catalog: Catalog, market_hash: str, pattern: int) -> PatternInfo:
+        key = (market_hash, pattern)
+        with self._lock:
+            current = self._sync_catalog(catalog)
+            if current:
+                info = self.results.get(key)
+                if info is not _MISS:
+                    if _METRICS is not None:
+                        _METRICS.count_cache_hit()
+                    return info
+                entry = self.names.get(market_hash)
+                items = self._items
+                if entry is not _MISS and _METRICS is not None:
+                    _METRICS.count_cache_hit()
+
+        if not current:
+            return _check_rare_uncached(catalog, market_hash, pattern)
+
+        if entry is _MISS:
+            item = _normalize_item(market_hash, catalog.names)
+            entry = None if item is None else (*item, (item[1], item[0]) in items)
+            self._put(catalog, self.names, market_hash, entry)
+
+        if entry is None or not (0 <= pattern <= 1000):
+            return _EMPTY_INFO
+
+        weapon, skin, known = entry
+        if not known:
+            # Negative entry, the item has no rare groups so there is nothing worth caching per pattern
+            return PatternInfo(weapon=weapon, skin=skin, pattern=pattern)
+
+        info = _build_info(weapon, skin, pattern, _lookup(catalog, skin, weapon, pattern))
+        self._put(catalog, self.results, key, info)
+        return info
+
+    def clear(self) -> None:
+        with self._lock:
+            self.names.clear()
+            self.results.clear()
+
+    def info(self) -> dict[str, CacheInfo]:
+        with self._lock:
+            return {'names': self.names.info(), 'results': self.results.info()}
+
+
+_CACHE: Optional[_PatternCache] = None
+
+
+def enable_cache(maxsize: int = 4096) -> None:
+    """
+    Put a bounded two-tier LRU cache in front of `check_rare`.
+
+    Calling this again replaces the current cache, discarding its entries and statistics.
+    Only lookups on the default catalog are cached.
+
+    :param maxsize: Maximum number of entries kept per tier.
+    :type maxsize: int
+
+    :raises ValueError: If maxsize is not a positive integer.
+    """
+
+    global _CACHE
+
+    if maxsize < 1:
+        raise ValueError("Cache maxsize must be a positive integer.")
+    _CACHE = _PatternCache(maxsize)
+
+
+def disable_cache() -> None:
+    """
+    Remove the cache from `check_rare`.
+    """
+
+    global _CACHE
+    _CACHE = None
+
+
+def cache_clear() -> None:
+    """
+    Drop every cached entry and reset the hit/miss statistics. Does nothing if caching is disabled.
+    """
+
+    if _CACHE is not None:
+        _CACHE.clear()
+
+
+def cache_info() -> dict[str, CacheInfo]:
+    """
+    Return per-tier cache statistics.
+
+    :return: Mapping of tier name ('names', 'results') to its statistics, empty if caching is disabled.
+    :rtype: dict[str, CacheInfo]
+    """
+
+    if _CACHE is None:
+        return {}
+    return _CACHE.info()
+
+
+DEFAULT_LATENCY_BUCKETS = (500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000, 100_000, 1_000_000)
+
+
+class HistogramSnapshot(NamedTuple):
+    """
+    Latency distribution of `check_rare` calls in nanoseconds.
+
+    `counts[i]` holds the calls that took at most `bounds[i]`, the last entry counts everything slower.
+    """
+
+    bounds: tuple[int, ...]
+    counts: tuple[int, ...]
+    count: int
+    total_ns: int
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[int]:
+        """
+        Return the upper bound of the bucket holding the q-th quantile, None if it lies in the overflow bucket.
+
+        :param q: Quantile between 0 and 1, e.g. 0.99.
+        :type q: float
+
+        :return: Upper bucket bound in nanoseconds.
+        :rtype: Optional[int]
+        """
+
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return None
+
+
+class MetricsSnapshot(NamedTuple):
+    """
+    Point-in-time copy of the `check_rare` counters.
+
+    Every call is counted exactly once as `rare`, `not_rare` (a catalog item with a non-rare pattern),
+    `unknown` (an item without rare groups) or `malformed` (normalization or pattern validation failed).
+    `groups` counts rare hits per group name and `items` lookups per catalog (weapon, skin).
+    """
+
+    calls: int
+    rare: int
+    not_rare: int
+    unknown: int
+    malformed: int
+    cache_hits: int
+    groups: dict[str, int]
+    items: dict[tuple[str, str], int]
+    latency: Optional[HistogramSnapshot]
+
+
+class _Metrics:
+    """
+    Monotonic `check_rare` counters with an optional latency histogram.
+    """
+
+    def __init__(self, buckets: Optional[tuple[int, ...]]):
+        self.buckets = buckets
+        self._lock = allocate_lock()
+        self._clear()
+
+    def _clear(self) -> None:
+        self.calls = self.rare = self.not_rare = self.unknown = self.malformed = self.cache_hits = 0
+        self.groups: dict[str, int] = {}
+        self.items: dict[tuple[str, str], int] = {}
+        self.latency_counts = None if self.buckets is None else [0] * (len(self.buckets) + 1)
+        self.latency_total = 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._clear()
+
+    def count_cache_hit(self) -> None:
+        with self._lock:
+            self.cache_hits += 1
+
+    def record(self, catalog: Catalog, info: PatternInfo, elapsed: Optional[int]) -> None:
+        weapon, skin = info.weapon, info.skin
+        with self._lock:
+            self.calls += 1
+            if weapon is None:
+                self.malformed += 1
+            elif info.rare:
+                self.rare += 1
+                self.groups[info.name] = self.groups.get(info.name, 0) + 1
+                self.items[weapon, skin] = self.items.get((weapon, skin), 0) + 1
+            elif (skin, weapon) in catalog.derived('check.items', _catalog_items):
+                self.not_rare += 1
+                self.items[weapon, skin] = self.items.get((weapon, skin), 0) + 1
+            else:
+                self.unknown += 1
+
+            if self.latency_counts is not None:
+                self.latency_counts[bisect_left(self.buckets, elapsed)] += 1
+                self.latency_total += elapsed
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            latency = None
+            if self.latency_counts is not None:
+                latency = HistogramSnapshot(
+                    self.buckets, tuple(self.latency_counts), sum(self.latency_counts), self.latency_total,
+                )
+            return MetricsSnapshot(
+                self.calls, self.rare, self.not_rare, self.unknown, self.malformed, self.cache_hits,
+                dict(self.groups), dict(self.items), latency,
+            )
+
+
+class _Observer:
+    """
+    Wraps `check_rare` while metrics are enabled or hooks are registered.
+    """
+
+    __slots__ = ('metrics', 'hooks', 'timed')
+
+    def __init__(self, metrics: Optional[_Metrics], hooks: tuple[Callable, ...]):
+        self.metrics = metrics
+        self.hooks = hooks
+        self.timed = bool(hooks) or (metrics is not None and metrics.buckets is not None)
+
+    def check_rare(self, catalog: Catalog, cache: Optional['_PatternCache'], market_hash: str,
+                   pattern: int) -> PatternInfo:
+        start = perf_counter_ns() if self.timed else 0
+        if cache is not None:
+            info = cache.check_rare(catalog, market_hash, pattern)
+        else:
+            info = _check_rare_uncached(catalog, market_hash, pattern)
+        elapsed = perf_counter_ns() - start if self.timed else None
+
+        if self.metrics is not None:
+            self.metrics.record(catalog, info, elapsed)
+        for hook in self.hooks:
+            hook(market_hash, pattern, info, elapsed)
+        return info
+
+
+_METRICS: Optional[_Metrics] = None
+_HOOKS: tuple[Callable, ...] = ()
+_OBSERVER: Optional[_Observer] = None
+_OBSERVER_LOCK = allocate_lock()
+
+
+def _update_observer() -> None:
+    global _OBSERVER
+    _OBSERVER = _Observer(_METRICS, _HOOKS) if _METRICS is not None or _HOOKS else None
+
+
+def enable_metrics(histogram: bool = False, buckets: tuple[int, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+    """
+    Start counting `check_rare` calls, optionally recording their latency.
+
+    While metrics and hooks are disabled, `check_rare` only pays for a single `None` check.
+    Calling this again replaces the current counters.
+
+    :param histogram: Also record a latency histogram, which adds two clock reads per call.
+    :type histogram: bool
+    :param buckets: Ascending upper bucket bounds of the histogram in nanoseconds.
+    :type buckets: tuple[int, ...]
+
+    :raises ValueError: If the buckets are empty or not strictly ascending.
+    """
+
+    global _METRICS
+
+    buckets = tuple(buckets)
+    if not buckets or any(lower >= upper for lower, upper in zip(buckets, buckets[1:])):
+        raise ValueError("Histogram buckets must be a non-empty, strictly ascending sequence.")
+    with _OBSERVER_LOCK:
+        _METRICS = _Metrics(buckets if histogram else None)
+        _update_observer()
+
+
+def disable_metrics() -> None:
+    """
+    Stop counting `check_rare` calls and drop the counters.
+    """
+
+    global _METRICS
+
+    with _OBSERVER_LOCK:
+        _METRICS = None
+        _update_observer()
+
 
+def metrics_snapshot() -> Optional[MetricsSnapshot]:
+    """
+    Return a copy of the current counters.
+
+    :return: The counters, None if metrics are disabled.
+    :rtype: Optional[MetricsSnapshot]
+    """
+
+    metrics = _METRICS
+    return None if metrics is None else metrics.snapshot()
+
+
+def reset_metrics() -> None:
+    """
+    Reset every counter and the histogram to zero. Does nothing if metrics are disabled.
+    """
+
+    metrics = _METRICS
+    if metrics is not None:
+        metrics.reset()
+
+
+def add_hook(hook: Callable[[str, int, PatternInfo, Optional[int]], None]) -> Callable:
+    """
+    Register a callable invoked after every `check_rare` call.
+
+    Hooks receive `(market_hash, pattern, info, elapsed_ns)` on the calling thread, in registration order.
+    They run inside `check_rare`, so they should be cheap, and exceptions they raise propagate to the caller.
+    Returns the hook, so this can be used as a decorator.
+
+    :param hook: The callable to register.
+    :type hook: Callable[[str, int, PatternInfo, Optional[int]], None]
+
+    :return: The registered hook.
+    :rtype: Callable
+    """
+
+    global _HOOKS
+
+    with _OBSERVER_LOCK:
+        _HOOKS = (*_HOOKS, hook)
+        _update_observer()
+    return hook
+
+
+def remove_hook(hook: Callable) -> None:
+    """
+    Unregister a hook registered with `add_hook`.
+
+    :param hook: The hook to remove.
+    :type hook: Callable
+
+    :raises ValueError: If the hook is not registered.
+    """
+
+    global _HOOKS
+
+    with _OBSERVER_LOCK:
+        if hook not in _HOOKS:
+            raise ValueError("Hook is not registered.")
+        hooks = list(_HOOKS)
+        hooks.remove(hook)
+        _HOOKS = tuple(hooks)
+        _update_observer()
+
+
+def find_by_pattern(pattern: int) -> tuple[PatternInfo, ...]:
+    """
+    Find every catalog entry for which the given seed is rare.
+
+    :param pattern: The pattern (seed) to look up.
+    :type pattern: int
+
+    :return: The rare results for this seed in catalog order, empty if the seed is not rare anywhere.
+    :rtype: tuple[PatternInfo, ...]
+    """
+
+    return _get_catalog().find_by_pattern(pattern)
+
+
+def find_by_pattern_range(lo: int, hi: int) -> tuple[PatternInfo, ...]:
+    """
+    Find every catalog entry that is rare for a seed between `lo` and `hi`, both inclusive.
+
+    :param lo: Lowest seed of the range.
+    :type lo: int
+    :param hi: Highest seed of the range.
+    :type hi: int
+
+    :return: The rare results ordered by seed, then catalog order.
+    :rtype: tuple[PatternInfo, ...]
+    """
+
+    return _get_catalog().find_by_pattern_range(lo, hi)
+
+
+def find_by_group(name: str) -> tuple[PatternGroup, ...]:
+    """
+    Find every item definition of a pattern group across all skins and weapons.
+
+    :param name: The group name, e.g. 'gem_blue'.
+    :type name: str
+
+    :return: The group definitions in catalog order, empty if the group is unknown.
+    :rtype: tuple[PatternGroup, ...]
+    """
+
+    return _get_catalog().find_by_group(name)
 
-def get_pattern_dict() -> dict:
+
+def find_by_weapon(weapon: str) -> tuple[PatternGroup, ...]:
+    """
+    Find every pattern group defined for a weapon across all skins.
+
+    :param weapon: The weapon name, e.g. 'karambit'.
+    :type weapon: str
+
+    :return: The group definitions in catalog order, empty if the weapon has none.
+    :rtype: tuple[PatternGroup, ...]
+    """
+
+    return _get_catalog().find_by_weapon(weapon)
+
+
+def find_by_skin(skin: str) -> tuple[PatternGroup, ...]:
+    """
+    Find every pattern group defined for a skin across all weapons.
+
+    :param skin: The skin name, e.g. 'case hardened'.
+    :type skin: str
+
+    :return: The group definitions in catalog order, empty if the skin has none.
+    :rtype: tuple[PatternGroup, ...]
+    """
+
+    return _get_catalog().find_by_skin(skin)
+
+
+def get_pattern_dict() -> Mapping:
     """
     Retrieve the full pattern map containing all configured rarity groups.
 
-    :return: Mapping of skin -> weapon -> list of group definitions.
-    :rtype: dict
+    The map is a read-only view built once per catalog, nested mappings are read-only as well
+    and pattern lists are tuples, so it can be shared between threads without copying.
+
+    :return: Mapping of skin -> weapon -> tuple of group definitions.
+    :rtype: Mapping
     """
 
-    return PATTERN_MAP
+    return _get_catalog().get_pattern_dict()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,124 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+try:
+    import pandas as pd
+except ImportError as exc:
+    raise ImportError("cs2pattern.frames requires pandas, install it with 'pip install pandas'.") from exc
+
+import numpy as np
+
+from cs2pattern.vectorized import _annotate, _as_seeds, _encode_dictionary, _get_tables
+
+
+ANNOTATION_COLUMNS = ('group', 'rank', 'total')
+
+
+def annotate_series(market_hashes: pd.Series, seeds) -> pd.DataFrame:
+    """
+    Annotate a Series of market hashes and the matching seeds with their rare pattern group, rank and total.
+
+    The market hashes are factorized first, so every distinct item name is normalized only once, then all seeds
+    are looked up with a single vectorized gather.
+
+    :param market_hashes: Series of market hashes, plain or categorical.
+    :type market_hashes: pd.Series
+    :param seeds: Seeds, matched to the market hashes by position. Missing and non-integral seeds are not rare.
+    :type seeds: array-like
+
+    :return: Frame with the index of `market_hashes` and the columns `group` (categorical), `rank` and `total`
+             (nullable integers), missing where the item is not rare or the group is unordered.
+    :rtype: pd.DataFrame
+
+    :raises ValueError: If the number of seeds does not match the number of market hashes.
+    """
+
+    seeds = pd.to_numeric(seeds if isinstance(seeds, pd.Series) else pd.Series(seeds), errors='coerce')
+    if len(seeds) != len(market_hashes):
+        raise ValueError(f"Got {len(seeds)} seeds for {len(market_hashes)} market hashes.")
+
+    tables = _get_tables()
+    indices, uniques = pd.factorize(market_hashes)
+    codes = _encode_dictionary(tables, uniques, indices)
+    groups, ranks, totals = _annotate(tables, codes, _as_seeds(seeds.to_numpy(dtype=np.float64, na_value=np.nan)))
+
+    return pd.DataFrame(
+        {
+            'group': pd.Categorical.from_codes(groups, categories=tables.groups),
+            'rank': pd.arrays.IntegerArray(ranks.astype(np.int16), ranks == 0),
+            'total': pd.arrays.IntegerArray(totals.astype(np.int16), totals == 0),
+        },
+        index=market_hashes.index,
+    )
+
+
+def annotate_frame(frame: pd.DataFrame, hash_column: str = 'market_hash',
+                   pattern_column: str = 'pattern') -> pd.DataFrame:
+    """
+    Return a copy of the frame with the `group`, `rank` and `total` columns appended, see `annotate_series`.
+
+    Existing columns of the same name are replaced.
+
+    :param frame: Frame holding one listing per row.
+    :type frame: pd.DataFrame
+    :param hash_column: Column holding the market hash.
+    :type hash_column: str
+    :param pattern_column: Column holding the pattern.
+    :type pattern_column: str
+
+    :return: The annotated copy.
+    :rtype: pd.DataFrame
+
+    :raises KeyError: If a column is missing.
+    """
+
+    annotations = annotate_series(frame[hash_column], frame[pattern_column])
+    result = frame.copy()
+    # Assigned by position, joining on the index would multiply rows of frames with duplicate labels
+    for column in ANNOTATION_COLUMNS:
+        result[column] = annotations[column].array
+    return result
+
+
+@pd.api.extensions.register_series_accessor("cs2pattern")
+class PatternAccessor:
+    """
+    `Series.cs2pattern` accessor, registered when this module is imported.
+
+    Example: `df["market_hash"].cs2pattern.annotate(df["pattern"])`.
+    """
+
+    def __init__(self, series: pd.Series):
+        self._series = series
+
+    def annotate(self, seeds) -> pd.DataFrame:
+        """
+        Annotate the market hashes of this Series with the given seeds, see `annotate_series`.
+
+        :param seeds: Seeds, matched to the market hashes by position.
+        :type seeds: array-like
+
+        :return: Frame with the `group`, `rank` and `total` columns.
+        :rtype: pd.DataFrame
+        """
+
+        return annotate_series(self._series, seeds)
+
+    def item_codes(self) -> pd.Series:
+        """
+        Resolve the market hashes of this Series to `cs2pattern.vectorized` item codes.
+
+        :return: Item codes, -1 for items that are not part of the catalog.
+        :rtype: pd.Series
+        """
+
+        indices, uniques = pd.factorize(self._series)
+        return pd.Series(_encode_dictionary(_get_tables(), uniques, indices), index=self._series.index)
+
+
+if __name__ == '__main__':
+    exit(1)
@@ -1,21 +1,138 @@
 __author__ = "Lukas Mahler"
 __version__ = "0.0.0"
-__date__ = "09.04.2026"
+__date__ = "17.10.2026"
 __email__ = "m@hler.eu"
 __status__ = "Development"
 
 
-from typing import Optional, Sequence
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from cs2pattern.check import get_pattern_dict
+from cs2pattern.check import Catalog, _get_catalog, get_pattern_dict
 
 
-PATTERN_MAP = get_pattern_dict()
+def __getattr__(name: str):
+    # PATTERN_MAP used to be bound at import time, resolve it lazily to keep importing cheap
+    if name == 'PATTERN_MAP':
+        return get_pattern_dict()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-def _lookup_group(skin: str, weapon: str, group_name: str) -> tuple[list[int], bool]:
+_HELPER_SKINS: dict[str, dict[str, tuple[str, ...]]] = {
+    'fade': {
+        'awp': ('fade',),
+        'karambit': ('fade',),
+        'm4a1-s': ('fade',),
+        'm9 bayonet': ('fade',),
+        'talon knife': ('fade',),
+    },
+    'fire_and_ice': {
+        'bayonet': ('marble fade',),
+        'flip knife': ('marble fade',),
+        'gut knife': ('marble fade',),
+        'karambit': ('marble fade',),
+    },
+    'gem_black': {
+        'classic knife': ('scorched',),
+        'desert eagle': ('serpent strike',),
+        'flip knife': ('scorched',),
+        'glock-18': ('grinder',),
+        'nomad knife': ('scorched',),
+        'paracord knife': ('scorched',),
+        'shadow daggers': ('scorched',),
+        'skeleton knife': ('scorched',),
+        'sport gloves': ('nocts',),
+        'stiletto knife': ('scorched',),
+        'ursus knife': ('scorched',),
+    },
+    'gem_blue': {
+        'ak-47': ('case hardened',),
+        'bayonet': ('case hardened',),
+        'bowie knife': ('case hardened',),
+        'butterfly knife': ('case hardened',),
+        'classic knife': ('case hardened',),
+        'desert eagle': ('heat treated',),
+        'falchion knife': ('case hardened',),
+        'five-seven': ('case hardened', 'heat treated'),
+        'flip knife': ('case hardened',),
+        'gut knife': ('case hardened',),
+        'huntsman knife': ('case hardened',),
+        'hydra gloves': ('case hardened',),
+        'karambit': ('case hardened',),
+        'm9 bayonet': ('case hardened',),
+        'mac-10': ('case hardened',),
+        'navaja knife': ('case hardened',),
+        'nomad knife': ('case hardened',),
+        'paracord knife': ('case hardened',),
+        'shadow daggers': ('case hardened',),
+        'skeleton knife': ('case hardened',),
+        'stiletto knife': ('case hardened',),
+        'survival knife': ('case hardened',),
+        'talon knife': ('case hardened',),
+        'ursus knife': ('case hardened',),
+    },
+    'gem_gold': {
+        'ak-47': ('case hardened',),
+        'bayonet': ('case hardened',),
+        'five-seven': ('case hardened',),
+        'karambit': ('case hardened',),
+        'mp7': ('amberline',),
+    },
+    'gem_purple': {
+        'desert eagle': ('heat treated',),
+        'galil ar': ('sandstorm',),
+        'tec-9': ('sandstorm',),
+    },
+    'gem_white': {
+        'butterfly knife': ('urban masked',),
+        'classic knife': ('urban masked',),
+        'flip knife': ('urban masked',),
+        'glock-18': ('trace lock',),
+        'karambit': ('urban masked',),
+        'm9 bayonet': ('urban masked',),
+        'mac-10': ('snow splash',),
+        'mp7': ('amberline',),
+        'skeleton knife': ('urban masked',),
+        'stiletto knife': ('urban masked',),
+    },
+}
+
+
+_EMPTY_GROUP: tuple[tuple[int, ...], bool] = ((), False)
+
+
+def _resolve_helpers(catalog: Catalog) -> dict[str, Mapping[str, tuple[tuple[int, ...], bool]]]:
     """
-    Retrieve pattern data for a single group from the shared pattern dictionary.
+    Resolve every multi-weapon helper against the catalog's group index.
+
+    For each weapon the skins listed in `_HELPER_SKINS` are tried in order and the first non-empty group wins.
+
+    :param catalog: Catalog to resolve against.
+    :type catalog: Catalog
+
+    :return: Mapping of group name to a read-only mapping of weapon -> (patterns, ordered).
+    :rtype: dict[str, Mapping[str, tuple[tuple[int, ...], bool]]]
+    """
+
+    helpers = {}
+    for group_name, weapon_options in _HELPER_SKINS.items():
+        weapons = catalog.groups.get(group_name, {})
+        resolved = {}
+        for weapon, skins in weapon_options.items():
+            entries = weapons.get(weapon, {})
+            for skin in skins:
+                entry = entries.get(skin)
+                if entry and entry[0]:
+                    resolved[weapon] = entry
+                    break
+        helpers[group_name] = MappingProxyType(resolved)
+    return helpers
+
+
+def _lookup_group(skin: str, weapon: str, group_name: str,
+                  catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
+    """
+    Retrieve pattern data for a single group from the catalog's group index.
 
     :param skin: Skin identifier (lower-case, matching the JSON keys).
     :type skin: str
@@ -23,400 +140,482 @@ def _lookup_group(skin: str, weapon: str, group_name: str) -> tuple[list[int], b
     :type weapon: str
     :param group_name: Name of the group within the skin/weapon entry.
     :type group_name: str
+    :param catalog: Catalog to look up, defaults to the default catalog.
+    :type catalog: Optional[Catalog]
 
-    :return: A tuple containing the list of pattern ids and the ordered flag.
-    :rtype: tuple[list[int], bool]
+    :return: A tuple containing the pattern ids and the ordered flag.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    groups = PATTERN_MAP.get(skin, {}).get(weapon, [])
-    for group in groups:
-        if group.get('name') == group_name:
-            return list(group.get('pattern', [])), bool(group.get('ordered', False))
-    return [], False
+    if catalog is None:
+        catalog = _get_catalog()
+    return catalog.groups.get(group_name, {}).get(weapon, {}).get(skin, _EMPTY_GROUP)
 
 
-def _lookup_first_group(weapon: str, group_name: str, skins: Sequence[str]) -> Optional[tuple[list[int], bool]]:
+def _lookup_combined_group(skin: str, weapon: str, group_names: tuple[str, ...],
+                           catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
-    Try to resolve a group across multiple skins for a given weapon and return its ordering info.
+    Concatenate the pattern ids of several groups of one skin/weapon entry into a single unordered result.
 
-    :param weapon: Weapon identifier.
+    :param skin: Skin identifier (lower-case, matching the JSON keys).
+    :type skin: str
+    :param weapon: Weapon identifier (lower-case, matching the JSON keys).
     :type weapon: str
-    :param group_name: Group to retrieve.
+    :param group_names: Names of the groups to combine, in output order.
+    :type group_names: tuple[str, ...]
+    :param catalog: Catalog to look up, defaults to the default catalog.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple containing the combined pattern ids and False.
+    :rtype: tuple[tuple[int, ...], bool]
+    """
+
+    def combine(catalog: Catalog) -> tuple[tuple[int, ...], bool]:
+        entries = catalog.groups
+        patterns = sum((entries.get(name, {}).get(weapon, {}).get(skin, _EMPTY_GROUP)[0] for name in group_names), ())
+        return patterns, False
+
+    if catalog is None:
+        catalog = _get_catalog()
+    return catalog.derived(('modular.combined', skin, weapon, group_names), combine)
+
+
+def _lookup_first_group(weapon: str, group_name: str,
+                        catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
+    """
+    Resolve a multi-weapon helper group for a given weapon.
+
+    :param weapon: Weapon identifier (case-insensitive).
+    :type weapon: str
+    :param group_name: Group to retrieve, a key of `_HELPER_SKINS`.
+    :type group_name: str
+    :param catalog: Catalog to look up, defaults to the default catalog.
+    :type catalog: Optional[Catalog]
+
+    :return: The first matching pattern tuple and ordered flag, or ``None`` if no match is found.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
+    """
+
+    if catalog is None:
+        catalog = _get_catalog()
+    return catalog.derived('modular.helpers', _resolve_helpers)[group_name].get(weapon.lower())
+
+
+def _lookup_all_groups(group_name: str,
+                       catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Resolve a multi-weapon helper group for every weapon it supports.
+
+    :param group_name: Group to retrieve, a key of `_HELPER_SKINS`.
     :type group_name: str
-    :param skins: Skins to inspect in order until the group is found.
-    :type skins: Sequence[str]
+    :param catalog: Catalog to look up, defaults to the default catalog.
+    :type catalog: Optional[Catalog]
 
-    :return: The first matching pattern list and ordered flag, or ``None`` if no match is found.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: Read-only mapping of weapon to its pattern tuple and ordered flag.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
     """
 
-    weapon = weapon.lower()
-    for skin in skins:
-        patterns, ordered = _lookup_group(skin, weapon, group_name)
-        if patterns:
-            return patterns, ordered
-    return None
+    if catalog is None:
+        catalog = _get_catalog()
+    return catalog.derived('modular.helpers', _resolve_helpers)[group_name]
 
 
-def abyss() -> tuple[list[int], bool]:
+def abyss(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for white scoped 'SSG 08 | Abyss' skins.
     WARN: BS=White, FN=Light-Blue!
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('abyss', 'ssg 08', 'white_scope')
+    return _lookup_group('abyss', 'ssg 08', 'white_scope', catalog)
 
 
-def berries() -> tuple[list[int], bool]:
+def berries(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return gem red (182) or gem blue (80) 'Five-SeveN | Berries and Cherries' pattern list.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    red, _ = _lookup_group('berries and cherries', 'five-seven', 'gem_red')
-    blue, _ = _lookup_group('berries and cherries', 'five-seven', 'gem_blue')
-    return red + blue, False
+    return _lookup_combined_group('berries and cherries', 'five-seven', ('gem_red', 'gem_blue'), catalog)
 
 
-def blaze() -> tuple[list[int], bool]:
+def blaze(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for blaze pattern '★ Karambit | Case Hardened'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('case hardened', 'karambit', 'blaze')
+    return _lookup_group('case hardened', 'karambit', 'blaze', catalog)
 
 
-def fade(weapon: str) -> Optional[tuple[list[int], bool]]:
+def fade(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Return a pattern list for fade-highlighted skins.
 
     :param weapon: The weapon for which to return the pattern list
     :type weapon: str
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
     """
 
-    weapon_options = {
-        'awp': ('fade',),
-        'karambit': ('fade',),
-        'm9 bayonet': ('fade',),
-        'm4a1-s': ('fade',),
-        'talon knife': ('fade',),
-    }
+    return _lookup_first_group(weapon, 'fade', catalog)
+
 
-    weapon_normalized = weapon.lower()
-    skins = weapon_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, 'fade', skins)
+def fade_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Return the pattern lists for fade-highlighted skins, for every supported weapon at once.
 
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-def fire_and_ice(weapon: str) -> Optional[tuple[list[int], bool]]:
+    :return: Read-only mapping of weapon to its pattern tuple and a boolean indicating if the tuple is ordered.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
+    """
+
+    return _lookup_all_groups('fade', catalog)
+
+
+def fire_and_ice(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Return a pattern list for 1st and 2nd max fire & ice pattern 'Marble Fade' skins.
     WARNING: This is only available for Bayonet, Flip Knife, Gut Knife & Karambit!
 
     :param weapon: The weapon for which to return the pattern list
     :type weapon: str
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
     """
 
-    weapon_options = {
-        'bayonet': ('marble fade',),
-        'flip knife': ('marble fade',),
-        'gut knife': ('marble fade',),
-        'karambit': ('marble fade',),
-    }
+    return _lookup_first_group(weapon, 'fire_and_ice', catalog)
+
 
-    weapon_normalized = weapon.lower()
-    skins = weapon_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, 'fire_and_ice', skins)
+def fire_and_ice_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Return the pattern lists for 1st and 2nd max fire & ice pattern 'Marble Fade' skins, for every supported weapon
+    at once.
 
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-def gem_black(weapon: str) -> Optional[tuple[list[int], bool]]:
+    :return: Read-only mapping of weapon to its pattern tuple and a boolean indicating if the tuple is ordered.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
+    """
+
+    return _lookup_all_groups('fire_and_ice', catalog)
+
+
+def gem_black(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Return a pattern list for gem black 'Scorched' and other niece skins.
 
     :param weapon: The weapon for which to return the pattern list
     :type weapon: str
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
     """
 
-    weapon_options = {
-        'classic knife': ('scorched',),
-        'desert eagle': ('serpent strike',),
-        'flip knife': ('scorched',),
-        'glock-18': ('grinder',),
-        'nomad knife': ('scorched',),
-        'paracord knife': ('scorched',),
-        'shadow daggers': ('scorched',),
-        'skeleton knife': ('scorched',),
-        'sport gloves': ('nocts',),
-        'stiletto knife': ('scorched',),
-        'ursus knife': ('scorched',),
-    }
+    return _lookup_first_group(weapon, 'gem_black', catalog)
+
 
-    weapon_normalized = weapon.lower()
-    skins = weapon_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, 'gem_black', skins)
+def gem_black_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Return the pattern lists for gem black 'Scorched' and other niece skins, for every supported weapon at once.
 
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-def gem_blue(weapon: str) -> Optional[tuple[list[int], bool]]:
+    :return: Read-only mapping of weapon to its pattern tuple and a boolean indicating if the tuple is ordered.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
+    """
+
+    return _lookup_all_groups('gem_black', catalog)
+
+
+def gem_blue(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Return a pattern list for bluegem 'Case Hardened' or 'Heat Treated' skins.
 
     :param weapon: The weapon for which to return the pattern list
     :type weapon: str
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
     """
 
-    skin_options = {
-        'ak-47': ('case hardened',),
-        'bayonet': ('case hardened',),
-        'bowie knife': ('case hardened',),
-        'butterfly knife': ('case hardened',),
-        'classic knife': ('case hardened',),
-        'desert eagle': ('heat treated',),
-        'falchion knife': ('case hardened',),
-        'five-seven': ('case hardened', 'heat treated'),
-        'flip knife': ('case hardened',),
-        'gut knife': ('case hardened',),
-        'huntsman knife': ('case hardened',),
-        'hydra gloves': ('case hardened',),
-        'karambit': ('case hardened',),
-        'm9 bayonet': ('case hardened',),
-        'mac-10': ('case hardened',),
-        'navaja knife': ('case hardened',),
-        'nomad knife': ('case hardened',),
-        'paracord knife': ('case hardened',),
-        'shadow daggers': ('case hardened',),
-        'skeleton knife': ('case hardened',),
-        'stiletto knife': ('case hardened',),
-        'survival knife': ('case hardened',),
-        'talon knife': ('case hardened',),
-        'ursus knife': ('case hardened',),
-    }
+    return _lookup_first_group(weapon, 'gem_blue', catalog)
 
-    weapon_normalized = weapon.lower()
-    skins = skin_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, 'gem_blue', skins)
 
+def gem_blue_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Return the pattern lists for bluegem 'Case Hardened' or 'Heat Treated' skins, for every supported weapon at once.
+
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-def gem_diamond() -> tuple[list[int], bool]:
+    :return: Read-only mapping of weapon to its pattern tuple and a boolean indicating if the tuple is ordered.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
+    """
+
+    return _lookup_all_groups('gem_blue', catalog)
+
+
+def gem_diamond(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for diamondgem 'Karambit | Gamma Doppler'.
     WARN: YOU HAVE TO VERIFY, THIS IS ONLY P1 GAMMA DOPPLERS!
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('gamma doppler', 'karambit', 'gem_diamond')
+    return _lookup_group('gamma doppler', 'karambit', 'gem_diamond', catalog)
 
 
-def gem_gold(weapon: str) -> Optional[tuple[list[int], bool]]:
+def gem_gold(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Return a pattern list for goldgem 'Case Hardened' or 'Heat Treated' skins.
 
     :param weapon: The weapon for which to return the pattern list
     :type weapon: str
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
     """
 
-    skin_options = {
-        'ak-47': ('case hardened',),
-        'bayonet': ('case hardened',),
-        'five-seven': ('case hardened',),
-        'karambit': ('case hardened',),
-        'mp7': ('amberline',),
-    }
+    return _lookup_first_group(weapon, 'gem_gold', catalog)
+
 
-    weapon_normalized = weapon.lower()
-    skins = skin_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, 'gem_gold', skins)
+def gem_gold_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Return the pattern lists for goldgem 'Case Hardened' or 'Heat Treated' skins, for every supported weapon at once.
 
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-def gem_green() -> tuple[list[int], bool]:
+    :return: Read-only mapping of weapon to its pattern tuple and a boolean indicating if the tuple is ordered.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
+    """
+
+    return _lookup_all_groups('gem_gold', catalog)
+
+
+def gem_green(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for max green 'SSG 08 | Acid Fade'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('acid fade', 'ssg 08', 'gem_green')
+    return _lookup_group('acid fade', 'ssg 08', 'gem_green', catalog)
 
 
-def gem_orange() -> tuple[list[int], bool]:
+def gem_orange(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for max orange 'Desert Eagle | Serpent Strike'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('serpent strike', 'desert eagle', 'gem_orange')
+    return _lookup_group('serpent strike', 'desert eagle', 'gem_orange', catalog)
 
 
-def gem_pink() -> tuple[list[int], bool]:
+def gem_pink(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for max pink 'Glock-18 | Pink DDPAT'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('pink ddpat', 'glock-18', 'gem_pink')
+    return _lookup_group('pink ddpat', 'glock-18', 'gem_pink', catalog)
 
 
-def gem_purple(weapon: str) -> Optional[tuple[list[int], bool]]:
+def gem_purple(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Return a pattern list for purplegem 'Sandstorm' or 'Heat Treated' skins.
 
     :param weapon: The weapon for which to return the pattern list
     :type weapon: str
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
     """
 
-    skin_options = {
-        'desert eagle': ('heat treated',),
-        'galil ar': ('sandstorm',),
-        'tec-9': ('sandstorm',),
-    }
+    return _lookup_first_group(weapon, 'gem_purple', catalog)
+
+
+def gem_purple_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Return the pattern lists for purplegem 'Sandstorm' or 'Heat Treated' skins, for every supported weapon at once.
+
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: Read-only mapping of weapon to its pattern tuple and a boolean indicating if the tuple is ordered.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
+    """
 
-    weapon_normalized = weapon.lower()
-    skins = skin_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, 'gem_purple', skins)
+    return _lookup_all_groups('gem_purple', catalog)
 
 
-def gem_white(weapon: str) -> Optional[tuple[list[int], bool]]:
+def gem_white(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Return a pattern list for whitegem 'Urban Masked' and other niece skins.
 
     :param weapon: The weapon for which to return the pattern list
     :type weapon: str
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: Optional[tuple[list[int], bool]]
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: Optional[tuple[tuple[int, ...], bool]]
     """
 
-    skin_options = {
-        'butterfly knife': ('urban masked',),
-        'classic knife': ('urban masked',),
-        'flip knife': ('urban masked',),
-        'glock-18': ('trace lock',),
-        'karambit': ('urban masked',),
-        'm9 bayonet': ('urban masked',),
-        'mac-10': ('snow splash',),
-        'mp7': ('amberline',),
-        'stiletto knife': ('urban masked',),
-        'skeleton knife': ('urban masked',),
-    }
+    return _lookup_first_group(weapon, 'gem_white', catalog)
+
+
+def gem_white_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Return the pattern lists for whitegem 'Urban Masked' and other niece skins, for every supported weapon at once.
+
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: Read-only mapping of weapon to its pattern tuple and a boolean indicating if the tuple is ordered.
+    :rtype: Mapping[str, tuple[tuple[int, ...], bool]]
+    """
 
-    weapon_normalized = weapon.lower()
-    skins = skin_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, 'gem_white', skins)
+    return _lookup_all_groups('gem_white', catalog)
 
 
-def hive_blue() -> tuple[list[int], bool]:
+def hive_blue(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for max blue 'AWP | Electric Hive'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('electric hive', 'awp', 'blue_hive')
+    return _lookup_group('electric hive', 'awp', 'blue_hive', catalog)
 
 
-def hive_orange() -> tuple[list[int], bool]:
+def hive_orange(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for max orange 'AWP | Electric Hive'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('electric hive', 'awp', 'orange_hive')
+    return _lookup_group('electric hive', 'awp', 'orange_hive', catalog)
 
 
-def moonrise() -> tuple[list[int], bool]:
+def moonrise(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for star pattern 'Glock-18 | Moonrise'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('moonrise', 'glock-18', 'star')
+    return _lookup_group('moonrise', 'glock-18', 'star', catalog)
 
 
-def paw() -> tuple[list[int], bool]:
+def paw(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for golden cat and stoner cat pattern 'AWP | PAW'.
 
     Golden Cat: [41, 350] // Stoner Cat: [420]
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    golden, _ = _lookup_group('paw', 'awp', 'golden_cat')
-    stoner, _ = _lookup_group('paw', 'awp', 'stoner_cat')
-    return golden + stoner, False
+    return _lookup_combined_group('paw', 'awp', ('golden_cat', 'stoner_cat'), catalog)
 
 
-def phoenix() -> tuple[list[int], bool]:
+def phoenix(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return a pattern list for best pos visible phoenix 'Galil AR | Phoenix Blacklight'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('phoenix blacklight', 'galil ar', 'phoenix')
+    return _lookup_group('phoenix blacklight', 'galil ar', 'phoenix', catalog)
 
 
-def pussy() -> tuple[list[int], bool]:
+def pussy(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Return pattern list for pussy pattern 'Five-SeveN | Kami'.
 
-    :return: A list of patterns that are special for the skin and a boolean indicating if the list is ordered.
-    :rtype: tuple[list[int], bool]
+    :param catalog: Catalog to look up instead of the default one.
+    :type catalog: Optional[Catalog]
+
+    :return: A tuple of patterns that are special for the skin and a boolean indicating if the tuple is ordered.
+    :rtype: tuple[tuple[int, ...], bool]
     """
 
-    return _lookup_group('kami', 'five-seven', 'pussy')
+    return _lookup_group('kami', 'five-seven', 'pussy', catalog)
 
 
 if __name__ == '__main__':
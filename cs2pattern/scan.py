@@ -0,0 +1,392 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import csv
+import json
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Iterable, NamedTuple, Optional, Union
+
+from cs2pattern.check import PatternInfo, check_rare_many, could_be_rare, warmup
+
+
+FORMATS = ('csv', 'tsv', 'jsonl')
+RESULT_COLUMNS = ('rare', 'name', 'rank', 'total')
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_BATCH_SIZE = 4096
+
+_DELIMITERS = {'csv': ',', 'tsv': '\t'}
+
+
+class ScanStats(NamedTuple):
+    """
+    Summary of a finished scan.
+    """
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class _Job(NamedTuple):
+    """
+    A byte range of the input file together with everything a worker needs to process it.
+    """
+
+    path: str
+    start: int
+    end: int
+    fmt: str
+    hash_key: object
+    pattern_key: object
+
+
+def detect_format(path: Path) -> str:
+    """
+    Derive the input format from the file extension.
+
+    :param path: Path of the input file.
+    :type path: Path
+
+    :return: One of `FORMATS`.
+    :rtype: str
+
+    :raises ValueError: If the extension does not identify a supported format.
+    """
+
+    suffix = path.suffix.lower()
+    if suffix == '.csv':
+        return 'csv'
+    if suffix in ('.tsv', '.tab'):
+        return 'tsv'
+    if suffix in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    raise ValueError(f"Cannot detect the format of '{path}', pass one of: {', '.join(FORMATS)}")
+
+
+def _split_ranges(buffer, start: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split `buffer[start:]` into byte ranges of roughly `chunk_size` bytes that end on line boundaries.
+
+    :param buffer: The mapped input file.
+    :param start: Offset of the first data line.
+    :type start: int
+    :param chunk_size: Target size of a range in bytes.
+    :type chunk_size: int
+
+    :return: List of (start, end) offsets.
+    :rtype: list[tuple[int, int]]
+    """
+
+    ranges = []
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _format_values(info: PatternInfo, delimiter: str) -> str:
+    rank, total = info.order or ('', '')
+    return delimiter.join(('', 'true' if info.rare else 'false', info.name or '', str(rank), str(total)))
+
+
+def _parse_pattern(value) -> int:
+    # Unparseable seeds resolve to "not rare" instead of failing the whole batch
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return -1
+
+
+def _resolve_columns(header_line: str, fmt: str, hash_column: str, pattern_column: str) -> tuple[int, int]:
+    """
+    Resolve the market hash and pattern column names to their positions in a CSV or TSV header.
+
+    :param header_line: The header line without line break.
+    :type header_line: str
+    :param fmt: 'csv' or 'tsv'.
+    :type fmt: str
+    :param hash_column: Name of the column holding the market hash.
+    :type hash_column: str
+    :param pattern_column: Name of the column holding the pattern.
+    :type pattern_column: str
+
+    :return: Positions of both columns.
+    :rtype: tuple[int, int]
+
+    :raises ValueError: If a column is missing.
+    """
+
+    header = next(csv.reader([header_line], delimiter=_DELIMITERS[fmt]))
+    for column in (hash_column, pattern_column):
+        if column not in header:
+            raise ValueError(f"{fmt.upper()} header has no column '{column}'.")
+    return header.index(hash_column), header.index(pattern_column)
+
+
+def _format_header(header_line: str, fmt: str) -> str:
+    delimiter = _DELIMITERS[fmt]
+    return header_line + delimiter + delimiter.join(RESULT_COLUMNS) + "\n"
+
+
+def _annotate_lines(lines: list[str], fmt: str, hash_key: Union[str, int], pattern_key: Union[str, int],
+                    only_rare: bool = False) -> list[str]:
+    """
+    Check a batch of input lines and format the annotated output lines.
+
+    :param lines: Non-empty input lines without line breaks.
+    :type lines: list[str]
+    :param fmt: One of `FORMATS`.
+    :type fmt: str
+    :param hash_key: Column position (CSV, TSV) or key (JSONL) of the market hash.
+    :type hash_key: Union[str, int]
+    :param pattern_key: Column position (CSV, TSV) or key (JSONL) of the pattern.
+    :type pattern_key: Union[str, int]
+    :param only_rare: Drop rows that are not rare before formatting them.
+    :type only_rare: bool
+
+    :return: The annotated lines, each ending with a line break.
+    :rtype: list[str]
+    """
+
+    if fmt == 'jsonl':
+        records = []
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            # Like short CSV rows, lines that are no JSON object are not rare and passed through unchanged
+            records.append(record if isinstance(record, dict) else None)
+        rows = [
+            (str(record.get(hash_key, '')), _parse_pattern(record.get(pattern_key))) if record is not None else ('', -1)
+            for record in records
+        ]
+    else:
+        records = list(csv.reader(lines, delimiter=_DELIMITERS[fmt]))
+        last = max(hash_key, pattern_key)
+        rows = [
+            (record[hash_key], _parse_pattern(record[pattern_key])) if len(record) > last else ('', -1)
+            for record in records
+        ]
+
+    if only_rare:
+        # Most rows are rejected by the fast filter and never reach normalization
+        candidates = [position for position, row in enumerate(rows) if could_be_rare(*row)]
+        lines = [lines[position] for position in candidates]
+        records = [records[position] for position in candidates]
+        rows = [rows[position] for position in candidates]
+
+    results = check_rare_many(rows)
+    if only_rare:
+        hits = [position for position, rare in enumerate(results.rare) if rare]
+        lines = [lines[position] for position in hits]
+        records = [records[position] for position in hits]
+        results = [results[position] for position in hits]
+
+    if fmt == 'jsonl':
+        output = []
+        for line, record, info in zip(lines, records, results):
+            if record is None:
+                output.append(line + "\n")
+                continue
+            rank, total = info.order or (None, None)
+            record.update(rare=info.rare, name=info.name, rank=rank, total=total)
+            output.append(json.dumps(record, ensure_ascii=False) + "\n")
+        return output
+
+    delimiter = _DELIMITERS[fmt]
+    return [line + _format_values(info, delimiter) + "\n" for line, info in zip(lines, results)]
+
+
+def _scan_range(job: _Job) -> tuple[bytes, int]:
+    """
+    Check every row of one byte range of the input file.
+
+    :param job: The range to process.
+    :type job: _Job
+
+    :return: The output lines for the range and the number of rows.
+    :rtype: tuple[bytes, int]
+    """
+
+    with open(job.path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            text = buffer[job.start:job.end].decode("utf-8")
+    # Only "\n" ends a row, like in `_split_ranges`, str.splitlines would also split on U+2028 and friends
+    lines = [line.rstrip("\r") for line in text.split("\n")]
+    lines = [line for line in lines if line.strip()]
+
+    output = _annotate_lines(lines, job.fmt, job.hash_key, job.pattern_key)
+    return "".join(output).encode("utf-8"), len(output)
+
+
+def scan_file(path: Path, output: BinaryIO, fmt: Optional[str] = None, workers: Optional[int] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, ordered: bool = True, hash_column: str = 'market_hash',
+              pattern_column: str = 'pattern') -> ScanStats:
+    """
+    Annotate a large CSV, TSV or JSONL file with rarity data using a pool of worker processes.
+
+    The file is memory-mapped and split into byte ranges on line boundaries, every worker loads the catalog once
+    and processes whole ranges. CSV and TSV rows get the columns `rare`, `name`, `rank` and `total` appended
+    (including the header), JSONL objects get the same keys added. Rows must not contain embedded line breaks.
+    Rows that cannot be read (short CSV rows, JSONL lines that are no JSON object) are passed through as not rare.
+
+    :param path: Path of the input file.
+    :type path: Path
+    :param output: Binary stream receiving the annotated rows.
+    :type output: BinaryIO
+    :param fmt: Input format, one of `FORMATS`, detected from the extension if omitted.
+    :type fmt: Optional[str]
+    :param workers: Number of worker processes, defaults to the number of CPUs.
+    :type workers: Optional[int]
+    :param chunk_size: Target size of a byte range in bytes.
+    :type chunk_size: int
+    :param ordered: Keep the input order, otherwise ranges are written as soon as they are done.
+    :type ordered: bool
+    :param hash_column: Name of the column or key holding the market hash.
+    :type hash_column: str
+    :param pattern_column: Name of the column or key holding the pattern.
+    :type pattern_column: str
+
+    :return: Number of rows and elapsed seconds.
+    :rtype: ScanStats
+
+    :raises ValueError: If the format is unknown, the chunk size is not positive or a column is missing.
+    """
+
+    started = time.perf_counter()
+    path = Path(path)
+    fmt = detect_format(path) if fmt is None else fmt
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of: {', '.join(FORMATS)}")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if path.stat().st_size == 0:
+        return ScanStats(0, time.perf_counter() - started)
+
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            data_start = 0
+            hash_key, pattern_key = hash_column, pattern_column
+            if fmt != 'jsonl':
+                header_end = buffer.find(b"\n")
+                data_start = len(buffer) if header_end == -1 else header_end + 1
+                header_line = buffer[:data_start].decode("utf-8-sig").rstrip("\r\n")
+                hash_key, pattern_key = _resolve_columns(header_line, fmt, hash_column, pattern_column)
+                output.write(_format_header(header_line, fmt).encode("utf-8"))
+            ranges = _split_ranges(buffer, data_start, chunk_size)
+
+    jobs = [_Job(str(path), start, end, fmt, hash_key, pattern_key) for start, end in ranges]
+    rows = 0
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=warmup) as executor:
+        if ordered:
+            results = executor.map(_scan_range, jobs)
+        else:
+            results = (future.result() for future in as_completed([executor.submit(_scan_range, job) for job in jobs]))
+        for chunk, count in results:
+            output.write(chunk)
+            rows += count
+
+    output.flush()
+    return ScanStats(rows, time.perf_counter() - started)
+
+
+def check_stream(source: BinaryIO, output: BinaryIO, fmt: str = 'csv', header: bool = True,
+                 hash_column: Optional[Union[str, int]] = None, pattern_column: Optional[Union[str, int]] = None,
+                 only_rare: bool = False, batch_size: int = DEFAULT_BATCH_SIZE) -> ScanStats:
+    """
+    Annotate a stream of CSV, TSV or JSONL records, e.g. stdin to stdout, in constant memory.
+
+    Lines are read and checked in batches of `batch_size`, every batch is written with a single call and flushed,
+    so memory use only depends on the batch size and results show up as soon as their batch is checked.
+
+    :param source: Binary stream of input lines.
+    :type source: BinaryIO
+    :param output: Binary stream receiving the annotated lines.
+    :type output: BinaryIO
+    :param fmt: Input format, one of `FORMATS`.
+    :type fmt: str
+    :param header: Whether CSV and TSV input starts with a header line.
+    :type header: bool
+    :param hash_column: Column name (with header), 0-based column position (without header) or JSONL key of the
+                        market hash, defaults to 'market_hash' or the first column.
+    :type hash_column: Optional[Union[str, int]]
+    :param pattern_column: Column name (with header), 0-based column position (without header) or JSONL key of the
+                           pattern, defaults to 'pattern' or the second column.
+    :type pattern_column: Optional[Union[str, int]]
+    :param only_rare: Drop rows that are not rare before formatting them.
+    :type only_rare: bool
+    :param batch_size: Number of lines checked at once.
+    :type batch_size: int
+
+    :return: Number of rows read and elapsed seconds.
+    :rtype: ScanStats
+
+    :raises ValueError: If the format is unknown, the batch size is not positive or a column cannot be resolved.
+    """
+
+    started = time.perf_counter()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}', expected one of: {', '.join(FORMATS)}")
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    lines: Iterable[str] = (line.decode("utf-8").rstrip("\r\n") for line in source)
+    lines = (line for line in lines if line.strip())
+
+    if fmt == 'jsonl':
+        hash_key = 'market_hash' if hash_column is None else hash_column
+        pattern_key = 'pattern' if pattern_column is None else pattern_column
+    elif header:
+        header_line = next(lines, None)
+        if header_line is None:
+            return ScanStats(0, time.perf_counter() - started)
+        header_line = header_line.lstrip("\ufeff")
+        hash_key, pattern_key = _resolve_columns(
+            header_line,
+            fmt,
+            'market_hash' if hash_column is None else str(hash_column),
+            'pattern' if pattern_column is None else str(pattern_column),
+        )
+        output.write(_format_header(header_line, fmt).encode("utf-8"))
+    else:
+        try:
+            hash_key = 0 if hash_column is None else int(hash_column)
+            pattern_key = 1 if pattern_column is None else int(pattern_column)
+        except ValueError:
+            raise ValueError("Without a header, columns must be given as 0-based positions.") from None
+
+    rows = 0
+    while True:
+        batch = list(islice(lines, batch_size))
+        if not batch:
+            break
+        rows += len(batch)
+        annotated = _annotate_lines(batch, fmt, hash_key, pattern_key, only_rare=only_rare)
+        if annotated:
+            output.write("".join(annotated).encode("utf-8"))
+        # Block buffered pipes would otherwise hold results back until the input ends
+        output.flush()
+
+    output.flush()
+    return ScanStats(rows, time.perf_counter() - started)
+
+
+if __name__ == '__main__':
+    exit(1)
@@ -0,0 +1,223 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+from typing import Iterable, Mapping, NamedTuple, Optional
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError("cs2pattern.vectorized requires NumPy, install it with 'pip install numpy'.") from exc
+
+from cs2pattern.check import SEED_SLOTS, Catalog, _get_catalog, _normalize_item
+
+
+NO_GROUP = -1
+
+
+class _Tables(NamedTuple):
+    """
+    Item and group numbering of one catalog together with its item x seed lookup tables.
+
+    Item codes are positions in `items`, group ids are positions in `groups`.
+    """
+
+    items: tuple[tuple[str, str], ...]
+    groups: tuple[str, ...]
+    item_codes: dict[tuple[str, str], int]
+    names: Mapping[str, tuple[str, str]]
+    group_table: np.ndarray
+    rank_table: np.ndarray
+    total_table: np.ndarray
+
+
+def _compile_tables(catalog: Catalog) -> _Tables:
+    """
+    Compile the item x seed lookup tables from the dense per-item slot arrays of a catalog.
+
+    Every table has one extra row and one extra column acting as sentinels for unknown items
+    and out of range seeds, so lookups are a single gather without branching.
+
+    :param catalog: The catalog to compile.
+    :type catalog: Catalog
+
+    :return: The numbering and the group id, rank and total tables with shape (len(items) + 1, SEED_SLOTS + 1).
+    :rtype: _Tables
+    """
+
+    items = tuple((skin, weapon) for skin, weapons in catalog.pattern_map.items() for weapon in weapons)
+    groups = tuple(sorted({
+        group.get('name')
+        for weapons in catalog.pattern_map.values()
+        for weapon_groups in weapons.values()
+        for group in weapon_groups
+    }))
+    item_codes = {item: code for code, item in enumerate(items)}
+
+    shape = (len(items) + 1, SEED_SLOTS + 1)
+    group_table = np.full(shape, NO_GROUP, dtype=np.int16)
+    rank_table = np.zeros(shape, dtype=np.int16)
+    total_table = np.zeros(shape, dtype=np.int16)
+
+    group_ids = {name: group_id for group_id, name in enumerate(groups)}
+    for (skin, weapon), (slots, records) in catalog.dense.items():
+        code = item_codes[(skin, weapon)]
+        codes = np.frombuffer(slots, dtype=np.uint16)
+        for slot, record in enumerate(records, start=1):
+            seeds = np.flatnonzero(codes == slot)
+            group_table[code, seeds] = group_ids[record.name]
+            rank_table[code, seeds] = record.rank or 0
+            total_table[code, seeds] = record.total or 0
+
+    for table in (group_table, rank_table, total_table):
+        table.flags.writeable = False
+    return _Tables(items, groups, item_codes, catalog.names, group_table, rank_table, total_table)
+
+
+def _get_tables() -> _Tables:
+    return _get_catalog().derived('vectorized.tables', _compile_tables)
+
+
+def __getattr__(name: str):
+    # Numbering follows the current catalog, so it is resolved on access instead of being bound at import
+    if name == 'ITEMS':
+        return _get_tables().items
+    if name == 'GROUPS':
+        return _get_tables().groups
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def item_code(market_hash: str) -> int:
+    """
+    Resolve a market hash to its item code.
+
+    :param market_hash: The market hash of the item.
+    :type market_hash: str
+
+    :return: The position of the item inside `ITEMS`, or -1 if the item is not part of the catalog.
+    :rtype: int
+    """
+
+    return _item_code(_get_tables(), market_hash)
+
+
+def _item_code(tables: _Tables, market_hash: str) -> int:
+    item = _normalize_item(market_hash, tables.names)
+    if item is None:
+        return -1
+
+    weapon, skin = item
+    return tables.item_codes.get((skin, weapon), -1)
+
+
+def encode_items(market_hashes: Iterable[str]) -> np.ndarray:
+    """
+    Resolve many market hashes to item codes, normalizing each distinct name only once.
+
+    :param market_hashes: Iterable of market hashes.
+    :type market_hashes: Iterable[str]
+
+    :return: Array of item codes, -1 for items that are not part of the catalog.
+    :rtype: np.ndarray
+    """
+
+    tables = _get_tables()
+    codes: dict[str, int] = {}
+    result = []
+    for market_hash in market_hashes:
+        code = codes.get(market_hash)
+        if code is None:
+            code = codes[market_hash] = _item_code(tables, market_hash)
+        result.append(code)
+    return np.asarray(result, dtype=np.int32)
+
+
+def _encode_dictionary(tables: _Tables, values: Iterable, indices: np.ndarray,
+                       cache: Optional[dict] = None) -> np.ndarray:
+    """
+    Resolve dictionary encoded market hashes to item codes, normalizing every distinct value once.
+
+    :param tables: Tables of the catalog to encode against.
+    :type tables: _Tables
+    :param values: The distinct values (categories) of the column.
+    :type values: Iterable
+    :param indices: Position of every row's value inside `values`, negative for missing values.
+    :type indices: np.ndarray
+    :param cache: Optional mapping of already resolved values to item codes, shared between calls.
+    :type cache: Optional[dict]
+
+    :return: Array of item codes, -1 for missing values and items that are not part of the catalog.
+    :rtype: np.ndarray
+    """
+
+    if cache is None:
+        cache = {}
+    codes = []
+    for value in values:
+        code = cache.get(value)
+        if code is None:
+            code = cache[value] = _item_code(tables, value) if isinstance(value, str) else -1
+        codes.append(code)
+    # The trailing sentinel turns negative indices into -1 codes with a single gather
+    codes.append(-1)
+    return np.asarray(codes, dtype=np.int32)[np.where(indices < 0, -1, indices)]
+
+
+def _as_seeds(values) -> np.ndarray:
+    """
+    Convert seeds of any numeric dtype to integers, mapping missing and non-integral values to -1.
+
+    :param values: Array-like of seeds.
+    :type values: array-like
+
+    :return: Integer array of seeds.
+    :rtype: np.ndarray
+    """
+
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.integer):
+        return values
+    values = values.astype(np.float64)
+    valid = np.isfinite(values) & (values == np.floor(values))
+    return np.where(valid, values, -1).astype(np.intp)
+
+
+def annotate(item_codes, seeds) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Annotate arrays of item codes and seeds with their rare pattern group, rank and total.
+
+    Item codes and group ids are only stable for one catalog, encode and annotate again after a reload.
+
+    :param item_codes: Integer array of item codes as returned by `encode_items`.
+    :type item_codes: array-like
+    :param seeds: Integer array of seeds, broadcastable against `item_codes`.
+    :type seeds: array-like
+
+    :return: Group ids (positions in `GROUPS`, `NO_GROUP` if not rare), ranks and totals (0 if unordered or not rare).
+    :rtype: tuple[np.ndarray, np.ndarray, np.ndarray]
+
+    :raises TypeError: If the item codes or seeds are not integer arrays.
+    """
+
+    codes = np.asarray(item_codes)
+    seeds = np.asarray(seeds)
+    for name, values in (('item_codes', codes), ('seeds', seeds)):
+        if values.size and not np.issubdtype(values.dtype, np.integer):
+            raise TypeError(f"{name} must be an integer array, got dtype '{values.dtype}'.")
+    return _annotate(_get_tables(), codes, seeds)
+
+
+def _annotate(tables: _Tables, codes: np.ndarray, seeds: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    codes = codes.astype(np.intp, copy=False)
+    seeds = seeds.astype(np.intp, copy=False)
+    item_count = len(tables.items)
+    rows = np.where((codes >= 0) & (codes < item_count), codes, item_count)
+    columns = np.where((seeds >= 0) & (seeds < SEED_SLOTS), seeds, SEED_SLOTS)
+    return tables.group_table[rows, columns], tables.rank_table[rows, columns], tables.total_table[rows, columns]
+
+
+if __name__ == '__main__':
+    exit(1)
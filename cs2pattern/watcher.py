@@ -0,0 +1,125 @@
+__author__ = "Lukas Mahler"
+__version__ = "0.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Development"
+
+
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+from cs2pattern.check import ICON_FILE, PATTERN_FILE, reload_catalog
+
+
+class CatalogWatcher:
+    """
+    Poll the catalog sources for changes and hot reload the catalog whenever they change.
+
+    Changes are detected by comparing modification time and size of `pattern.json` and `icons.json`.
+    The state at `start` (or construction) is taken as already loaded, so only later changes trigger a reload.
+    A failed reload, e.g. of a half written file, keeps the current catalog and is retried on the next change.
+    """
+
+    def __init__(self, interval: float = 5.0, pattern_file: Optional[Path] = None, icon_file: Optional[Path] = None,
+                 on_reload: Optional[Callable[[], None]] = None,
+                 on_error: Optional[Callable[[Exception], None]] = None):
+        """
+        :param interval: Seconds between two polls.
+        :type interval: float
+        :param pattern_file: Path of the `pattern.json` to watch, defaults to the bundled one.
+        :type pattern_file: Optional[Path]
+        :param icon_file: Path of the `icons.json` to watch, defaults to the bundled one.
+        :type icon_file: Optional[Path]
+        :param on_reload: Called after every successful reload.
+        :type on_reload: Optional[Callable[[], None]]
+        :param on_error: Called with the exception of every failed reload.
+        :type on_error: Optional[Callable[[Exception], None]]
+        """
+
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0.")
+
+        self.interval = interval
+        self.pattern_file = PATTERN_FILE if pattern_file is None else Path(pattern_file)
+        self.icon_file = ICON_FILE if icon_file is None else Path(icon_file)
+        self.on_reload = on_reload
+        self.on_error = on_error
+        self._stamp = self._read_stamp()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _read_stamp(self) -> Optional[tuple[int, ...]]:
+        try:
+            pattern_stat = os.stat(self.pattern_file)
+            icon_stat = os.stat(self.icon_file)
+        except OSError:
+            # The sources may briefly disappear while being replaced
+            return None
+        return pattern_stat.st_mtime_ns, pattern_stat.st_size, icon_stat.st_mtime_ns, icon_stat.st_size
+
+    def check(self) -> bool:
+        """
+        Poll the sources once and reload the catalog if they changed since the last poll.
+
+        :return: True if the catalog was reloaded.
+        :rtype: bool
+        """
+
+        stamp = self._read_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+
+        self._stamp = stamp
+        try:
+            reload_catalog(self.pattern_file, self.icon_file)
+        except Exception as exc:
+            if self.on_error is not None:
+                self.on_error(exc)
+            return False
+
+        if self.on_reload is not None:
+            self.on_reload()
+        return True
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> 'CatalogWatcher':
+        """
+        Start polling in a daemon thread.
+
+        :return: The watcher itself.
+        :rtype: CatalogWatcher
+        """
+
+        if self._thread is not None and self._thread.is_alive():
+            return self
+
+        self._stamp = self._read_stamp()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cs2pattern-catalog-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop polling and wait for the polling thread to finish.
+        """
+
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> 'CatalogWatcher':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+if __name__ == '__main__':
+    exit(1)
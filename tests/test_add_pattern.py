@@ -0,0 +1,132 @@
+__author__ = "Lukas Mahler"
+__version__ = "1.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Production"
+
+
+import importlib.util
+import json
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+TOUCHED = ("cs2pattern/pattern.json", "cs2pattern/icons.json", "cs2pattern/modular.py", "cs2pattern/__init__.py",
+           "tests/test_pattern.py")
+COPIED = (*TOUCHED, "cs2pattern/check.py")
+
+_spec = importlib.util.spec_from_file_location("add_pattern", ROOT / "tools" / "add_pattern.py")
+add_pattern = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(add_pattern)
+
+
+class TestBulkImport(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        for name in COPIED:
+            (self.root / name).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(ROOT / name, self.root / name)
+
+        patcher = mock.patch.multiple(
+            add_pattern,
+            ROOT=self.root,
+            PATTERN_FILE=self.root / "cs2pattern" / "pattern.json",
+            ICON_FILE=self.root / "cs2pattern" / "icons.json",
+            CHECK_FILE=self.root / "cs2pattern" / "check.py",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _snapshot(self) -> dict[str, bytes]:
+        return {name: (self.root / name).read_bytes() for name in COPIED}
+
+    def _manifest(self, name: str, content: str) -> Path:
+        path = self.root / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_csv_manifest_writes_every_file_once(self):
+        manifest = self._manifest("groups.csv", (
+            "skin,name,weapon,patterns,ordered,helper,icon\n"
+            "Marble Fade,fire_and_ice_v2,bayonet,12 34 56,true,fire_and_ice_v2,x\n"
+            "Marble Fade,fire_and_ice_v2,karambit,\"78, 90, 78\",,,\n"
+            "Case Hardened,blaze_v2,ak-47,123 456,,blaze_v2,y\n"
+        ))
+        changes = add_pattern.load_manifest(manifest)
+        self.assertEqual([change.source for change in changes], ["groups.csv:2", "groups.csv:4"])
+
+        with mock.patch.object(Path, "write_text", side_effect=AssertionError("unstaged write")):
+            applied, written = add_pattern.apply_changes(changes)
+
+        self.assertEqual(sorted(path.relative_to(self.root).as_posix() for path in written), sorted(TOUCHED))
+        self.assertEqual(applied[0].notes, ["Removed duplicate pattern ids for 'karambit': [78, 90, 78] -> [78, 90]"])
+        pattern_data = json.loads((self.root / "cs2pattern" / "pattern.json").read_text(encoding="utf-8"))
+        self.assertIn({"name": "fire_and_ice_v2", "ordered": True, "pattern": [78, 90]},
+                      pattern_data["marble fade"]["karambit"])
+        self.assertIn("def blaze_v2(", (self.root / "cs2pattern" / "modular.py").read_text(encoding="utf-8"))
+        self.assertIn("fire_and_ice_v2_all", (self.root / "cs2pattern" / "__init__.py").read_text(encoding="utf-8"))
+        self.assertEqual(list(self.root.rglob("*.tmp")), [])
+
+    def test_failure_leaves_files_untouched(self):
+        before = self._snapshot()
+        manifest = self._manifest("groups.json", json.dumps([
+            {"skin": "Case Hardened", "name": "blaze_v2", "weapons": {"ak-47": [123]}, "helper": "blaze_v2"},
+            {"skin": "Case Hardened", "name": "gem_blue", "weapons": ["ak-47:5"]},
+        ]))
+
+        with self.assertRaisesRegex(add_pattern.PatternToolError, r"^groups\.json#2: Group 'gem_blue' already exists"):
+            add_pattern.apply_changes(add_pattern.load_manifest(manifest))
+        self.assertEqual(self._snapshot(), before)
+
+    def test_dry_run_and_validation(self):
+        before = self._snapshot()
+        change = add_pattern.PatternChange("Case Hardened", "blaze_v2", {"ak-47": [123]}, icon="y")
+        applied, written = add_pattern.apply_changes([change], dry_run=True)
+        self.assertEqual(applied[0].group, "blaze_v2")
+        self.assertEqual(len(written), 2)
+        self.assertEqual(self._snapshot(), before)
+
+        with self.assertRaisesRegex(add_pattern.PatternToolError, "defined more than once"):
+            with add_pattern._transaction():
+                data = add_pattern._load_pattern_data()
+                data["case hardened"]["ak-47"].append(dict(data["case hardened"]["ak-47"][0]))
+                add_pattern._write_pattern_data(data)
+        self.assertEqual(self._snapshot(), before)
+
+    def test_records_steam_spellings(self):
+        manifest = self._manifest("groups.json", json.dumps([
+            {"skin": "Printstream", "name": "white", "weapons": {"USP-S": [1], "m4a1-s": [2]}},
+            {"skin": "Kill Confirmed", "name": "red", "weapons": ["Usp-s:3"]},
+        ]))
+        applied, written = add_pattern.apply_changes(add_pattern.load_manifest(manifest))
+        self.assertEqual(applied[0].change.spellings, ["USP-S", "m4a1-s"])
+        self.assertIn(self.root / "cs2pattern" / "check.py", written)
+
+        check = (self.root / "cs2pattern" / "check.py").read_text(encoding="utf-8")
+        self.assertIn("    'usp-s': \"USP-S\",\n", check)
+        self.assertIn("    'm4a1-s': \"M4A1-S\",\n", check)
+        self.assertNotIn("printstream", check)
+
+    def test_invalid_manifests(self):
+        cases = {
+            "conflict.csv": "skin,name,weapon,patterns,ordered\nA,g,ak-47,1,true\nA,g,m4a4,2,false\n",
+            "range.csv": "skin,name,weapon,patterns\nA,g,ak-47,1001\n",
+            "columns.csv": "skin,name,weapon\nA,g,ak-47\n",
+            "weapons.json": json.dumps([{"skin": "A", "name": "g", "weapons": 5}]),
+            "empty.json": "[]",
+            "groups.txt": "",
+        }
+        for name, content in cases.items():
+            with self.subTest(manifest=name):
+                with self.assertRaises(add_pattern.PatternToolError):
+                    add_pattern.load_manifest(self._manifest(name, content))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+__author__ = "Lukas Mahler"
+__version__ = "1.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Production"
+
+
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from cs2pattern import aio, check_rare
+from tests.test_pattern import inputs
+
+ROWS = [args for _, args in inputs]
+
+
+async def _feed(rows, delay: float = 0.0, fail_after=None):
+    for position, row in enumerate(rows):
+        if position == fail_after:
+            raise RuntimeError("feed failed")
+        if delay:
+            await asyncio.sleep(delay)
+        yield row
+
+
+class TestStream(unittest.IsolatedAsyncioTestCase):
+
+    async def test_stream_matches_check_rare(self):
+        results = [info async for info in aio.check_rare_stream(_feed(ROWS), batch_size=7)]
+        self.assertEqual(results, [check_rare(*row) for row in ROWS])
+
+    async def test_stream_slow_feed(self):
+        rows = ROWS[:5]
+        results = [info async for info in aio.check_rare_stream(_feed(rows, delay=0.001), batch_size=100)]
+        self.assertEqual(results, [check_rare(*row) for row in rows])
+
+    async def test_stream_backpressure(self):
+        read = []
+
+        async def feed():
+            for row in ROWS:
+                read.append(row)
+                yield row
+
+        stream = aio.check_rare_stream(feed(), batch_size=2, max_buffer=3)
+        await stream.__anext__()
+        await asyncio.sleep(0.01)
+        # One batch taken by the consumer, a full buffer and one row waiting to be queued
+        self.assertLessEqual(len(read), 2 + 3 + 1)
+        await stream.aclose()
+
+    async def test_stream_feed_failure(self):
+        results = []
+        with self.assertRaises(RuntimeError):
+            async for info in aio.check_rare_stream(_feed(ROWS, fail_after=3), batch_size=2):
+                results.append(info)
+        self.assertEqual(results, [check_rare(*row) for row in ROWS[:3]])
+
+    async def test_stream_feed_cancelled(self):
+        async def feed():
+            yield ROWS[0]
+            raise asyncio.CancelledError()
+
+        results = []
+
+        async def consume():
+            async for info in aio.check_rare_stream(feed()):
+                results.append(info)
+
+        task = asyncio.ensure_future(consume())
+        self.addCleanup(task.cancel)
+        done, _ = await asyncio.wait({task}, timeout=3)
+        # The feed's CancelledError has to reach the consumer instead of leaving it waiting for more rows
+        self.assertIn(task, done)
+        self.assertTrue(task.cancelled())
+        self.assertEqual(results, [check_rare(*ROWS[0])])
+
+    async def test_stream_offloads_large_batches(self):
+        with ThreadPoolExecutor(1) as executor, mock.patch.object(executor, 'submit', wraps=executor.submit) as submit:
+            results = [
+                info async for info in aio.check_rare_stream(
+                    _feed(ROWS), batch_size=len(ROWS), executor=executor, offload_threshold=1,
+                )
+            ]
+        self.assertTrue(submit.called)
+        self.assertEqual(results, [check_rare(*row) for row in ROWS])
+
+    async def test_stream_rejects_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            await aio.check_rare_stream(_feed(ROWS), batch_size=0).__anext__()
+        with self.assertRaises(ValueError):
+            await aio.check_rare_stream(_feed(ROWS), max_buffer=0).__anext__()
+
+
+class TestBatcher(unittest.IsolatedAsyncioTestCase):
+
+    async def test_concurrent_calls_are_coalesced(self):
+        batcher = aio.PatternBatcher()
+        with mock.patch.object(aio, '_check_rows', wraps=aio._check_rows) as check_rows:
+            results = await asyncio.gather(*(batcher.check(*row) for row in ROWS))
+        self.assertEqual(check_rows.call_count, 1)
+        self.assertEqual(results, [check_rare(*row) for row in ROWS])
+
+    async def test_max_batch_size(self):
+        async with aio.PatternBatcher(max_batch_size=10) as batcher:
+            with mock.patch.object(aio, '_check_rows', wraps=aio._check_rows) as check_rows:
+                results = await asyncio.gather(*(batcher.check(*row) for row in ROWS))
+        self.assertEqual(check_rows.call_count, -(-len(ROWS) // 10))
+        self.assertEqual(results, [check_rare(*row) for row in ROWS])
+
+    async def test_max_delay_collects_later_calls(self):
+        batcher = aio.PatternBatcher(max_delay=0.05)
+
+        async def delayed(row):
+            await asyncio.sleep(0.001)
+            return await batcher.check(*row)
+
+        with mock.patch.object(aio, '_check_rows', wraps=aio._check_rows) as check_rows:
+            results = await asyncio.gather(batcher.check(*ROWS[0]), delayed(ROWS[1]))
+        self.assertEqual(check_rows.call_count, 1)
+        self.assertEqual(results, [check_rare(*row) for row in ROWS[:2]])
+
+    async def test_failure_reaches_every_caller(self):
+        batcher = aio.PatternBatcher()
+        with mock.patch.object(aio, '_check_rows', side_effect=RuntimeError("lookup failed")):
+            results = await asyncio.gather(*(batcher.check(*row) for row in ROWS[:3]), return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+    async def test_bad_row_only_fails_its_caller(self):
+        for offload_threshold in (aio.DEFAULT_OFFLOAD_THRESHOLD, 1):
+            with self.subTest(offload_threshold=offload_threshold):
+                batcher = aio.PatternBatcher(offload_threshold=offload_threshold)
+                with mock.patch.object(aio, '_check_rows', wraps=aio._check_rows) as check_rows:
+                    good, bad = await asyncio.gather(
+                        batcher.check(*ROWS[0]), batcher.check(None, 661), return_exceptions=True,
+                    )
+                self.assertEqual(check_rows.call_args_list[0].args[1], [ROWS[0], (None, 661)])
+                self.assertEqual(good, check_rare(*ROWS[0]))
+                self.assertIsInstance(bad, Exception)
+
+    async def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            aio.PatternBatcher(max_batch_size=0)
+        with self.assertRaises(ValueError):
+            aio.PatternBatcher(max_delay=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+__author__ = "Lukas Mahler"
+__version__ = "1.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Production"
+
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+from cs2pattern import check_rare
+from tests.test_pattern import inputs
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+@unittest.skipUnless(HAS_PYARROW, "PyArrow is not installed")
+class TestArrow(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        from cs2pattern import arrow
+        cls.pa = pa
+        cls.pq = pq
+        cls.arrow = arrow
+
+    def _table(self):
+        return self.pa.table(
+            {
+                'id': list(range(len(inputs))),
+                'market_hash': [args[0] for _, args in inputs],
+                'pattern': [args[1] for _, args in inputs],
+            }
+        )
+
+    def assertMatchesCheckRare(self, rows):
+        for row in rows:
+            with self.subTest(market_hash=row['market_hash'], pattern=row['pattern']):
+                expected = check_rare(row['market_hash'], row['pattern'])
+                self.assertEqual(row['group'], expected.name)
+                self.assertEqual((row['rank'], row['total']), expected.order or (None, None))
+
+    def test_annotate_batch_matches_check_rare(self):
+        batch = self.arrow.annotate_batch(self._table().to_batches()[0])
+        self.assertEqual(batch.schema.names, ['id', 'market_hash', 'pattern', 'group', 'rank', 'total'])
+        self.assertEqual(batch.schema.field('rank').type, self.pa.int16())
+        self.assertMatchesCheckRare(batch.to_pylist())
+
+    def test_dictionary_and_null_values(self):
+        market_hashes = self.pa.array(
+            ["AK-47 | Case Hardened (Field-Tested)", None, "AK-47 | Case Hardened (Field-Tested)"]
+        ).dictionary_encode()
+        batch = self.pa.RecordBatch.from_arrays([market_hashes, self.pa.array([661, 661, None])],
+                                                names=['market_hash', 'pattern'])
+        self.assertEqual(self.arrow.annotate_batch(batch).column('group').to_pylist(), ['gem_blue', None, None])
+
+    def test_rejects_existing_annotation_column(self):
+        batch = self._table().append_column('rank', self.pa.array([0] * len(inputs))).to_batches()[0]
+        with self.assertRaises(ValueError):
+            self.arrow.annotate_batch(batch)
+
+    def test_annotate_parquet_streams_batches(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source, destination = Path(tmp) / "in.parquet", Path(tmp) / "out.parquet"
+            self.pq.write_table(self._table(), source)
+            stats = self.arrow.annotate_parquet(source, destination, batch_size=7)
+            self.assertEqual(stats.rows, len(inputs))
+            annotated = self.pq.read_table(destination)
+            self.assertEqual(annotated.column('id').to_pylist(), list(range(len(inputs))))
+            self.assertMatchesCheckRare(annotated.to_pylist())
+
+    def test_annotate_parquet_empty_and_batch_size(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source, destination = Path(tmp) / "in.parquet", Path(tmp) / "out.parquet"
+            self.pq.write_table(self._table().slice(0, 0), source)
+            self.assertEqual(self.arrow.annotate_parquet(source, destination).rows, 0)
+            self.assertIn('group', self.pq.read_schema(destination).names)
+            with self.assertRaises(ValueError):
+                self.arrow.annotate_parquet(source, destination, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+__author__ = "Lukas Mahler"
+__version__ = "1.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Production"
+
+
+import unittest
+
+from benchmarks.suite import NOISY_THRESHOLD, build_corpus, compare, threshold_for
+from cs2pattern import check_rare
+
+
+class TestSuite(unittest.TestCase):
+
+    def test_corpus_is_deterministic_and_matches_outcomes(self):
+        corpus = build_corpus(200)
+        self.assertEqual(corpus, build_corpus(200))
+        self.assertTrue(all(check_rare(*row).rare for row in corpus["hit"]))
+        for outcome in ("miss", "unknown", "malformed"):
+            with self.subTest(outcome=outcome):
+                self.assertFalse(any(check_rare(*row).rare for row in corpus[outcome]))
+        self.assertTrue(all(check_rare(*row).weapon is not None for row in corpus["miss"]))
+
+    def test_thresholds(self):
+        overrides = {"check_rare": 0.5, "check_rare.hit": 0.1}
+        self.assertEqual(threshold_for("check_rare.hit", overrides, 0.25), 0.1)
+        self.assertEqual(threshold_for("check_rare.miss", overrides, 0.25), 0.5)
+        self.assertEqual(threshold_for("helper.all", overrides, 0.25), 0.25)
+        self.assertEqual(threshold_for("import.import", {}, 0.25), NOISY_THRESHOLD)
+
+    def test_compare(self):
+        baseline = {"a": {"ns_per_op": 100.0}, "b": {"ns_per_op": 100.0}}
+        results = {"a": {"ns_per_op": 120.0}, "b": {"ns_per_op": 130.0}, "new": {"ns_per_op": 1.0}}
+        regressions = compare(results, baseline, 0.25)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("b: "))
+        self.assertEqual(compare(results, baseline, 0.25, {"b": 0.5}), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+__author__ = "Lukas Mahler"
+__version__ = "1.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Production"
+
+
+import importlib.util
+import unittest
+
+from cs2pattern import check_rare
+from tests.test_pattern import inputs
+
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+
+@unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+class TestFrames(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import pandas as pd
+
+        from cs2pattern import frames
+        cls.pd = pd
+        cls.frames = frames
+
+    def _frame(self):
+        return self.pd.DataFrame(
+            {
+                'market_hash': [args[0] for _, args in inputs],
+                'pattern': [args[1] for _, args in inputs],
+            }
+        )
+
+    def assertMatchesCheckRare(self, annotated, rows):
+        for position, (market_hash, pattern) in enumerate(rows):
+            with self.subTest(market_hash=market_hash, pattern=pattern):
+                expected = check_rare(market_hash, pattern)
+                group = annotated['group'].iloc[position]
+                self.assertEqual(None if self.pd.isna(group) else group, expected.name)
+                rank, total = (annotated[column].iloc[position] for column in ('rank', 'total'))
+                self.assertEqual(
+                    (None if self.pd.isna(rank) else int(rank), None if self.pd.isna(total) else int(total)),
+                    expected.order or (None, None),
+                )
+
+    def test_annotate_frame_matches_check_rare(self):
+        frame = self._frame()
+        annotated = self.frames.annotate_frame(frame)
+        self.assertEqual(list(annotated.columns), ['market_hash', 'pattern', 'group', 'rank', 'total'])
+        self.assertEqual(str(annotated['group'].dtype), 'category')
+        self.assertEqual(str(annotated['rank'].dtype), 'Int16')
+        self.assertNotIn('group', frame.columns)
+        self.assertMatchesCheckRare(annotated, [args for _, args in inputs])
+
+    def test_accessor_keeps_index(self):
+        frame = self._frame().set_index(self.pd.Index([7] * len(inputs)))
+        annotated = frame['market_hash'].cs2pattern.annotate(frame['pattern'])
+        self.assertEqual(list(annotated.index), list(frame.index))
+        self.assertEqual(len(self.frames.annotate_frame(frame)), len(frame))
+
+    def test_categorical_and_missing_values(self):
+        rows = [("AK-47 | Case Hardened (Field-Tested)", 661), (None, 661),
+                ("AK-47 | Case Hardened (Field-Tested)", None), ("AK-47 | Case Hardened (Field-Tested)", 661.5)]
+        names = self.pd.Series([row[0] for row in rows], dtype='category')
+        annotated = self.frames.annotate_series(names, [row[1] for row in rows])
+        self.assertEqual(annotated['group'].iloc[0], 'gem_blue')
+        self.assertTrue(annotated['group'].iloc[1:].isna().all())
+        self.assertEqual(list(names.cs2pattern.item_codes() >= 0), [True, False, True, True])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.frames.annotate_series(self.pd.Series(["AK-47 | Case Hardened (Field-Tested)"]), [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
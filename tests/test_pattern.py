@@ -1,38 +1,92 @@
 __author__ = "Lukas Mahler"
 __version__ = "1.0.0"
-__date__ = "29.03.2026"
+__date__ = "17.10.2026"
 __email__ = "m@hler.eu"
 __status__ = "Production"
 
 
+import json
+import os
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
+from collections.abc import Mapping
+from pathlib import Path
 
 from cs2pattern import (
+    Catalog,
+    CatalogWatcher,
+    MarketItem,
+    PatternBatch,
+    PatternGroup,
     PatternInfo,
     abyss,
     berries,
     blaze,
     check_rare,
+    check_rare_many,
+    check_rare_tuple,
+    could_be_rare,
     fade,
+    fade_all,
+    find_by_group,
+    find_by_pattern,
+    find_by_pattern_range,
+    find_by_skin,
+    find_by_weapon,
     fire_and_ice,
+    fire_and_ice_all,
     gem_black,
+    gem_black_all,
     gem_blue,
+    gem_blue_all,
     gem_diamond,
     gem_gold,
+    gem_gold_all,
     gem_green,
     gem_orange,
     gem_pink,
     gem_purple,
+    gem_purple_all,
     gem_white,
+    gem_white_all,
     get_pattern_dict,
     hive_blue,
     hive_orange,
     moonrise,
+    parse_market_hash,
     paw,
     phoenix,
     pussy,
+    reload_catalog,
+    warmup,
 )
-from cs2pattern.check import ICON_MAP, _normalize_input
+from cs2pattern import check
+from cs2pattern.check import (
+    ENGINES,
+    ICON_MAP,
+    _match_group,
+    _normalize_input,
+    _normalize_market_hash,
+    add_hook,
+    cache_clear,
+    cache_info,
+    disable_cache,
+    disable_metrics,
+    enable_cache,
+    enable_metrics,
+    memory_report,
+    metrics_snapshot,
+    remove_hook,
+    reset_metrics,
+    set_engine,
+)
+
+ROOT = Path(__file__).resolve().parents[1]
 
 inputs = [
 
@@ -208,6 +262,766 @@ class TestPattern(unittest.TestCase):
         missing = {name for name in groups if name and name not in ICON_MAP}
         self.assertFalse(missing, f"Missing icons for groups: {sorted(missing)}")
 
+    def test_index_matches_linear_scan(self):
+
+        def linear_scan(skin, weapon, pattern):
+            for group in get_pattern_dict()[skin][weapon]:
+                patterns = list(group.get('pattern', []))
+                if pattern in patterns:
+                    ordered = bool(group.get('ordered', False))
+                    if ordered:
+                        return group.get('name'), ordered, patterns.index(pattern) + 1, len(patterns)
+                    return group.get('name'), ordered, None, None
+            return None
+
+        for skin, weapons in get_pattern_dict().items():
+            for weapon in weapons:
+                with self.subTest(skin=skin, weapon=weapon):
+                    for pattern in range(1001):
+                        self.assertEqual(_match_group((weapon, skin, pattern)), linear_scan(skin, weapon, pattern))
+
+
+class TestLazyLoading(unittest.TestCase):
+
+    def test_import_does_not_load_catalog(self):
+        code = "import cs2pattern, cs2pattern.check as c, sys; sys.exit(c._CATALOG is not None)"
+        self.assertEqual(subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode, 0)
+
+    def test_import_skips_watcher(self):
+        code = "import cs2pattern, sys; sys.exit('threading' in sys.modules or 'cs2pattern.watcher' in sys.modules)"
+        self.assertEqual(subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode, 0)
+
+    def test_warmup(self):
+        warmup()
+        self.assertIsNotNone(check._CATALOG)
+        self.assertIsNotNone(check._CATALOG._dense)
+
+    def test_legacy_module_attributes(self):
+        self.assertIs(check.PATTERN_MAP, get_pattern_dict())
+        self.assertIs(check.ICON_MAP, check._get_catalog().icon_map)
+        self.assertIs(check.PATTERN_INDEX, check._get_catalog().index)
+        with self.assertRaises(AttributeError):
+            check.UNKNOWN_ATTRIBUTE
+
+
+class TestResultTypes(unittest.TestCase):
+
+    def test_pattern_info_is_slotted(self):
+        info = check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+        self.assertFalse(hasattr(info, '__dict__'))
+        with self.assertRaises(AttributeError):
+            info.rare = False
+
+    def test_rare_hits_are_shared(self):
+        first = check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+        second = check_rare("AK-47 | Case Hardened (Factory New)", 661)
+        self.assertIs(first, second)
+        self.assertIs(check_rare("AWP | Asiimov", 5000), check_rare("no separator", 1))
+
+    def test_tuple_results(self):
+        for _, args in inputs:
+            with self.subTest(args=args):
+                self.assertEqual(PatternInfo(*check_rare_tuple(*args)), check_rare(*args))
+
+
+class TestNormalizer(unittest.TestCase):
+
+    @staticmethod
+    def _regex_normalize(market_hash: str):
+        market_hash = re.sub(r"\s+", " ", market_hash.replace("★ ", "").lower()).strip()
+        if " | " not in market_hash:
+            return None
+        weapon, skin = market_hash.split(" | ", 1)
+        return weapon, re.sub(r"\s*\(.*?\)$", "", skin).strip()
+
+    def test_matches_regex_normalizer(self):
+        for _, (market_hash, _) in inputs:
+            with self.subTest(market_hash=market_hash):
+                self.assertEqual(_normalize_market_hash(market_hash), self._regex_normalize(market_hash))
+
+    def test_matches_regex_normalizer_fuzzed(self):
+        rng = random.Random(1337)
+        fragments = [
+            "★", "★ ", "StatTrak™ ", "Souvenir ", "AK-47", "Karambit", "|", " | ", "Case Hardened", "(", ")",
+            "(Field-Tested)", " (Factory New)", " ", "  ", "\t", "\n", "\u00a0", "\u3000", "\u200b", "x", "İ",
+        ]
+        for _ in range(5000):
+            market_hash = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 8)))
+            with self.subTest(market_hash=market_hash):
+                self.assertEqual(_normalize_market_hash(market_hash), self._regex_normalize(market_hash))
+
+
+class TestParser(unittest.TestCase):
+
+    def _unparse(self, item: MarketItem):
+        prefix = "stattrak™ " if item.stattrak else "souvenir " if item.souvenir else ""
+        return prefix + item.weapon, item.skin
+
+    def test_attributes(self):
+        self.assertEqual(
+            parse_market_hash("★ StatTrak™ Karambit | Case Hardened (Factory New)"),
+            MarketItem("karambit", "case hardened", "Factory New", stattrak=True, star=True),
+        )
+        self.assertEqual(
+            parse_market_hash(" Souvenir AWP |  Electric Hive (well-worn)"),
+            MarketItem("awp", "electric hive", "Well-Worn", souvenir=True),
+        )
+        self.assertEqual(parse_market_hash("Glock-18 | Trace Lock"), MarketItem("glock-18", "trace lock"))
+        self.assertIsNone(parse_market_hash("Operation Breakout Weapon Case"))
+        self.assertFalse(hasattr(parse_market_hash("Glock-18 | Trace Lock"), "__dict__"))
+
+    def test_matches_normalizer(self):
+        rng = random.Random(1337)
+        fragments = [
+            "★", "★ ", "StatTrak™ ", "Souvenir ", "AK-47", "Karambit", "|", " | ", "Case Hardened", "(", ")",
+            "(Field-Tested)", " (Factory New)", " ", "  ", "\t", "\n", "\u00a0", "x",
+        ]
+        market_hashes = [market_hash for _, (market_hash, _) in inputs]
+        market_hashes += ["".join(rng.choice(fragments) for _ in range(rng.randint(0, 8))) for _ in range(2000)]
+        for market_hash in market_hashes:
+            with self.subTest(market_hash=market_hash):
+                item = parse_market_hash(market_hash)
+                self.assertEqual(item and self._unparse(item), _normalize_market_hash(market_hash))
+
+    def test_check_rare_accepts_parsed_items(self):
+        rows = [args for _, args in inputs] + [
+            ("StatTrak™ AK-47 | Case Hardened (Field-Tested)", 661),
+            ("★ StatTrak™ Karambit | Case Hardened (Factory New)", 387),
+            ("Souvenir AK-47 | Case Hardened (Field-Tested)", 661),
+        ]
+        for market_hash, pattern in rows:
+            item = parse_market_hash(market_hash)
+            if item is None:
+                continue
+            with self.subTest(market_hash=market_hash, pattern=pattern):
+                expected = check_rare(market_hash, pattern)
+                self.assertEqual(check_rare(item, pattern), expected)
+                self.assertEqual(check_rare_tuple(item, pattern), check_rare_tuple(market_hash, pattern))
+                self.assertEqual(check_rare_many([(item, pattern)])[0], expected)
+
+    def test_prefixed_items_resolve_to_base_item(self):
+        item = parse_market_hash("StatTrak™ AK-47 | Case Hardened (Field-Tested)")
+        self.assertEqual(check_rare(item, 661), check_rare("AK-47 | Case Hardened (Field-Tested)", 661))
+
+    def test_cached_by_string(self):
+        market_hash = "AK-47 | Case Hardened (Minimal Wear)"
+        self.assertIs(parse_market_hash(market_hash), parse_market_hash(market_hash))
+
+
+class TestNameTable(unittest.TestCase):
+
+    def test_table_matches_normalizer(self):
+        names = check._get_catalog().names
+        self.assertIn("Five-SeveN | Kami (Factory New)", names)
+        self.assertIn("★ StatTrak™ Karambit | Case Hardened (Minimal Wear)", names)
+        for market_hash, item in names.items():
+            with self.subTest(market_hash=market_hash):
+                self.assertEqual(check._normalize_name(market_hash), item)
+                self.assertEqual(parse_market_hash(market_hash) and self._base(market_hash), item)
+
+    @staticmethod
+    def _base(market_hash):
+        item = parse_market_hash(market_hash)
+        return item.weapon, item.skin
+
+    def test_quality_prefixes_resolve_to_base_item(self):
+        expected = check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+        for market_hash in (
+            "StatTrak™ AK-47 | Case Hardened (Field-Tested)",
+            "Souvenir AK-47 | Case Hardened (Field-Tested)",
+            "  stattrak™ ak-47 |  case hardened (field-tested)",
+        ):
+            with self.subTest(market_hash=market_hash):
+                self.assertEqual(check_rare(market_hash, 661), expected)
+                self.assertEqual(check_rare_tuple(market_hash, 661), check_rare_tuple("AK-47 | Case Hardened", 661))
+                self.assertEqual(check_rare_many([(market_hash, 661)])[0], expected)
+                self.assertTrue(could_be_rare(market_hash, 661))
+
+    def test_every_catalog_item_resolves(self):
+        # Steam spelling of every catalog name title casing gets wrong, kept apart from check._DISPLAY_NAMES
+        steam_names = {
+            'ak-47': "AK-47", 'awp': "AWP", 'five-seven': "Five-SeveN", 'galil ar': "Galil AR", 'm4a1-s': "M4A1-S",
+            'mac-10': "MAC-10", 'mp7': "MP7", 'paw': "PAW", 'pink ddpat': "Pink DDPAT", 'ssg 08': "SSG 08",
+        }
+        catalog = check._get_catalog()
+        self.assertIn("AWP | PAW (Field-Tested)", catalog.names)
+        for skin, weapons in catalog.pattern_map.items():
+            for weapon in weapons:
+                name = f"{steam_names.get(weapon, weapon.title())} | {steam_names.get(skin, skin.title())}"
+                with self.subTest(name=name):
+                    self.assertEqual(catalog.names.get(f"{name} (Minimal Wear)"), (weapon, skin))
+
+    def test_unknown_names_fall_back(self):
+        self.assertNotIn("AWP | Asiimov (Field-Tested)", check._get_catalog().names)
+        self.assertEqual(check_rare("AWP | Asiimov (Field-Tested)", 1).weapon, "awp")
+        self.assertEqual(Catalog({}, {}).names, {})
+
+
+class TestFastReject(unittest.TestCase):
+
+    def test_never_rejects_rare_items(self):
+        rng = random.Random(1337)
+        fragments = [
+            "★", "★ ", "StatTrak™ ", "AK-47", "Karambit", "|", " | ", "Case Hardened", "(", ")",
+            "(Field-Tested)", " (Factory New)", " ", "  ", "\t", "\n", "\u00a0", "\u3000", "\u200b", "İ", "(a|b)",
+        ]
+        rows = [args for _, args in inputs]
+        rows += [
+            ("".join(rng.choice(fragments) for _ in range(rng.randint(0, 8))), rng.choice((0, 387, 387.0, 661, 1000)))
+            for _ in range(5000)
+        ]
+        for market_hash, pattern in rows:
+            if check_rare(market_hash, pattern).rare:
+                with self.subTest(market_hash=market_hash, pattern=pattern):
+                    self.assertTrue(could_be_rare(market_hash, pattern))
+
+    def test_rejects(self):
+        self.assertTrue(could_be_rare("AK-47 | Case Hardened (Field-Tested)", 661))
+        self.assertTrue(could_be_rare(" ★ karambit  |  case hardened ", 387))
+        self.assertFalse(could_be_rare("AWP | Asiimov (Field-Tested)", 661))
+        self.assertFalse(could_be_rare("Operation Breakout Weapon Case", 661))
+        self.assertFalse(could_be_rare("AK-47 | Case Hardened (Field-Tested)", 1001))
+        self.assertFalse(could_be_rare("AK-47 | Case Hardened (Field-Tested)", -1))
+
+        unused = next(seed for seed in range(1001) if not find_by_pattern(seed))
+        self.assertFalse(could_be_rare("AK-47 | Case Hardened (Field-Tested)", unused))
+
+    def test_irregular_inputs_match_check_rare(self):
+        rows = [
+            ("AK-47 | Case Hardened (a|b)", 661),
+            ("AK-47 | Case Hardened (Field|Tested)", 661),
+            ("AK-47 | Case Hardened | (Field-Tested)", 661),
+            ("AK-47 | Case Hardened (Field-Tested)", 661.0),
+            ("AK-47 | Case Hardened (Field-Tested)", 148.0),
+            ("AK-47 | Case Hardened (Field-Tested)", 661.5),
+            ("AWP | Asiimov (Field-Tested)", 661.0),
+        ]
+        for market_hash, pattern in rows:
+            with self.subTest(market_hash=market_hash, pattern=pattern):
+                if check_rare(market_hash, pattern).rare:
+                    self.assertTrue(could_be_rare(market_hash, pattern))
+        self.assertTrue(could_be_rare("AK-47 | Case Hardened (a|b)", 661))
+        self.assertTrue(could_be_rare("AK-47 | Case Hardened (Field-Tested)", 661.0))
+        self.assertFalse(could_be_rare("AWP | Asiimov (Field-Tested)", 661.0))
+
+    def test_parsed_items_and_catalogs(self):
+        item = parse_market_hash("StatTrak™ AK-47 | Case Hardened (Field-Tested)")
+        self.assertTrue(could_be_rare(item, 661))
+        self.assertFalse(Catalog({}, {}).could_be_rare("AK-47 | Case Hardened (Field-Tested)", 661))
+
+
+class TestBatch(unittest.TestCase):
+
+    def test_batch_matches_check_rare(self):
+        rows = [args for _, args in inputs]
+        batch = check_rare_many(rows)
+
+        self.assertIsInstance(batch, PatternBatch)
+        self.assertEqual(len(batch), len(rows))
+        for position, args in enumerate(rows):
+            with self.subTest(args=args):
+                expected = check_rare(*args)
+                self.assertEqual(batch[position], expected)
+                self.assertEqual(batch.weapon[position], expected.weapon)
+                self.assertEqual(batch.skin[position], expected.skin)
+                self.assertEqual(batch.rare[position], expected.rare)
+                self.assertEqual(batch.name[position], expected.name)
+                self.assertEqual((batch.rank[position], batch.total[position]), expected.order or (None, None))
+
+    def test_batch_slicing_and_iteration(self):
+        rows = [args for _, args in inputs[:10]]
+        batch = check_rare_many(iter(rows))
+        self.assertEqual(batch[2:5], [check_rare(*args) for args in rows[2:5]])
+        self.assertEqual(list(batch), [check_rare(*args) for args in rows])
+        self.assertEqual(batch[-1], check_rare(*rows[-1]))
+
+    def test_empty_batch(self):
+        self.assertEqual(len(check_rare_many([])), 0)
+
+
+class TestReverseIndex(unittest.TestCase):
+
+    def _expected(self, seeds):
+        catalog = check._get_catalog()
+        return sorted(
+            (record.info for (_, _, pattern), record in catalog.index.items() if pattern in seeds),
+            key=lambda info: info.pattern,
+        )
+
+    def test_find_by_pattern(self):
+        for seed in (0, 28, 661, 1000):
+            with self.subTest(seed=seed):
+                hits = find_by_pattern(seed)
+                self.assertIsInstance(hits, tuple)
+                self.assertEqual(list(hits), self._expected({seed}))
+                for info in hits:
+                    self.assertIs(check_rare(f"★ {info.weapon} | {info.skin} (Field-Tested)", seed), info)
+
+    def test_find_by_pattern_misses(self):
+        self.assertEqual(find_by_pattern(-1), ())
+        self.assertEqual(find_by_pattern(100000), ())
+        self.assertEqual(find_by_pattern('661'), ())
+
+    def test_find_by_pattern_range(self):
+        self.assertEqual(list(find_by_pattern_range(0, 1000)), self._expected(set(range(1001))))
+        self.assertEqual(list(find_by_pattern_range(600, 700)), self._expected(set(range(600, 701))))
+        self.assertEqual(find_by_pattern_range(661, 661), find_by_pattern(661))
+        self.assertEqual(find_by_pattern_range(700, 600), ())
+
+
+class TestCatalogQueries(unittest.TestCase):
+
+    def _definitions(self):
+        for skin, weapons in get_pattern_dict().items():
+            for weapon, groups in weapons.items():
+                for group in groups:
+                    yield skin, weapon, group
+
+    def _as_tuples(self, entries):
+        return [(entry.skin, entry.weapon, entry.name, entry.patterns, entry.ordered) for entry in entries]
+
+    def test_queries_match_catalog_traversal(self):
+        definitions = list(self._definitions())
+        queries = (
+            (find_by_group, {group.get('name') for _, _, group in definitions}, lambda s, w, g: g.get('name')),
+            (find_by_weapon, {weapon for _, weapon, _ in definitions}, lambda s, w, g: w),
+            (find_by_skin, {skin for skin, _, _ in definitions}, lambda s, w, g: s),
+        )
+
+        for query, keys, key_of in queries:
+            for key in keys:
+                with self.subTest(query=query.__name__, key=key):
+                    expected = [
+                        (skin, weapon, group.get('name'), group.get('pattern', ()), bool(group.get('ordered', False)))
+                        for skin, weapon, group in definitions if key_of(skin, weapon, group) == key
+                    ]
+                    self.assertEqual(self._as_tuples(query(key)), expected)
+
+    def test_results_are_prebuilt(self):
+        self.assertIs(find_by_group('gem_blue'), find_by_group('gem_blue'))
+        self.assertIs(find_by_weapon('Karambit'), find_by_weapon('karambit'))
+        entry = find_by_skin('case hardened')[0]
+        self.assertIsInstance(entry, PatternGroup)
+        self.assertIsInstance(entry.patterns, tuple)
+        self.assertEqual(entry.icon, check._get_catalog().icon_map.get(entry.name))
+
+    def test_unknown_keys(self):
+        self.assertEqual(find_by_group('unknown'), ())
+        self.assertEqual(find_by_weapon('unknown'), ())
+        self.assertEqual(find_by_skin('unknown'), ())
+
+
+class TestCatalog(unittest.TestCase):
+
+    MARKET_HASH = "AK-47 | Case Hardened (Field-Tested)"
+
+    def setUp(self):
+        self.default = Catalog.default()
+        pattern_map = dict(self.default.pattern_map)
+        pattern_map['case hardened'] = {
+            weapon: groups for weapon, groups in pattern_map['case hardened'].items() if weapon != 'ak-47'
+        }
+        self.staging = Catalog(pattern_map, self.default.icon_map)
+
+    def test_default_instance(self):
+        self.assertIs(Catalog.default(), check._get_catalog())
+        self.assertIs(self.default.check_rare(self.MARKET_HASH, 661), check_rare(self.MARKET_HASH, 661))
+        self.assertEqual(self.default.check_rare_tuple(self.MARKET_HASH, 661), check_rare_tuple(self.MARKET_HASH, 661))
+        self.assertIs(self.default.get_pattern_dict(), get_pattern_dict())
+        self.assertIs(self.default.find_by_group('gem_blue'), find_by_group('gem_blue'))
+
+    def test_catalogs_coexist(self):
+        self.assertFalse(self.staging.check_rare(self.MARKET_HASH, 661).rare)
+        self.assertFalse(self.staging.check_rare_many([(self.MARKET_HASH, 661)])[0].rare)
+        self.assertNotIn('ak-47', {info.weapon for info in self.staging.find_by_pattern(661)})
+        self.assertTrue(check_rare(self.MARKET_HASH, 661).rare)
+        self.assertIn('ak-47', {info.weapon for info in find_by_pattern(661)})
+
+    def test_catalog_shares_data(self):
+        self.assertIs(self.staging.icon_map, self.default.icon_map)
+        self.assertIs(self.staging.pattern_map['scorched'], self.default.pattern_map['scorched'])
+
+    def test_helpers_as_methods(self):
+        self.assertIs(self.default.gem_blue('ak-47'), gem_blue('ak-47'))
+        self.assertIs(self.default.abyss(), abyss())
+        self.assertIsNone(self.staging.gem_blue('ak-47'))
+        self.assertNotIn('ak-47', self.staging.gem_blue_all())
+        self.assertEqual(self.staging.gem_blue('karambit'), gem_blue('karambit'))
+        self.assertIs(gem_blue('ak-47', catalog=self.staging), None)
+        with self.assertRaises(AttributeError):
+            self.staging.get_catalog_name
+        with self.assertRaises(AttributeError):
+            self.staging.Optional
+
+    def test_load(self):
+        loaded = Catalog.load()
+        self.assertIsNot(loaded, self.default)
+        self.assertEqual(loaded.pattern_map, self.default.pattern_map)
+        self.assertEqual(loaded.check_rare(self.MARKET_HASH, 661), check_rare(self.MARKET_HASH, 661))
+
+    def test_cache_only_serves_default_catalog(self):
+        check.enable_cache(maxsize=8)
+        self.addCleanup(check.disable_cache)
+        self.assertTrue(check_rare(self.MARKET_HASH, 661).rare)
+        self.assertFalse(self.staging.check_rare(self.MARKET_HASH, 661).rare)
+        self.assertTrue(check_rare(self.MARKET_HASH, 661).rare)
+        self.assertEqual(check.cache_info()['results'].hits, 1)
+
+
+class TestThreadSafety(unittest.TestCase):
+
+    def test_pattern_dict_is_read_only(self):
+        patterns = get_pattern_dict()
+        self.assertIs(patterns, get_pattern_dict())
+        group = patterns['case hardened']['ak-47'][0]
+        self.assertIsInstance(group['pattern'], tuple)
+        with self.assertRaises(TypeError):
+            patterns['case hardened'] = {}
+        with self.assertRaises(TypeError):
+            patterns['case hardened']['ak-47'] = []
+        with self.assertRaises(TypeError):
+            group['pattern'] = [661]
+        with self.assertRaises(AttributeError):
+            patterns['case hardened']['ak-47'].append({})
+        with self.assertRaises(TypeError):
+            check._get_catalog().icon_map['gem_blue'] = None
+
+    def test_frozen_data_is_shared(self):
+        catalog = check._get_catalog()
+        group = catalog.pattern_map['case hardened']['ak-47'][0]
+        self.assertIs(check._freeze(catalog.pattern_map), catalog.pattern_map)
+        self.assertIs(Catalog(catalog.pattern_map, catalog.icon_map).pattern_map, catalog.pattern_map)
+        entry = next(entry for entry in find_by_weapon('ak-47') if entry.name == group['name'])
+        self.assertIs(entry.patterns, group['pattern'])
+
+    def test_concurrent_lookups_without_locks(self):
+        # A fresh catalog so the lazily built tables are raced as well
+        default = check._get_catalog()
+        catalog = Catalog(default.pattern_map, default.icon_map)
+        rows = [args for _, args in inputs]
+        expected = [default.check_rare(*args) for args in rows]
+        barrier = threading.Barrier(8)
+        failures = []
+
+        def worker():
+            barrier.wait()
+            for _ in range(20):
+                if [catalog.check_rare(*args) for args in rows] != expected:
+                    failures.append('check_rare')
+                if catalog.find_by_pattern(661) != default.find_by_pattern(661):
+                    failures.append('find_by_pattern')
+                if catalog.gem_blue('ak-47') != gem_blue('ak-47'):
+                    failures.append('gem_blue')
+
+        workers = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+        self.assertEqual(failures, [])
+
+
+class TestReload(unittest.TestCase):
+
+    MARKET_HASH = "AK-47 | Case Hardened (Field-Tested)"
+
+    def setUp(self):
+        self.original = check._get_catalog()
+        self.addCleanup(setattr, check, '_CATALOG', self.original)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.pattern_file = Path(directory.name) / "pattern.json"
+        self.icon_file = Path(directory.name) / "icons.json"
+        self.icon_file.write_text(json.dumps(dict(self.original.icon_map)))
+
+    def _thaw(self, value):
+        if isinstance(value, Mapping):
+            return {key: self._thaw(item) for key, item in value.items()}
+        if isinstance(value, tuple):
+            return [self._thaw(item) for item in value]
+        return value
+
+    def _write_catalog(self, without_ak: bool) -> None:
+        pattern_map = self._thaw(self.original.pattern_map)
+        if without_ak:
+            del pattern_map['case hardened']['ak-47']
+        self.pattern_file.write_text(json.dumps(pattern_map))
+
+    def test_reload_swaps_catalog(self):
+        self._write_catalog(without_ak=True)
+        reload_catalog(self.pattern_file, self.icon_file)
+
+        self.assertIsNot(check._CATALOG, self.original)
+        self.assertFalse(check_rare(self.MARKET_HASH, 661).rare)
+        self.assertNotIn('ak-47', {group.weapon for group in find_by_pattern(661)})
+        self.assertNotIn('ak-47', gem_blue_all())
+
+        reload_catalog()
+        self.assertTrue(check_rare(self.MARKET_HASH, 661).rare)
+        self.assertIn('ak-47', gem_blue_all())
+
+    def test_failed_reload_keeps_catalog(self):
+        self.pattern_file.write_text("{")
+        with self.assertRaises(ValueError):
+            reload_catalog(self.pattern_file, self.icon_file)
+        self.assertIs(check._CATALOG, self.original)
+        with self.assertRaises(OSError):
+            reload_catalog(self.pattern_file.with_name("missing.json"), self.icon_file)
+        self.assertIs(check._CATALOG, self.original)
+
+    def test_lookups_during_reload_see_one_snapshot(self):
+        self._write_catalog(without_ak=True)
+        check.enable_cache(maxsize=8)
+        self.addCleanup(check.disable_cache)
+        stop = threading.Event()
+        results = set()
+
+        def lookup():
+            while not stop.is_set():
+                info = check_rare(self.MARKET_HASH, 661)
+                results.add((info.rare, info.name))
+
+        workers = [threading.Thread(target=lookup) for _ in range(2)]
+        for worker in workers:
+            worker.start()
+        try:
+            for _ in range(5):
+                reload_catalog(self.pattern_file, self.icon_file)
+                reload_catalog()
+        finally:
+            stop.set()
+            for worker in workers:
+                worker.join()
+
+        self.assertLessEqual(results, {(True, 'gem_blue'), (False, None)})
+        self.assertTrue(check_rare(self.MARKET_HASH, 661).rare)
+
+    def test_watcher_reloads_on_change(self):
+        self._write_catalog(without_ak=False)
+        reloads = []
+        errors = []
+        watcher = CatalogWatcher(
+            interval=60,
+            pattern_file=self.pattern_file,
+            icon_file=self.icon_file,
+            on_reload=lambda: reloads.append(True),
+            on_error=errors.append,
+        )
+        self.assertFalse(watcher.check())
+
+        self._write_catalog(without_ak=True)
+        os.utime(self.pattern_file, ns=(0, 0))
+        self.assertTrue(watcher.check())
+        self.assertFalse(check_rare(self.MARKET_HASH, 661).rare)
+        self.assertFalse(watcher.check())
+
+        self.pattern_file.write_text("{")
+        self.assertFalse(watcher.check())
+        self.assertFalse(check_rare(self.MARKET_HASH, 661).rare)
+        self.assertEqual((len(reloads), len(errors)), (1, 1))
+
+    def test_watcher_thread(self):
+        self._write_catalog(without_ak=False)
+        reloaded = threading.Event()
+        with CatalogWatcher(interval=0.01, pattern_file=self.pattern_file, icon_file=self.icon_file,
+                            on_reload=reloaded.set) as watcher:
+            self._write_catalog(without_ak=True)
+            os.utime(self.pattern_file, ns=(0, 0))
+            self.assertTrue(reloaded.wait(5))
+        self.assertIsNone(watcher._thread)
+        self.assertFalse(check_rare(self.MARKET_HASH, 661).rare)
+        with self.assertRaises(ValueError):
+            CatalogWatcher(interval=0)
+
+
+class TestCache(unittest.TestCase):
+
+    def setUp(self):
+        enable_cache(maxsize=64)
+
+    def tearDown(self):
+        disable_cache()
+
+    def test_cached_results_match(self):
+        disable_cache()
+        expected = [check_rare(*args) for _, args in inputs]
+        enable_cache(maxsize=1024)
+        for _ in range(2):
+            self.assertEqual([check_rare(*args) for _, args in inputs], expected)
+
+        info = cache_info()
+        self.assertGreater(info['results'].hits, 0)
+        self.assertGreater(info['names'].hits, 0)
+        self.assertGreater(info['results'].hit_rate, 0.0)
+
+    def test_lru_eviction(self):
+        for pattern in range(200):
+            check_rare("AK-47 | Case Hardened (Field-Tested)", pattern)
+        self.assertEqual(cache_info()['results'].currsize, 64)
+
+    def test_negative_caching(self):
+        for pattern in range(100):
+            self.assertFalse(check_rare("AWP | Asiimov (Field-Tested)", pattern).rare)
+        info = cache_info()
+        self.assertEqual(info['results'].currsize, 0)
+        self.assertEqual(info['names'].currsize, 1)
+        self.assertEqual(info['names'].hits, 99)
+
+    def test_cache_clear(self):
+        check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+        cache_clear()
+        info = cache_info()
+        self.assertEqual((info['results'].currsize, info['results'].hits, info['results'].misses), (0, 0, 0))
+
+    def test_invalidated_on_catalog_replacement(self):
+        self.assertTrue(check_rare("AK-47 | Case Hardened (Field-Tested)", 661).rare)
+        original = check._CATALOG
+        check._CATALOG = check.Catalog({}, {})
+        try:
+            self.assertFalse(check_rare("AK-47 | Case Hardened (Field-Tested)", 661).rare)
+        finally:
+            check._CATALOG = original
+        self.assertTrue(check_rare("AK-47 | Case Hardened (Field-Tested)", 661).rare)
+
+    def test_parsed_items(self):
+        item = parse_market_hash("AK-47 | Case Hardened (Field-Tested)")
+        for _ in range(2):
+            self.assertEqual(check_rare(item, 661), check_rare("AK-47 | Case Hardened (Field-Tested)", 661))
+        self.assertEqual(check_rare(item, 1001), PatternInfo())
+        self.assertEqual(cache_info()['results'].hits, 2)
+
+    def test_disabled(self):
+        disable_cache()
+        self.assertEqual(cache_info(), {})
+        with self.assertRaises(ValueError):
+            enable_cache(maxsize=0)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        enable_metrics()
+
+    def tearDown(self):
+        disable_metrics()
+        disable_cache()
+
+    def test_counters(self):
+        check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+        check_rare("AK-47 | Case Hardened (Field-Tested)", 1)
+        check_rare("AWP | Asiimov (Field-Tested)", 661)
+        check_rare("AK-47 Case Hardened", 661)
+        check_rare("AK-47 | Case Hardened (Field-Tested)", 1001)
+
+        snapshot = metrics_snapshot()
+        self.assertEqual(
+            (snapshot.calls, snapshot.rare, snapshot.not_rare, snapshot.unknown, snapshot.malformed),
+            (5, 1, 1, 1, 2),
+        )
+        self.assertEqual(snapshot.groups, {'gem_blue': 1})
+        self.assertEqual(snapshot.items, {('ak-47', 'case hardened'): 2})
+        self.assertIsNone(snapshot.latency)
+
+        reset_metrics()
+        self.assertEqual(metrics_snapshot().calls, 0)
+
+    def test_every_call_is_counted_once(self):
+        for _, args in inputs:
+            check_rare(*args)
+        snapshot = metrics_snapshot()
+        self.assertEqual(snapshot.calls, len(inputs))
+        self.assertEqual(snapshot.rare + snapshot.not_rare + snapshot.unknown + snapshot.malformed, len(inputs))
+        self.assertEqual(sum(snapshot.groups.values()), snapshot.rare)
+
+    def test_cache_hits(self):
+        enable_cache()
+        for _ in range(3):
+            check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+        self.assertEqual(metrics_snapshot().cache_hits, 2)
+
+    def test_histogram(self):
+        enable_metrics(histogram=True, buckets=(1_000, 1_000_000_000))
+        for _, args in inputs:
+            check_rare(*args)
+        latency = metrics_snapshot().latency
+        self.assertEqual(latency.count, len(inputs))
+        self.assertEqual(sum(latency.counts), len(inputs))
+        self.assertEqual(latency.counts[-1], 0)
+        self.assertGreater(latency.mean_ns, 0)
+        self.assertIn(latency.quantile(0.99), latency.bounds)
+        with self.assertRaises(ValueError):
+            enable_metrics(buckets=(10, 5))
+
+    def test_hooks(self):
+        disable_metrics()
+        calls = []
+
+        @add_hook
+        def hook(market_hash, pattern, info, elapsed):
+            calls.append((market_hash, pattern, info.rare, elapsed > 0))
+
+        try:
+            check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+            self.assertIsNone(metrics_snapshot())
+        finally:
+            remove_hook(hook)
+        check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+
+        self.assertEqual(calls, [("AK-47 | Case Hardened (Field-Tested)", 661, True, True)])
+        self.assertIsNone(check._OBSERVER)
+        with self.assertRaises(ValueError):
+            remove_hook(hook)
+
+    def test_disabled(self):
+        disable_metrics()
+        check_rare("AK-47 | Case Hardened (Field-Tested)", 661)
+        self.assertIsNone(metrics_snapshot())
+        self.assertIsNone(check._OBSERVER)
+
+
+class TestEngines(unittest.TestCase):
+
+    def tearDown(self):
+        set_engine('index')
+
+    def _match_all(self, engine: str) -> list:
+        set_engine(engine)
+        return [
+            _match_group((weapon, skin, pattern))
+            for skin, weapons in get_pattern_dict().items()
+            for weapon in weapons
+            for pattern in range(1001)
+        ]
+
+    def test_engines_agree(self):
+        expected = self._match_all('index')
+        for engine in ENGINES:
+            with self.subTest(engine=engine):
+                self.assertEqual(self._match_all(engine), expected)
+
+    def test_engines_check_rare(self):
+        set_engine('dense')
+        for _, args in inputs:
+            with self.subTest(args=args):
+                dense = check_rare(*args)
+                set_engine('index')
+                self.assertEqual(dense, check_rare(*args))
+                set_engine('dense')
+
+    def test_dense_non_int_pattern(self):
+        set_engine('dense')
+        self.assertEqual(check_rare("AK-47 | Case Hardened (Field-Tested)", 661.0).name, 'gem_blue')
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            set_engine('unknown')
+
+    def test_memory_report(self):
+        report = memory_report()
+        self.assertEqual(set(report), {'pattern_map', 'index', 'dense'})
+        self.assertTrue(all(size > 0 for size in report.values()))
+
 
 class TestModularHelpers(unittest.TestCase):
 
@@ -215,11 +1029,11 @@ class TestModularHelpers(unittest.TestCase):
     def setUpClass(cls):
         cls.patterns = get_pattern_dict()
 
-    def _expect_group(self, skin: str, weapon: str, group_name: str) -> tuple[list[int], bool]:
+    def _expect_group(self, skin: str, weapon: str, group_name: str) -> tuple[tuple[int, ...], bool]:
         weapon_groups = self.patterns.get(skin, {}).get(weapon, [])
         for group in weapon_groups:
             if group.get('name') == group_name:
-                return list(group.get('pattern', [])), bool(group.get('ordered', False))
+                return tuple(group.get('pattern', [])), bool(group.get('ordered', False))
         self.fail(f"Group '{group_name}' not found for skin '{skin}' and weapon '{weapon}'")
 
     def test_simple_helpers(self):
@@ -386,6 +1200,36 @@ class TestModularHelpers(unittest.TestCase):
 
         self.assertIsNone(gem_white('kukri knife'))
 
+    def test_helpers_return_cached_tuples(self):
+        patterns, ordered = gem_blue('AK-47')
+        self.assertIsInstance(patterns, tuple)
+        self.assertIs(gem_blue('ak-47'), gem_blue('AK-47'))
+        self.assertIs(berries(), berries())
+        self.assertIs(abyss(), abyss())
+
+    def test_bulk_helpers(self):
+        cases = [
+            (fade, fade_all),
+            (fire_and_ice, fire_and_ice_all),
+            (gem_black, gem_black_all),
+            (gem_blue, gem_blue_all),
+            (gem_gold, gem_gold_all),
+            (gem_purple, gem_purple_all),
+            (gem_white, gem_white_all),
+        ]
+
+        for func, bulk in cases:
+            with self.subTest(func=func.__name__):
+                results = bulk()
+                self.assertTrue(results)
+                for weapon, expected in results.items():
+                    self.assertIs(func(weapon), expected)
+                with self.assertRaises(TypeError):
+                    results['unsupported'] = ((), False)
+
+        self.assertNotIn('butterfly knife', fade_all())
+        self.assertEqual(gem_blue_all()['five-seven'], self._expect_group('case hardened', 'five-seven', 'gem_blue'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,274 @@
+__author__ = "Lukas Mahler"
+__version__ = "1.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Production"
+
+
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from cs2pattern import check_rare
+from cs2pattern.scan import check_stream, detect_format, scan_file
+from tests.test_pattern import inputs
+
+ROOT = Path(__file__).resolve().parents[1]
+ROWS = [args for _, args in inputs]
+
+
+class TestScan(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def _write_csv(self, rows) -> Path:
+        path = self.directory / "input.csv"
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["id", "market_hash", "pattern"])
+            for position, (market_hash, pattern) in enumerate(rows):
+                writer.writerow([position, market_hash, pattern])
+        return path
+
+    def _write_jsonl(self, rows) -> Path:
+        path = self.directory / "input.jsonl"
+        with open(path, "w", encoding="utf-8") as handle:
+            for position, (market_hash, pattern) in enumerate(rows):
+                handle.write(json.dumps({"id": position, "market_hash": market_hash, "pattern": pattern}) + "\n")
+        return path
+
+    def _expected(self, market_hash, pattern):
+        info = check_rare(market_hash, pattern)
+        return info.rare, info.name, *(info.order or (None, None))
+
+    def test_csv_scan(self):
+        path = self._write_csv(ROWS)
+        output = io.BytesIO()
+        stats = scan_file(path, output, workers=2, chunk_size=256)
+
+        reader = csv.DictReader(io.StringIO(output.getvalue().decode("utf-8")))
+        self.assertEqual(reader.fieldnames, ["id", "market_hash", "pattern", "rare", "name", "rank", "total"])
+        records = list(reader)
+        self.assertEqual(stats.rows, len(ROWS))
+        self.assertEqual([int(record["id"]) for record in records], list(range(len(ROWS))))
+        for record, (market_hash, pattern) in zip(records, ROWS):
+            with self.subTest(market_hash=market_hash, pattern=pattern):
+                actual = (
+                    record["rare"] == "true",
+                    record["name"] or None,
+                    int(record["rank"]) if record["rank"] else None,
+                    int(record["total"]) if record["total"] else None,
+                )
+                self.assertEqual(actual, self._expected(market_hash, pattern))
+
+    def test_jsonl_scan_unordered(self):
+        path = self._write_jsonl(ROWS)
+        output = io.BytesIO()
+        stats = scan_file(path, output, workers=2, chunk_size=512, ordered=False)
+
+        records = [json.loads(line) for line in output.getvalue().decode("utf-8").splitlines()]
+        self.assertEqual(stats.rows, len(ROWS))
+        self.assertEqual(sorted(record["id"] for record in records), list(range(len(ROWS))))
+        for record in records:
+            expected = self._expected(record["market_hash"], record["pattern"])
+            self.assertEqual((record["rare"], record["name"], record["rank"], record["total"]), expected)
+
+    def test_unicode_line_separators(self):
+        path = self.directory / "input.jsonl"
+        records = [
+            {"id": 0, "market_hash": "AK-47 | Case Hardened (Field-Tested)\u2028", "pattern": 661},
+            {"id": 1, "market_hash": "AK-47 | Case\u2029\x85\x0b\x0c Hardened", "pattern": 661},
+        ]
+        path.write_text("".join(json.dumps(record, ensure_ascii=False) + "\r\n" for record in records), "utf-8")
+
+        output = io.BytesIO()
+        self.assertEqual(scan_file(path, output, workers=1).rows, 2)
+        streamed = io.BytesIO()
+        check_stream(io.BytesIO(path.read_bytes()), streamed, fmt="jsonl")
+        self.assertEqual(output.getvalue(), streamed.getvalue())
+        for line, record in zip(output.getvalue().decode("utf-8").split("\n"), records):
+            self.assertEqual(json.loads(line)["rare"], check_rare(record["market_hash"], 661).rare)
+
+    def test_invalid_rows_and_empty_input(self):
+        path = self.directory / "input.csv"
+        path.write_text("market_hash,pattern\nAK-47 | Case Hardened (Field-Tested),abc\nno pattern column\n\n")
+        output = io.BytesIO()
+        self.assertEqual(scan_file(path, output, workers=1).rows, 2)
+        self.assertEqual(output.getvalue().decode("utf-8").splitlines()[1:], [
+            "AK-47 | Case Hardened (Field-Tested),abc,false,,,",
+            "no pattern column,false,,,",
+        ])
+
+        empty = self.directory / "empty.jsonl"
+        empty.write_bytes(b"")
+        self.assertEqual(scan_file(empty, io.BytesIO()).rows, 0)
+
+    def test_invalid_arguments(self):
+        path = self._write_csv(ROWS[:1])
+        with self.assertRaises(ValueError):
+            scan_file(path, io.BytesIO(), hash_column="missing")
+        with self.assertRaises(ValueError):
+            scan_file(path, io.BytesIO(), fmt="xml")
+        with self.assertRaises(ValueError):
+            detect_format(self.directory / "input.txt")
+
+    def test_cli(self):
+        path = self._write_csv(ROWS[:10])
+        result = subprocess.run(
+            [sys.executable, "-m", "cs2pattern", "scan", str(path), "--workers", "1"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            check=True,
+        )
+        self.assertEqual(len(result.stdout.splitlines()), 11)
+        self.assertIn("Scanned 10 rows", result.stderr)
+
+
+class TestCheckStream(unittest.TestCase):
+
+    def _stream(self, text: str, **kwargs) -> tuple[list[str], int]:
+        output = io.BytesIO()
+        stats = check_stream(io.BytesIO(text.encode("utf-8")), output, **kwargs)
+        return output.getvalue().decode("utf-8").splitlines(), stats.rows
+
+    def test_tsv_matches_check_rare(self):
+        # Hashes with raw tabs or line breaks cannot round-trip through unquoted TSV
+        rows = [row for row in ROWS if not any(char in row[0] for char in "\t\r\n")]
+        text = "market_hash\tpattern\n" + "".join(f"{market_hash}\t{pattern}\n" for market_hash, pattern in rows)
+        lines, count = self._stream(text, fmt="tsv", batch_size=7)
+        self.assertEqual(count, len(rows))
+        self.assertEqual(lines[0], "market_hash\tpattern\trare\tname\trank\ttotal")
+        for line, (market_hash, pattern) in zip(lines[1:], rows):
+            info = check_rare(market_hash, pattern)
+            rank, total = info.order or ("", "")
+            expected = [
+                market_hash, str(pattern), "true" if info.rare else "false", info.name or "", str(rank), str(total),
+            ]
+            self.assertEqual(line.split("\t"), expected)
+
+    def test_only_rare(self):
+        text = "".join(json.dumps({"item": market_hash, "seed": pattern}) + "\n" for market_hash, pattern in ROWS)
+        lines, rows = self._stream(text, fmt="jsonl", hash_column="item", pattern_column="seed", only_rare=True)
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(rows, len(ROWS))
+        self.assertEqual(
+            [(record["item"], record["seed"]) for record in records],
+            [row for row in ROWS if check_rare(*row).rare],
+        )
+        self.assertTrue(all(record["rare"] for record in records))
+
+    def test_malformed_jsonl_lines(self):
+        rare = json.dumps({"market_hash": "AK-47 | Case Hardened (Field-Tested)", "pattern": 661})
+        text = "\n".join([rare, '{"market_hash": "AK-47', "[1, 2]", "42", rare]) + "\n"
+        lines, rows = self._stream(text, fmt="jsonl", batch_size=10)
+        self.assertEqual(rows, 5)
+        self.assertEqual(lines[1:4], ['{"market_hash": "AK-47', "[1, 2]", "42"])
+        self.assertTrue(json.loads(lines[0])["rare"] and json.loads(lines[4])["rare"])
+
+        only_rare, _ = self._stream(text, fmt="jsonl", only_rare=True)
+        self.assertEqual(len(only_rare), 2)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "input.jsonl"
+        path.write_text(text, encoding="utf-8")
+        output = io.BytesIO()
+        self.assertEqual(scan_file(path, output, workers=1).rows, 5)
+        self.assertEqual(output.getvalue().decode("utf-8").splitlines(), lines)
+
+    def test_headerless_csv(self):
+        market_hash, pattern = ROWS[0]
+        lines, _ = self._stream(f"x,{pattern},\"{market_hash}\"\n", header=False, hash_column=2, pattern_column=1)
+        self.assertEqual(lines[0].split(",")[3], "true" if check_rare(market_hash, pattern).rare else "false")
+        with self.assertRaises(ValueError):
+            self._stream("a,1\n", header=False, hash_column="market_hash")
+        with self.assertRaises(ValueError):
+            self._stream("a,1\n", batch_size=0)
+        self.assertEqual(self._stream(""), ([], 0))
+
+    def test_cli(self):
+        text = "market_hash,pattern\n" + "".join(f"\"{market_hash}\",{pattern}\n" for market_hash, pattern in ROWS)
+        result = subprocess.run(
+            [sys.executable, "-m", "cs2pattern", "check", "--only-rare"],
+            cwd=ROOT,
+            input=text,
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            check=True,
+        )
+        lines = result.stdout.splitlines()
+        self.assertEqual(len(lines) - 1, sum(check_rare(*row).rare for row in ROWS))
+        self.assertTrue(all(line.split(",")[-4] == "true" for line in lines[1:]))
+
+    def _spawn(self, *args) -> subprocess.Popen:
+        # Piped stdout has to be block buffered like in a real shell pipeline
+        env = {key: value for key, value in os.environ.items() if key != "PYTHONUNBUFFERED"}
+        process = subprocess.Popen(
+            [sys.executable, "-m", "cs2pattern", "check", *args],
+            cwd=ROOT,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        self.addCleanup(process.kill)
+        self.addCleanup(process.stderr.close)
+        return process
+
+    def test_cli_flushes_every_batch(self):
+        process = self._spawn("--batch-size", "1")
+        process.stdin.write(b"market_hash,pattern\n\"AK-47 | Case Hardened (Field-Tested)\",661\n")
+        process.stdin.flush()
+
+        # The input stays open, the row has to arrive before it ends
+        received = []
+        reader = threading.Thread(target=lambda: received.extend(process.stdout.readline() for _ in range(2)))
+        reader.start()
+        reader.join(30)
+        self.assertFalse(reader.is_alive())
+        self.assertEqual(received[1].decode("utf-8").split(",")[-4], "true")
+
+        process.stdin.close()
+        self.assertEqual(process.wait(30), 0)
+        process.stdout.close()
+
+    def test_cli_errors(self):
+        result = subprocess.run(
+            [sys.executable, "-m", "cs2pattern", "check", "--hash-column", "missing"],
+            cwd=ROOT,
+            input="market_hash,pattern\n",
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+        )
+        self.assertEqual(result.returncode, 1)
+        self.assertIn("error: CSV header has no column 'missing'", result.stderr)
+        self.assertNotIn("usage:", result.stderr)
+
+        # A reader that stops early (like `| head -1`) ends the pipeline normally
+        process = self._spawn("--batch-size", "1")
+        process.stdout.close()
+        try:
+            process.stdin.write(b"market_hash,pattern\n" + b"AK-47 | Case Hardened (Field-Tested),661\n" * 100_000)
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+        self.assertEqual(process.wait(30), 0)
+        self.assertEqual(process.stderr.read(), b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
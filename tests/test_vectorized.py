@@ -0,0 +1,80 @@
+__author__ = "Lukas Mahler"
+__version__ = "1.0.0"
+__date__ = "17.10.2026"
+__email__ = "m@hler.eu"
+__status__ = "Production"
+
+
+import importlib.util
+import unittest
+
+from cs2pattern import check_rare
+from tests.test_pattern import inputs
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy is not installed")
+class TestVectorized(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        import numpy as np
+
+        from cs2pattern import vectorized
+        cls.np = np
+        cls.vectorized = vectorized
+
+    def test_annotate_matches_check_rare(self):
+        names = [args[0] for _, args in inputs]
+        seeds = self.np.asarray([args[1] for _, args in inputs])
+        group_ids, ranks, totals = self.vectorized.annotate(self.vectorized.encode_items(names), seeds)
+
+        for position, (_, args) in enumerate(inputs):
+            with self.subTest(args=args):
+                expected = check_rare(*args)
+                group_id = int(group_ids[position])
+                name = self.vectorized.GROUPS[group_id] if group_id != self.vectorized.NO_GROUP else None
+                self.assertEqual(name, expected.name)
+                rank, total = expected.order or (0, 0)
+                self.assertEqual((int(ranks[position]), int(totals[position])), (rank, total))
+
+    def test_annotate_out_of_range(self):
+        code = self.vectorized.item_code("AK-47 | Case Hardened (Field-Tested)")
+        group_ids, ranks, totals = self.vectorized.annotate(
+            [code, -1, len(self.vectorized.ITEMS), code], [-5, 661, 661, 5000],
+        )
+        self.assertTrue((group_ids == self.vectorized.NO_GROUP).all())
+        self.assertTrue((ranks == 0).all() and (totals == 0).all())
+
+    def test_annotate_broadcast_and_empty(self):
+        code = self.vectorized.item_code("AK-47 | Case Hardened (Field-Tested)")
+        group_ids, ranks, _ = self.vectorized.annotate(code, self.np.arange(1001))
+        self.assertEqual(group_ids.shape, (1001,))
+        self.assertEqual(int(ranks[661]), 1)
+        self.assertEqual(self.vectorized.annotate([], [])[0].size, 0)
+
+    def test_annotate_rejects_float_seeds(self):
+        with self.assertRaises(TypeError):
+            self.vectorized.annotate([0], [1.5])
+
+    def test_tables_follow_catalog_reload(self):
+        from cs2pattern import check
+
+        original = check._get_catalog()
+        self.addCleanup(setattr, check, '_CATALOG', original)
+        pattern_map = {skin: weapons for skin, weapons in original.pattern_map.items() if skin != 'case hardened'}
+        check._CATALOG = check.Catalog(pattern_map, original.icon_map)
+
+        self.assertEqual(self.vectorized.item_code("AK-47 | Case Hardened (Field-Tested)"), -1)
+        self.assertNotIn(('case hardened', 'ak-47'), self.vectorized.ITEMS)
+        check._CATALOG = original
+        self.assertIn(('case hardened', 'ak-47'), self.vectorized.ITEMS)
+
+    def test_unknown_item(self):
+        self.assertEqual(self.vectorized.item_code("AWP | Asiimov (Field-Tested)"), -1)
+        self.assertEqual(self.vectorized.item_code("no separator"), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
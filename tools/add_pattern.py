@@ -2,31 +2,166 @@
 
 __author__ = "Codex"
 __version__ = "1.0.0"
-__date__ = "02.11.2025"
+__date__ = "17.10.2026"
 __email__ = ""
 __status__ = "Development"
 
 
 import argparse
 import ast
+import csv
 import json
+import os
 import re
+import shutil
+import tempfile
 import textwrap
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, NamedTuple, Optional
 
 
 ROOT = Path(__file__).resolve().parents[1]
 PATTERN_FILE = ROOT / "cs2pattern" / "pattern.json"
 ICON_FILE = ROOT / "cs2pattern" / "icons.json"
+CHECK_FILE = ROOT / "cs2pattern" / "check.py"
 MAX_JSON_LINE = 80
 INDENT = "  "
+MANIFEST_FIELDS = ("skin", "name", "weapon", "patterns", "ordered", "overwrite", "helper", "icon")
+_TRUE = ("1", "true", "yes", "y", "x")
+_FALSE = ("", "0", "false", "no", "n")
 
 
 class PatternToolError(Exception):
     """Raised when we cannot perform the requested update."""
 
 
+@dataclass
+class PatternChange:
+    """
+    One pattern group to add or update, as given on the command line or by a manifest entry.
+
+    `spellings` holds the weapon names as they were given, so a Steam spelling such as 'USP-S' can be recorded for
+    the name table. `source` names the origin of the change (e.g. 'manifest.csv:12') and prefixes its error messages.
+    """
+
+    skin: str
+    name: str
+    weapon_patterns: dict[str, list[int]]
+    ordered: bool = False
+    overwrite: bool = False
+    helper: Optional[str] = None
+    icon: Optional[str] = None
+    spellings: list[str] = field(default_factory=list, compare=False)
+    source: str = field(default="", compare=False)
+
+
+class AppliedChange(NamedTuple):
+    change: PatternChange
+    group: str
+    helper_created: Optional[bool]
+    notes: list[str]
+
+
+class _Transaction:
+    """
+    Staged file contents of one tool run.
+
+    While a transaction is active the file helpers below read from and write to it instead of the disk, so every
+    step sees the changes of the previous ones. `pattern.json` and `icons.json` are kept parsed and serialized once
+    on commit.
+    """
+
+    def __init__(self):
+        self.pattern_data: Optional[dict] = None
+        self.icon_map: Optional[dict[str, str]] = None
+        self.files: dict[Path, str] = {}
+        self.dirty: set[Path] = set()
+
+    def render(self) -> dict[Path, str]:
+        contents = {}
+        for path in sorted(self.dirty):
+            if path == PATTERN_FILE:
+                contents[path] = _render_pattern_data(self.pattern_data)
+            elif path == ICON_FILE:
+                contents[path] = _render_icon_map(self.icon_map)
+            else:
+                contents[path] = self.files[path]
+        return contents
+
+    def validate(self) -> None:
+        """
+        Check the staged state before anything is written.
+
+        :raises PatternToolError: If the pattern data is inconsistent or generated code does not compile.
+        """
+
+        if PATTERN_FILE in self.dirty:
+            _validate_pattern_data(self.pattern_data)
+        for path in self.dirty:
+            if path.suffix == ".py":
+                try:
+                    compile(self.files[path], str(path), "exec")
+                except SyntaxError as exc:
+                    raise PatternToolError(f"Updated {path.name} does not compile: {exc}") from exc
+
+    def commit(self) -> list[Path]:
+        """
+        Write every changed file once.
+
+        All contents are written to temporary files next to their targets first, which then replace the targets.
+        A failure while writing leaves every original file untouched.
+
+        :return: The written files.
+        :rtype: list[Path]
+        """
+
+        staged: list[tuple[Path, Path]] = []
+        try:
+            for path, content in self.render().items():
+                handle, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+                staged.append((Path(temp_name), path))
+                with os.fdopen(handle, "w", encoding="utf-8") as stream:
+                    stream.write(content)
+                if path.exists():
+                    shutil.copymode(path, temp_name)
+        except BaseException:
+            for temp, _ in staged:
+                temp.unlink(missing_ok=True)
+            raise
+
+        for temp, path in staged:
+            os.replace(temp, path)
+        return [path for _, path in staged]
+
+
+_TRANSACTION: Optional[_Transaction] = None
+
+
+@contextmanager
+def _transaction(dry_run: bool = False) -> Iterator[_Transaction]:
+    """
+    Stage all file changes made inside the block, then validate them and write each affected file once.
+
+    Nothing is written if the block raises, validation fails or `dry_run` is set.
+    """
+
+    global _TRANSACTION
+    if _TRANSACTION is not None:
+        raise PatternToolError("Another transaction is already active.")
+
+    _TRANSACTION = transaction = _Transaction()
+    try:
+        yield transaction
+    finally:
+        _TRANSACTION = None
+
+    transaction.validate()
+    if not dry_run:
+        transaction.commit()
+
+
 def _parse_weapon_entry(entry: str) -> tuple[str, list[int]]:
     """
     Parse a weapon specification argument.
@@ -83,30 +218,241 @@ def _sanitize_weapon_patterns(raw_patterns: dict[str, list[int]]) -> tuple[dict[
     return sanitized, notes
 
 
+def _weapon_spellings(entries: Iterable[str]) -> list[str]:
+    return [str(entry).split(":", 1)[0].strip() for entry in entries]
+
+
+def _parse_flag(value, field_name: str, source: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower() if value is not None else ""
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise PatternToolError(f"{source}: Invalid value '{value}' for '{field_name}', expected true or false.")
+
+
+def _optional_text(value) -> Optional[str]:
+    text = str(value).strip() if value is not None else ""
+    return text or None
+
+
+def _parse_manifest_weapons(value) -> dict[str, list[int]]:
+    if isinstance(value, dict):
+        specs = [f"{weapon}:{' '.join(str(pattern) for pattern in patterns)}" for weapon, patterns in value.items()]
+    elif isinstance(value, list) and all(isinstance(spec, str) for spec in value):
+        specs = value
+    else:
+        raise PatternToolError(
+            "'weapons' must map weapons to pattern lists or list 'weapon:pattern1 pattern2 ...' entries."
+        )
+
+    weapon_patterns: dict[str, list[int]] = {}
+    for spec in specs:
+        weapon, patterns = _parse_weapon_entry(spec)
+        weapon_patterns.setdefault(weapon, []).extend(patterns)
+    return weapon_patterns
+
+
+def _load_json_manifest(path: Path) -> list[PatternChange]:
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except json.JSONDecodeError as exc:
+        raise PatternToolError(f"Failed to parse manifest {path.name}: {exc}") from exc
+
+    if not isinstance(entries, list):
+        raise PatternToolError(f"Manifest {path.name} must contain a list of pattern groups.")
+
+    changes = []
+    for position, entry in enumerate(entries, start=1):
+        source = f"{path.name}#{position}"
+        if not isinstance(entry, dict):
+            raise PatternToolError(f"{source}: Manifest entries must be objects.")
+        unknown = set(entry) - {"skin", "name", "weapons", "ordered", "overwrite", "helper", "icon"}
+        if unknown:
+            raise PatternToolError(f"{source}: Unknown keys {sorted(unknown)}.")
+
+        skin, name = _optional_text(entry.get("skin")), _optional_text(entry.get("name"))
+        if not skin or not name:
+            raise PatternToolError(f"{source}: 'skin' and 'name' are required.")
+        try:
+            weapon_patterns = _parse_manifest_weapons(entry.get("weapons"))
+        except PatternToolError as exc:
+            raise PatternToolError(f"{source}: {exc}") from exc
+
+        changes.append(PatternChange(
+            skin=skin,
+            name=name,
+            weapon_patterns=weapon_patterns,
+            ordered=_parse_flag(entry.get("ordered"), "ordered", source),
+            overwrite=_parse_flag(entry.get("overwrite"), "overwrite", source),
+            helper=_optional_text(entry.get("helper")),
+            icon=_optional_text(entry.get("icon")),
+            spellings=_weapon_spellings(entry["weapons"]),
+            source=source,
+        ))
+    return changes
+
+
+def _load_csv_manifest(path: Path) -> list[PatternChange]:
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        reader = csv.DictReader(handle)
+        columns = set(reader.fieldnames or ())
+        missing = {"skin", "name", "weapon", "patterns"} - columns
+        if missing:
+            raise PatternToolError(f"Manifest {path.name} is missing the columns {sorted(missing)}.")
+        unknown = columns - set(MANIFEST_FIELDS)
+        if unknown:
+            raise PatternToolError(f"Manifest {path.name} has unknown columns {sorted(unknown)}.")
+
+        # One row per weapon, rows of the same skin and group name form one change. Options are taken from the
+        # first row of a group, later rows may leave them empty but must not contradict them.
+        changes: dict[tuple[str, str], PatternChange] = {}
+        for row in reader:
+            source = f"{path.name}:{reader.line_num}"
+            skin, name = _optional_text(row.get("skin")), _optional_text(row.get("name"))
+            if not skin or not name:
+                raise PatternToolError(f"{source}: 'skin' and 'name' are required.")
+            try:
+                weapon, patterns = _parse_weapon_entry(f"{row.get('weapon') or ''}:{row.get('patterns') or ''}")
+            except PatternToolError as exc:
+                raise PatternToolError(f"{source}: {exc}") from exc
+
+            options = {
+                "ordered": _parse_flag(row.get("ordered"), "ordered", source),
+                "overwrite": _parse_flag(row.get("overwrite"), "overwrite", source),
+                "helper": _optional_text(row.get("helper")),
+                "icon": _optional_text(row.get("icon")),
+            }
+            spellings = _weapon_spellings([row.get("weapon") or ""])
+            change = changes.get((skin.lower(), name))
+            if change is None:
+                changes[skin.lower(), name] = PatternChange(skin, name, {weapon: patterns}, spellings=spellings,
+                                                            source=source, **options)
+                continue
+
+            for option, value in options.items():
+                if _optional_text(row.get(option)) is not None and value != getattr(change, option):
+                    raise PatternToolError(f"{source}: '{option}' differs from {change.source} for group '{name}'.")
+            change.weapon_patterns.setdefault(weapon, []).extend(patterns)
+            change.spellings.extend(spellings)
+
+    return list(changes.values())
+
+
+def load_manifest(path: Path) -> list[PatternChange]:
+    """
+    Read the pattern groups of a bulk import manifest.
+
+    CSV manifests hold one weapon per row with the columns skin, name, weapon, patterns and optionally ordered,
+    overwrite, helper and icon. Rows sharing skin and name form one group. JSON manifests hold a list of objects
+    with the keys skin, name, weapons (a mapping of weapon to pattern ids or a list of 'weapon:pattern1 ...'
+    entries) and optionally ordered, overwrite, helper and icon.
+
+    :param path: Path of a .csv or .json manifest.
+    :type path: Path
+
+    :return: The changes, in manifest order.
+    :rtype: list[PatternChange]
+
+    :raises PatternToolError: If the manifest cannot be read or an entry is invalid.
+    """
+
+    if not path.exists():
+        raise PatternToolError(f"Manifest not found: {path}")
+
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        changes = _load_json_manifest(path)
+    elif suffix == ".csv":
+        changes = _load_csv_manifest(path)
+    else:
+        raise PatternToolError(f"Unsupported manifest format '{path.suffix}', expected .csv or .json.")
+
+    if not changes:
+        raise PatternToolError(f"Manifest {path.name} contains no pattern groups.")
+    return changes
+
+
 def _load_pattern_data() -> dict:
+    if _TRANSACTION is not None and _TRANSACTION.pattern_data is not None:
+        return _TRANSACTION.pattern_data
+
     if not PATTERN_FILE.exists():
         raise PatternToolError(f"Pattern file not found: {PATTERN_FILE}")
 
     with PATTERN_FILE.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+        data = json.load(handle)
+
+    if _TRANSACTION is not None:
+        _TRANSACTION.pattern_data = data
+    return data
+
+
+def _render_pattern_data(data: dict) -> str:
+    return _format_json(data) + "\n"
 
 
 def _write_pattern_data(data: dict) -> None:
-    formatted = _format_json(data)
-    PATTERN_FILE.write_text(formatted + "\n", encoding="utf-8")
+    if _TRANSACTION is not None:
+        _TRANSACTION.pattern_data = data
+        _TRANSACTION.dirty.add(PATTERN_FILE)
+        return
+    PATTERN_FILE.write_text(_render_pattern_data(data), encoding="utf-8")
 
 
 def _load_icon_map() -> dict[str, str]:
-    if ICON_FILE.exists():
-        return json.loads(ICON_FILE.read_text(encoding="utf-8"))
-    return {}
+    if _TRANSACTION is not None and _TRANSACTION.icon_map is not None:
+        return _TRANSACTION.icon_map
+
+    icon_map = json.loads(ICON_FILE.read_text(encoding="utf-8")) if ICON_FILE.exists() else {}
+    if _TRANSACTION is not None:
+        _TRANSACTION.icon_map = icon_map
+    return icon_map
+
+
+def _render_icon_map(icon_map: dict[str, str]) -> str:
+    return json.dumps(dict(sorted(icon_map.items())), ensure_ascii=False, indent=2) + "\n"
 
 
 def _write_icon_map(icon_map: dict[str, str]) -> None:
-    ICON_FILE.write_text(
-        json.dumps(dict(sorted(icon_map.items())), ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    if _TRANSACTION is not None:
+        _TRANSACTION.icon_map = icon_map
+        _TRANSACTION.dirty.add(ICON_FILE)
+        return
+    ICON_FILE.write_text(_render_icon_map(icon_map), encoding="utf-8")
+
+
+def _validate_pattern_data(data: dict) -> None:
+    """
+    Check the structure of pattern data before it is written.
+
+    :raises PatternToolError: On malformed groups, duplicate group names per weapon or invalid pattern ids.
+    """
+
+    for skin, weapons in data.items():
+        for weapon, groups in weapons.items():
+            seen: set[str] = set()
+            for group in groups:
+                name = group.get("name")
+                location = f"'{skin}' / '{weapon}' / '{name}'"
+                if not isinstance(name, str) or not name:
+                    raise PatternToolError(f"Group without a name for '{skin}' / '{weapon}'.")
+                if name in seen:
+                    raise PatternToolError(f"Group {location} is defined more than once.")
+                seen.add(name)
+
+                patterns = group.get("pattern")
+                if not isinstance(patterns, list) or not patterns:
+                    raise PatternToolError(f"Group {location} has no patterns.")
+                if any(isinstance(pattern, bool) or not isinstance(pattern, int) or not 0 <= pattern <= 1000
+                       for pattern in patterns):
+                    raise PatternToolError(f"Group {location} has pattern ids outside the valid range (0-1000).")
+                if len(set(patterns)) != len(patterns):
+                    raise PatternToolError(f"Group {location} has duplicate pattern ids.")
+                if not isinstance(group.get("ordered", False), bool):
+                    raise PatternToolError(f"Group {location} has a non-boolean 'ordered' flag.")
 
 
 def _normalize_pattern_group_name(skin: str, weapons: Iterable[str], current_name: str, canonical_name: str) -> None:
@@ -183,12 +529,18 @@ def _format_int_list(values: list[int], level: int) -> str:
 
 
 def _read_file(path: Path) -> str:
+    if _TRANSACTION is not None and path in _TRANSACTION.files:
+        return _TRANSACTION.files[path]
     return path.read_text(encoding="utf-8")
 
 
 def _write_file(path: Path, content: str) -> None:
     if not content.endswith("\n"):
         content += "\n"
+    if _TRANSACTION is not None:
+        _TRANSACTION.files[path] = content
+        _TRANSACTION.dirty.add(path)
+        return
     path.write_text(content, encoding="utf-8")
 
 
@@ -212,11 +564,12 @@ def _find_helper_block(content: str, helper_name: str) -> tuple[int, int, str]:
     return start, end, content[start:end]
 
 
-def _merge_helper_block(helper_block: str, helper_name: str, skin_key: str, group_name: str,
+def _merge_helper_block(content: str, helper_block: str, helper_name: str, skin_key: str, group_name: str,
                         weapon_patterns: dict[str, list[int]], ordered: bool) -> tuple[str, str, str]:
 
     if "_lookup_first_group" in helper_block:
-        updated, canonical_group = _merge_multi_helper_block(
+        updated, canonical_group = _merge_multi_helper_options(
+            content,
             helper_block,
             helper_name,
             skin_key,
@@ -227,7 +580,7 @@ def _merge_helper_block(helper_block: str, helper_name: str, skin_key: str, grou
         return updated, "multi", canonical_group
 
     if "_lookup_group" in helper_block:
-        updated, canonical_group = _merge_single_helper_block(
+        _, canonical_group = _merge_single_helper_block(
             helper_block,
             helper_name,
             skin_key,
@@ -235,79 +588,69 @@ def _merge_helper_block(helper_block: str, helper_name: str, skin_key: str, grou
             weapon_patterns,
             ordered,
         )
-        return updated, "single", canonical_group
+        return content, "single", canonical_group
 
     raise PatternToolError(
         f"Helper '{helper_name}' exists but cannot be automatically extended. Please adjust it manually."
     )
 
 
-def _merge_multi_helper_block(helper_block: str, helper_name: str, skin_key: str, group_name: str,
-                              weapon_patterns: dict[str, list[int]], ordered: bool) -> tuple[str, str]:
+def _find_helper_skins(content: str) -> tuple[int, int, dict[str, dict[str, tuple[str, ...]]]]:
 
-    lookup_pattern = re.compile(
-        r"return _lookup_first_group\(\s*weapon_normalized,\s*'(?P<group>[^']+)',\s*skins\s*\)"
-    )
-    lookup_match = lookup_pattern.search(helper_block)
-    if not lookup_match:
-        raise PatternToolError(
-            f"Unable to locate lookup call for helper '{helper_name}'. Manual intervention required."
-        )
+    start_match = re.search(r"^_HELPER_SKINS\b[^\n]*= \{\n", content, re.MULTILINE)
+    if not start_match:
+        raise PatternToolError("Unable to locate _HELPER_SKINS in cs2pattern.modular.")
 
-    existing_group = lookup_match.group("group")
-    canonical_group = existing_group
+    end_match = re.compile(r"^\}\n", re.MULTILINE).search(content, start_match.end())
+    if not end_match:
+        raise PatternToolError("Unable to locate the _HELPER_SKINS terminator in cs2pattern.modular.")
 
-    lines = helper_block.splitlines()
-    assign_pattern = re.compile(r"(\s*)([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\{\s*$")
+    literal = "{\n" + content[start_match.end():end_match.end()]
+    try:
+        options = ast.literal_eval(literal)
+    except (SyntaxError, ValueError) as exc:
+        raise PatternToolError("Failed to parse _HELPER_SKINS in cs2pattern.modular.") from exc
 
-    dict_start = dict_end = None
-    indent = ""
-    var_name = ""
+    return start_match.start(), end_match.end(), options
 
-    for index, line in enumerate(lines):
-        match = assign_pattern.match(line)
-        if match:
-            indent = match.group(1)
-            var_name = match.group(2)
-            dict_start = index
-            break
 
-    if dict_start is None:
-        raise PatternToolError(
-            f"Unable to locate mapping dictionary inside helper '{helper_name}'."
-        )
+def _format_helper_skins(options: dict[str, dict[str, tuple[str, ...]]]) -> str:
 
-    closing_prefix = f"{indent}}}"
-    for index in range(dict_start + 1, len(lines)):
-        if lines[index].startswith(closing_prefix):
-            dict_end = index
-            break
+    lines = ["_HELPER_SKINS: dict[str, dict[str, tuple[str, ...]]] = {"]
+    for group in sorted(options):
+        lines.append(f"    '{group}': {{")
+        for weapon in sorted(options[group]):
+            lines.append(f"        '{weapon}': {options[group][weapon]!r},")
+        lines.append("    },")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
 
-    if dict_end is None:
+
+def _merge_multi_helper_options(content: str, helper_block: str, helper_name: str, skin_key: str, group_name: str,
+                                weapon_patterns: dict[str, list[int]], ordered: bool) -> tuple[str, str]:
+
+    lookup_pattern = re.compile(r"return _lookup_first_group\(\s*weapon,\s*'(?P<group>[^']+)',\s*catalog\s*\)")
+    lookup_match = lookup_pattern.search(helper_block)
+    if not lookup_match:
         raise PatternToolError(
-            f"Unable to locate mapping terminator for helper '{helper_name}'."
+            f"Unable to locate lookup call for helper '{helper_name}'. Manual intervention required."
         )
 
-    dict_text = "\n".join(lines[dict_start:dict_end + 1])
+    existing_group = lookup_match.group("group")
+    canonical_group = existing_group
 
-    try:
-        literal_mapping = ast.literal_eval(dict_text.split("=", 1)[1].strip())
-    except (IndexError, SyntaxError, ValueError) as exc:
+    options_start, options_end, options = _find_helper_skins(content)
+    if existing_group not in options:
         raise PatternToolError(
-            f"Failed to parse mapping for helper '{helper_name}'."
-        ) from exc
+            f"Helper '{helper_name}' has no _HELPER_SKINS entry for group '{existing_group}'."
+        )
 
     pattern_data = _load_pattern_data()
     existing_ordered: Optional[bool] = None
 
     mapping: dict[str, tuple[str, ...]] = {}
-    for weapon, skins_value in literal_mapping.items():
-        skins_tuple: tuple[str, ...]
-        if isinstance(skins_value, str):
-            skins_tuple = (skins_value,)
-        else:
-            skins_tuple = tuple(skins_value)
-        normalized_skins = tuple(sorted(set(skins_tuple)))
+    for weapon, skins_value in options[existing_group].items():
+        normalized_skins = tuple(dict.fromkeys((skins_value,) if isinstance(skins_value, str) else skins_value))
         mapping[weapon] = normalized_skins
         if existing_ordered is None:
             for skin_option in normalized_skins:
@@ -325,39 +668,28 @@ def _merge_multi_helper_block(helper_block: str, helper_name: str, skin_key: str
             f"Helper '{helper_name}' uses ordered={existing_ordered}, requested ordered={ordered}."
         )
 
-    updated_mapping: dict[str, tuple[str, ...]] = dict(mapping)
-
     changed = False
     for weapon in weapon_patterns:
-        existing_skins = updated_mapping.get(weapon, ())
+        existing_skins = mapping.get(weapon, ())
         if skin_key in existing_skins:
             continue
-        updated_skins = tuple(sorted(set(existing_skins + (skin_key,))))
-        updated_mapping[weapon] = updated_skins
+        # Skins are tried in order, so new skins go last to keep existing lookups unchanged
+        mapping[weapon] = existing_skins + (skin_key,)
         changed = True
 
     if not changed:
-        return helper_block, canonical_group
+        return content, canonical_group
 
-    reconstructed: list[str] = [f"{indent}{var_name} = {{"]
-    for weapon in sorted(updated_mapping):
-        skins_repr = repr(updated_mapping[weapon])
-        reconstructed.append(f"{indent}    '{weapon}': {skins_repr},")
-    reconstructed.append(f"{indent}}}")
-
-    new_lines = lines[:dict_start] + reconstructed + lines[dict_end + 1:]
-    helper_block_has_trailing_newline = helper_block.endswith("\n")
-    new_block = "\n".join(new_lines)
-    if helper_block_has_trailing_newline:
-        new_block += "\n"
-    return new_block, canonical_group
+    options[existing_group] = mapping
+    updated = content[:options_start] + _format_helper_skins(options) + content[options_end:]
+    return updated, canonical_group
 
 
 def _merge_single_helper_block(helper_block: str, helper_name: str, skin_key: str, group_name: str,
                                weapon_patterns: dict[str, list[int]], ordered: bool) -> tuple[str, str]:
 
     lookup_pattern = re.compile(
-        r"return _lookup_group\(\s*'(?P<skin>[^']+)',\s*'(?P<weapon>[^']+)',\s*'(?P<group>[^']+)'\s*\)"
+        r"return _lookup_group\(\s*'(?P<skin>[^']+)',\s*'(?P<weapon>[^']+)',\s*'(?P<group>[^']+)',\s*catalog\s*\)"
     )
     match = lookup_pattern.search(helper_block)
     if not match:
@@ -378,14 +710,16 @@ def _merge_single_helper_block(helper_block: str, helper_name: str, skin_key: st
 
     if len(weapon_patterns) != 1 or existing_weapon not in weapon_patterns:
         raise PatternToolError(
-            f"Helper '{helper_name}' handles weapon '{existing_weapon}'. Automatic merge for additional weapons is unsupported."
+            f"Helper '{helper_name}' handles weapon '{existing_weapon}'. "
+            "Automatic merge for additional weapons is unsupported."
         )
 
     # Nothing to change for single-weapon helpers, return block unchanged.
     return helper_block, canonical_group
 
 
-def add_pattern(skin: str, group_name: str, weapon_patterns: dict[str, list[int]], ordered: bool, overwrite: bool) -> None:
+def add_pattern(skin: str, group_name: str, weapon_patterns: dict[str, list[int]], ordered: bool,
+                overwrite: bool) -> None:
     """
     Insert or update a pattern group inside pattern.json.
 
@@ -461,7 +795,8 @@ def _update_modular_helper(helper_name: str, skin: str, group_name: str,
 
     helper_start, helper_end, helper_block = _find_helper_block(content, helper_name)
     if helper_start != -1:
-        merged_block, helper_kind, canonical_group = _merge_helper_block(
+        updated_content, helper_kind, canonical_group = _merge_helper_block(
+            content,
             helper_block,
             helper_name=helper_name,
             skin_key=skin_key,
@@ -470,11 +805,8 @@ def _update_modular_helper(helper_name: str, skin: str, group_name: str,
             ordered=ordered,
         )
 
-        if merged_block == helper_block:
-            return helper_kind, False, canonical_group
-
-        updated_content = content[:helper_start] + merged_block + content[helper_end:]
-        _write_file(modular_path, updated_content)
+        if updated_content != content:
+            _write_file(modular_path, updated_content)
         return helper_kind, False, canonical_group
 
     public_defs = [
@@ -498,42 +830,49 @@ def _update_modular_helper(helper_name: str, skin: str, group_name: str,
     if len(weapon_patterns) == 1:
         weapon = next(iter(weapon_patterns.keys()))
         helper_template = f'''
-def {helper_name}() -> tuple[list[int], bool]:
+def {helper_name}(*, catalog: Optional[Catalog] = None) -> tuple[tuple[int, ...], bool]:
     """
     Auto-generated helper for '{skin}' pattern group '{group_name}'.
     """
 
-    return _lookup_group('{skin_key}', '{weapon}', '{group_name}')
+    return _lookup_group('{skin_key}', '{weapon}', '{group_name}', catalog)
 '''
         helper_code = "\n" + textwrap.dedent(helper_template)
     else:
-        mapping_lines = "\n".join(
-            f"        '{weapon}': ('{skin_key}',)," for weapon in weapon_patterns.keys()
-        )
         helper_template = f'''
-def {helper_name}(weapon: str) -> Optional[tuple[list[int], bool]]:
+def {helper_name}(weapon: str, *, catalog: Optional[Catalog] = None) -> Optional[tuple[tuple[int, ...], bool]]:
     """
     Auto-generated helper for '{skin}' pattern group '{group_name}'.
     """
 
-    weapon_options = {
-{mapping_lines}
-    }
+    return _lookup_first_group(weapon, '{group_name}', catalog)
+
+
+def {helper_name}_all(*, catalog: Optional[Catalog] = None) -> Mapping[str, tuple[tuple[int, ...], bool]]:
+    """
+    Auto-generated bulk helper for '{skin}' pattern group '{group_name}'.
+    """
 
-    weapon_normalized = weapon.lower()
-    skins = weapon_options.get(weapon_normalized)
-    if not skins:
-        return None
-    return _lookup_first_group(weapon_normalized, '{group_name}', skins)
+    return _lookup_all_groups('{group_name}', catalog)
 '''
         helper_code = "\n" + textwrap.dedent(helper_template)
 
     updated = content[:insertion_index] + helper_code + content[insertion_index:]
+
+    if helper_kind == "multi":
+        options_start, options_end, options = _find_helper_skins(updated)
+        if group_name in options:
+            raise PatternToolError(
+                f"Group '{group_name}' is already served by another helper in cs2pattern.modular."
+            )
+        options[group_name] = {weapon: (skin_key,) for weapon in weapon_patterns}
+        updated = updated[:options_start] + _format_helper_skins(options) + updated[options_end:]
+
     _write_file(modular_path, updated)
     return helper_kind, True, canonical_group
 
 
-def _update_init(helper_name: str) -> None:
+def _update_init(*helper_names: str) -> None:
     init_path = ROOT / "cs2pattern" / "__init__.py"
     content = _read_file(init_path)
 
@@ -548,16 +887,53 @@ def _update_init(helper_name: str) -> None:
 
     list_text = content[list_start:list_end + 1]
     entries = ast.literal_eval(list_text)
-    if helper_name in entries:
+    if all(name in entries for name in helper_names):
         return
 
-    entries.append(helper_name)
+    entries.extend(helper_names)
     entries = sorted(set(entries))
     new_list = "__all__ = [\n" + "".join(f"    '{entry}',\n" for entry in entries) + "]\n"
     updated = content[:start] + new_list + content[list_end + 2:]
     _write_file(init_path, updated)
 
 
+def _update_display_names(spellings: Iterable[str]) -> None:
+    """
+    Record Steam spellings that title casing gets wrong in `_DISPLAY_NAMES` of cs2pattern.check.
+
+    Names given in lower case carry no spelling and are skipped, as are names `str.title()` already spells right.
+    Existing entries are kept, the first spelling given for a name wins.
+
+    :param spellings: Skin and weapon names as they were given.
+    :type spellings: Iterable[str]
+    """
+
+    overrides = {}
+    for spelling in spellings:
+        spelling = spelling.strip()
+        key = spelling.lower()
+        if spelling not in (key, key.title()):
+            overrides.setdefault(key, spelling)
+    if not overrides:
+        return
+
+    content = _read_file(CHECK_FILE)
+    start = content.find("_DISPLAY_NAMES = {")
+    end = content.find("\n}\n", start)
+    if start == -1 or end == -1:
+        raise PatternToolError("Unable to locate _DISPLAY_NAMES in cs2pattern.check.")
+
+    display_names = ast.literal_eval(content[content.find("{", start):end + 2])
+    if overrides.keys() <= display_names.keys():
+        return
+
+    display_names = {**overrides, **display_names}
+    block = "_DISPLAY_NAMES = {\n" + "".join(
+        f"    {key!r}: {json.dumps(spelling, ensure_ascii=False)},\n" for key, spelling in sorted(display_names.items())
+    ) + "}"
+    _write_file(CHECK_FILE, content[:start] + block + content[end + 2:])
+
+
 def _update_test_import(helper_name: str) -> None:
     test_path = ROOT / "tests" / "test_pattern.py"
     content = _read_file(test_path)
@@ -662,7 +1038,7 @@ def test_{helper_name}_helper(self):
     self.assertIsNone({helper_name}('unsupported'))
 """
     ).strip("\n")
-    method = "\n" + textwrap.indent(method_body, INDENT) + "\n"
+    method = "\n" + textwrap.indent(method_body, "    ") + "\n"
 
     marker = "\n\nif __name__ == '__main__':"
     if marker not in content:
@@ -757,26 +1133,105 @@ def _update_existing_multi_helper_test_cases(content: str, helper_name: str, ski
     return content[:start] + new_block + content[end:]
 
 
+def _apply_change(change: PatternChange) -> AppliedChange:
+    weapon_patterns, notes = _sanitize_weapon_patterns(change.weapon_patterns)
+    canonical_group = change.name
+    helper_created = None
+
+    if change.helper:
+        helper_kind, helper_created, canonical_group = _update_modular_helper(
+            helper_name=change.helper,
+            skin=change.skin,
+            group_name=change.name,
+            weapon_patterns=weapon_patterns,
+            ordered=change.ordered,
+        )
+        if helper_kind == "multi":
+            _update_init(change.helper, f"{change.helper}_all")
+        else:
+            _update_init(change.helper)
+        _update_test_import(change.helper)
+        if helper_kind == "multi":
+            _append_multi_helper_test(
+                change.helper,
+                change.skin,
+                weapon_patterns.keys(),
+                canonical_group,
+            )
+        else:
+            weapon = next(iter(weapon_patterns.keys()))
+            _append_single_helper_test_case(change.helper, change.skin, weapon, canonical_group)
+
+    add_pattern(
+        skin=change.skin,
+        group_name=canonical_group,
+        weapon_patterns=weapon_patterns,
+        ordered=change.ordered,
+        overwrite=change.overwrite,
+    )
+
+    if change.helper:
+        _normalize_pattern_group_name(
+            change.skin,
+            weapon_patterns.keys(),
+            change.name,
+            canonical_group,
+        )
+
+    _update_icon_map(canonical_group, change.icon, change.overwrite)
+    _update_display_names([change.skin, *change.spellings])
+    return AppliedChange(change, canonical_group, helper_created, notes)
+
+
+def apply_changes(changes: Iterable[PatternChange], dry_run: bool = False) -> tuple[list[AppliedChange], list[Path]]:
+    """
+    Apply pattern changes as one transaction.
+
+    Every change is applied in memory on top of the previous ones, then the result is validated and each affected
+    file (pattern.json, icons.json, cs2pattern.modular, cs2pattern.__init__, cs2pattern.check and
+    tests/test_pattern.py) is written once. If any change fails, nothing is written.
+
+    :param changes: Changes in the order to apply them.
+    :type changes: Iterable[PatternChange]
+    :param dry_run: Apply and validate the changes without writing any file.
+    :type dry_run: bool
+
+    :return: The applied changes and the files that were (or, on a dry run, would have been) written.
+    :rtype: tuple[list[AppliedChange], list[Path]]
+
+    :raises PatternToolError: If a change cannot be applied or the result is invalid.
+    """
+
+    applied = []
+    with _transaction(dry_run=dry_run) as transaction:
+        for change in changes:
+            try:
+                applied.append(_apply_change(change))
+            except PatternToolError as exc:
+                if not change.source:
+                    raise
+                raise PatternToolError(f"{change.source}: {exc}") from exc
+    return applied, sorted(transaction.dirty)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Maintenance helper for adding or updating entries inside pattern.json.",
     )
     parser.add_argument(
         "--skin",
-        required=True,
         help="Skin identifier (matches the keys already present inside pattern.json).",
     )
     parser.add_argument(
         "--name",
-        required=True,
         help="Pattern group name to create or update.",
     )
     parser.add_argument(
         "--weapon",
         action="append",
-        required=True,
         help="Weapon + pattern specification. Example: \"ak-47:661 670 955\". "
-             "Repeat for multiple weapons.",
+             "Repeat for multiple weapons. A weapon given in its Steam spelling (e.g. \"USP-S:...\") is recorded "
+             "for the market name table.",
     )
     parser.add_argument(
         "--ordered",
@@ -796,68 +1251,68 @@ def main() -> int:
         "--icon",
         help="Optional icon or emoji to associate with the pattern group inside icons.json.",
     )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="CSV or JSON manifest of pattern groups to import in one transaction, replaces the options above.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Apply and validate the changes without writing any file.",
+    )
 
     args = parser.parse_args()
-    normalization_notes: list[str] = []
+    single_options = (args.skin, args.name, args.weapon, args.ordered, args.overwrite, args.helper, args.icon)
 
-    try:
-        raw_patterns = dict(_parse_weapon_entry(entry) for entry in args.weapon)
-        weapon_patterns, normalization_notes = _sanitize_weapon_patterns(raw_patterns)
-        helper_msg = ""
-        canonical_group = args.name
+    if args.manifest:
+        if any(single_options):
+            parser.error("--manifest cannot be combined with --skin, --name, --weapon, --ordered, --overwrite, "
+                         "--helper or --icon.")
+    else:
+        missing = [flag for flag, value in (("--skin", args.skin), ("--name", args.name), ("--weapon", args.weapon))
+                   if not value]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
 
-        if args.helper:
-            helper_kind, helper_created, canonical_group = _update_modular_helper(
-                helper_name=args.helper,
+    try:
+        if args.manifest:
+            changes = load_manifest(args.manifest)
+        else:
+            changes = [PatternChange(
                 skin=args.skin,
-                group_name=args.name,
-                weapon_patterns=weapon_patterns,
+                name=args.name,
+                weapon_patterns=dict(_parse_weapon_entry(entry) for entry in args.weapon),
                 ordered=args.ordered,
-            )
-            _update_init(args.helper)
-            _update_test_import(args.helper)
-            if helper_kind == "multi":
-                _append_multi_helper_test(
-                    args.helper,
-                    args.skin,
-                    weapon_patterns.keys(),
-                    canonical_group,
-                )
-            else:
-                weapon = next(iter(weapon_patterns.keys()))
-                _append_single_helper_test_case(args.helper, args.skin, weapon, canonical_group)
-
-        add_pattern(
-            skin=args.skin,
-            group_name=canonical_group,
-            weapon_patterns=weapon_patterns,
-            ordered=args.ordered,
-            overwrite=args.overwrite,
-        )
-
-        if args.helper:
-            _normalize_pattern_group_name(
-                args.skin,
-                weapon_patterns.keys(),
-                args.name,
-                canonical_group,
-            )
-            action = "created" if helper_created else "updated"
-            helper_msg = f" Helper '{args.helper}' {action}."
-
-        _update_icon_map(canonical_group, args.icon, args.overwrite)
+                overwrite=args.overwrite,
+                helper=args.helper,
+                icon=args.icon,
+                spellings=_weapon_spellings(args.weapon),
+            )]
+        applied, written = apply_changes(changes, dry_run=args.dry_run)
     except PatternToolError as exc:
         parser.error(str(exc))
     except json.JSONDecodeError as exc:
         parser.error(f"Failed to parse pattern.json: {exc}")
 
-    for note in normalization_notes:
-        print(note)
+    for result in applied:
+        for note in result.notes:
+            print(note)
 
-    icon_msg = f" Icon set to {args.icon}." if args.icon else ""
-    print(
-        f"Pattern group '{canonical_group}' added for skin '{args.skin.lower()}'.{helper_msg}{icon_msg}"
-    )
+        helper_msg = ""
+        if result.change.helper:
+            action = "created" if result.helper_created else "updated"
+            helper_msg = f" Helper '{result.change.helper}' {action}."
+        icon_msg = f" Icon set to {result.change.icon}." if result.change.icon else ""
+        print(
+            f"Pattern group '{result.group}' added for skin '{result.change.skin.lower()}'.{helper_msg}{icon_msg}"
+        )
+
+    files = ", ".join(str(path.relative_to(ROOT)) for path in written) or "none"
+    if args.dry_run:
+        print(f"Dry run, no files written. Would write: {files}.")
+    elif args.manifest:
+        print(f"Imported {len(applied)} pattern groups from {args.manifest.name}. Wrote: {files}.")
     return 0
 
 